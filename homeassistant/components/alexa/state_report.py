@@ -2,13 +2,14 @@
 import asyncio
 import json
 import logging
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
 
 import aiohttp
 import async_timeout
 
 from homeassistant.const import HTTP_ACCEPTED, MATCH_ALL, STATE_ON
 from homeassistant.core import HomeAssistant, State, callback
+from homeassistant.helpers.report_queue import ReportQueue
 from homeassistant.helpers.significant_change import create_checker
 import homeassistant.util.dt as dt_util
 
@@ -18,6 +19,8 @@ from .messages import AlexaResponse
 
 _LOGGER = logging.getLogger(__name__)
 DEFAULT_TIMEOUT = 10
+# Changes of an entity within this time are reported once
+REPORT_STATE_WINDOW = 1
 
 
 async def async_enable_proactive_mode(hass, smart_home_config):
@@ -43,6 +46,28 @@ async def async_enable_proactive_mode(hass, smart_home_config):
 
     checker = await create_checker(hass, DOMAIN, extra_significant_check)
 
+    async def async_send_changereports(
+        pending: Dict[str, Tuple[AlexaEntity, List[dict]]]
+    ) -> None:
+        """Send the ChangeReports of the queued entities."""
+        await asyncio.gather(
+            *(
+                async_send_changereport_message(
+                    hass, smart_home_config, alexa_entity, alexa_properties
+                )
+                for alexa_entity, alexa_properties in pending.values()
+            )
+        )
+
+    # Alexa accepts a single endpoint per ChangeReport, the reports of all
+    # entities that changed within the report window are sent at once
+    queue: ReportQueue[Tuple[AlexaEntity, List[dict]]] = ReportQueue(
+        hass,
+        _LOGGER,
+        window=REPORT_STATE_WINDOW,
+        function=async_send_changereports,
+    )
+
     async def async_entity_state_listener(
         changed_entity: str,
         old_state: Optional[State],
@@ -97,19 +122,25 @@ async def async_enable_proactive_mode(hass, smart_home_config):
             return
 
         if should_report:
-            await async_send_changereport_message(
-                hass, smart_home_config, alexa_changed_entity, alexa_properties
-            )
+            queue.async_queue(changed_entity, (alexa_changed_entity, alexa_properties))
 
         elif should_doorbell:
             await async_send_doorbell_event_message(
                 hass, smart_home_config, alexa_changed_entity
             )
 
-    return hass.helpers.event.async_track_state_change(
+    unsub = hass.helpers.event.async_track_state_change(
         MATCH_ALL, async_entity_state_listener
     )
 
+    @callback
+    def async_disable():
+        """Stop reporting changes."""
+        unsub()
+        queue.async_cancel()
+
+    return async_disable
+
 
 async def async_send_changereport_message(
     hass, config, alexa_entity, alexa_properties, *, invalidate_access_token=True
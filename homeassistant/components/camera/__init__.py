@@ -4,6 +4,7 @@ import base64
 import collections
 from contextlib import suppress
 from datetime import timedelta
+from functools import partial
 import hashlib
 import logging
 import os
@@ -45,6 +46,7 @@ from homeassistant.helpers.entity_component import EntityComponent
 from homeassistant.helpers.network import get_url
 from homeassistant.loader import bind_hass
 
+from .broadcast import async_get_broadcaster
 from .const import (
     CAMERA_IMAGE_TIMEOUT,
     CAMERA_STREAM_SOURCE_TIMEOUT,
@@ -87,6 +89,7 @@ TOKEN_CHANGE_INTERVAL = timedelta(minutes=5)
 _RND = SystemRandom()
 
 MIN_STREAM_INTERVAL = 0.5  # seconds
+MAX_STILL_IMAGE_TTL = 60  # seconds
 
 CAMERA_SERVICE_SCHEMA = vol.Schema({vol.Optional(ATTR_ENTITY_ID): cv.comp_entity_ids})
 
@@ -140,7 +143,7 @@ async def async_get_image(hass, entity_id, timeout=10):
 
     with suppress(asyncio.CancelledError, asyncio.TimeoutError):
         async with async_timeout.timeout(timeout):
-            image = await camera.async_camera_image()
+            image = await _async_get_shared_image(hass, camera)
 
             if image:
                 return Image(camera.content_type, image)
@@ -207,6 +210,12 @@ async def async_get_still_stream(request, image_cb, content_type, interval):
     return response
 
 
+async def _async_get_shared_image(hass, camera):
+    """Fetch a still image through the camera broadcaster."""
+    max_age = hass.data[DATA_CAMERA_PREFS].get(camera.entity_id).still_image_ttl
+    return await async_get_broadcaster(hass, camera).async_camera_image(max_age)
+
+
 def _get_camera_from_entity_id(hass, entity_id):
     """Get camera component from entity_id."""
     component = hass.data.get(DOMAIN)
@@ -383,8 +392,12 @@ class Camera(Entity):
 
     async def handle_async_still_stream(self, request, interval):
         """Generate an HTTP MJPEG stream from camera images."""
+        broadcaster = async_get_broadcaster(self.hass, self)
         return await async_get_still_stream(
-            request, self.async_camera_image, self.content_type, interval
+            request,
+            partial(broadcaster.async_camera_image, interval),
+            self.content_type,
+            interval,
         )
 
     async def handle_async_mjpeg_stream(self, request):
@@ -395,6 +408,15 @@ class Camera(Entity):
         """
         return await self.handle_async_still_stream(request, self.frame_interval)
 
+    async def async_open_mjpeg_stream(self):
+        """Open the upstream MJPEG stream of the camera.
+
+        Camera platforms can override this to return an aiohttp client
+        response that is shared by all viewers of the MJPEG stream.
+        Returning None serves every viewer with handle_async_mjpeg_stream.
+        """
+        return None
+
     @property
     def state(self):
         """Return the camera state."""
@@ -510,7 +532,7 @@ class CameraImageView(CameraView):
         """Serve camera image."""
         with suppress(asyncio.CancelledError, asyncio.TimeoutError):
             async with async_timeout.timeout(CAMERA_IMAGE_TIMEOUT):
-                image = await camera.async_camera_image()
+                image = await _async_get_shared_image(request.app["hass"], camera)
 
             if image:
                 return web.Response(body=image, content_type=camera.content_type)
@@ -528,7 +550,8 @@ class CameraMjpegStream(CameraView):
         """Serve camera stream, possibly with interval."""
         interval = request.query.get("interval")
         if interval is None:
-            return await camera.handle_async_mjpeg_stream(request)
+            broadcaster = async_get_broadcaster(request.app["hass"], camera)
+            return await broadcaster.async_handle_mjpeg_stream(request)
 
         try:
             # Compose camera stream from stills
@@ -608,6 +631,9 @@ async def websocket_get_prefs(hass, connection, msg):
         vol.Required("type"): "camera/update_prefs",
         vol.Required("entity_id"): cv.entity_id,
         vol.Optional("preload_stream"): bool,
+        vol.Optional("still_image_ttl"): vol.All(
+            vol.Coerce(float), vol.Range(min=0, max=MAX_STILL_IMAGE_TTL)
+        ),
     }
 )
 async def websocket_update_prefs(hass, connection, msg):
@@ -0,0 +1,251 @@
+"""Share camera upstream connections between viewers."""
+import asyncio
+import logging
+from typing import Optional, Set
+
+import aiohttp
+from aiohttp import web
+from aiohttp.hdrs import CONTENT_TYPE
+from aiohttp.helpers import parse_mimetype
+import async_timeout
+
+from homeassistant.core import callback
+
+from .const import DATA_CAMERA_BROADCASTERS
+
+# mypy: allow-untyped-calls, allow-untyped-defs
+
+_LOGGER = logging.getLogger(__name__)
+
+BUFFER_SIZE = 102400
+UPSTREAM_CONNECT_TIMEOUT = 10
+UPSTREAM_READ_TIMEOUT = 10
+VIEWER_QUEUE_SIZE = 32
+
+
+@callback
+def async_get_broadcaster(hass, camera):
+    """Return the broadcaster for a camera entity, creating it if needed."""
+    broadcasters = hass.data.setdefault(DATA_CAMERA_BROADCASTERS, {})
+    broadcaster = broadcasters.get(camera.entity_id)
+
+    if broadcaster is None or broadcaster.camera is not camera:
+        broadcaster = broadcasters[camera.entity_id] = CameraBroadcaster(hass, camera)
+
+    return broadcaster
+
+
+class _Viewer:
+    """A downstream client of a shared MJPEG stream."""
+
+    def __init__(self, marker: Optional[bytes]):
+        """Initialize the viewer."""
+        self._marker = marker
+        self.queue: asyncio.Queue = asyncio.Queue(VIEWER_QUEUE_SIZE)
+        self.synced = marker is None
+        self.resyncs = 0
+
+    def _drain(self):
+        """Drop all chunks that have not been sent yet."""
+        while not self.queue.empty():
+            self.queue.get_nowait()
+
+    @callback
+    def feed(self, data: bytes):
+        """Queue a chunk, starting at the next frame boundary if out of sync."""
+        if not self.synced:
+            index = data.find(self._marker)
+            if index == -1:
+                return
+            while index and data[index - 1 : index] == b"-":
+                index -= 1
+            data = data[index:]
+            self.synced = True
+
+        if self.queue.full():
+            # The viewer can't keep up, skip ahead to the next frame
+            self._drain()
+            self.resyncs += 1
+            if self._marker is not None:
+                self.synced = False
+                self.feed(data)
+                return
+
+        self.queue.put_nowait(data)
+
+    @callback
+    def close(self):
+        """Signal the end of the stream."""
+        if self.queue.full():
+            self._drain()
+        self.queue.put_nowait(None)
+
+
+class CameraBroadcaster:
+    """Fan out a camera's upstream stream and stills to all viewers.
+
+    Concurrent still requests share a single fetch and the latest still is
+    reused while it is younger than the requested maximum age. If the camera
+    can open a raw MJPEG stream, one upstream connection is shared by all
+    viewers; it is opened for the first viewer and closed after the last.
+    """
+
+    def __init__(self, hass, camera):
+        """Initialize the broadcaster."""
+        self.hass = hass
+        self.camera = camera
+        self.upstream_sessions = 0
+        self.downstream_sessions = 0
+        self.still_requests = 0
+        self.still_fetches = 0
+        self._image: Optional[bytes] = None
+        self._image_time = 0.0
+        self._image_fetch: Optional[asyncio.Task] = None
+        self._viewers: Set[_Viewer] = set()
+        self._upstream_lock = asyncio.Lock()
+        self._upstream_task: Optional[asyncio.Task] = None
+        self._content_type: Optional[str] = None
+        self._marker: Optional[bytes] = None
+
+    @property
+    def viewers(self) -> int:
+        """Return the number of viewers on the shared upstream stream."""
+        return len(self._viewers)
+
+    async def async_camera_image(self, max_age: float = 0) -> Optional[bytes]:
+        """Return a still image, sharing fetches between concurrent callers."""
+        self.still_requests += 1
+
+        if (
+            self._image is not None
+            and self.hass.loop.time() - self._image_time < max_age
+        ):
+            return self._image
+
+        if self._image_fetch is None:
+            self._image_fetch = self.hass.async_create_task(self._async_fetch_image())
+
+        # A caller timing out must not cancel the fetch for the others
+        return await asyncio.shield(self._image_fetch)
+
+    async def _async_fetch_image(self) -> Optional[bytes]:
+        """Fetch a still image from the camera."""
+        self.still_fetches += 1
+        try:
+            image = await self.camera.async_camera_image()
+        finally:
+            self._image_fetch = None
+
+        if image:
+            self._image = image
+            self._image_time = self.hass.loop.time()
+
+        return image
+
+    async def async_handle_mjpeg_stream(self, request):
+        """Serve the camera MJPEG stream from a shared upstream connection."""
+        viewer = await self._async_add_viewer()
+
+        if viewer is None:
+            return await self.camera.handle_async_mjpeg_stream(request)
+
+        response = web.StreamResponse()
+        if self._content_type is not None:
+            response.content_type = self._content_type
+
+        try:
+            await response.prepare(request)
+
+            while True:
+                data = await viewer.queue.get()
+                if data is None:
+                    break
+                await response.write(data)
+        finally:
+            self._async_remove_viewer(viewer)
+
+        return response
+
+    async def _async_add_viewer(self) -> Optional[_Viewer]:
+        """Register a viewer, opening the upstream stream if needed."""
+        async with self._upstream_lock:
+            if self._upstream_task is None:
+                try:
+                    async with async_timeout.timeout(UPSTREAM_CONNECT_TIMEOUT):
+                        upstream = await self.camera.async_open_mjpeg_stream()
+                except asyncio.TimeoutError as err:
+                    raise web.HTTPGatewayTimeout() from err
+                except aiohttp.ClientError as err:
+                    raise web.HTTPBadGateway() from err
+
+                if upstream is None:
+                    return None
+
+                self.upstream_sessions += 1
+                self._content_type = upstream.headers.get(CONTENT_TYPE)
+                self._marker = _boundary_marker(self._content_type)
+                self._upstream_task = self.hass.async_create_task(
+                    self._async_read_upstream(upstream)
+                )
+
+            viewer = _Viewer(self._marker)
+            self._viewers.add(viewer)
+            self.downstream_sessions += 1
+
+        _LOGGER.debug(
+            "%s: %d viewers sharing the upstream stream",
+            self.camera.entity_id,
+            len(self._viewers),
+        )
+        return viewer
+
+    @callback
+    def _async_remove_viewer(self, viewer: _Viewer):
+        """Unregister a viewer, closing the upstream stream after the last."""
+        self._viewers.discard(viewer)
+
+        if self._viewers or self._upstream_task is None:
+            return
+
+        _LOGGER.debug("%s: closing upstream stream", self.camera.entity_id)
+        self._upstream_task.cancel()
+        self._upstream_task = None
+
+    async def _async_read_upstream(self, upstream: aiohttp.ClientResponse):
+        """Read the upstream stream and feed all viewers."""
+        task = asyncio.current_task()
+        stream = upstream.content
+        try:
+            while True:
+                async with async_timeout.timeout(UPSTREAM_READ_TIMEOUT):
+                    data = await stream.read(BUFFER_SIZE)
+
+                if not data:
+                    break
+
+                for viewer in self._viewers:
+                    viewer.feed(data)
+
+        except (asyncio.TimeoutError, aiohttp.ClientError) as err:
+            _LOGGER.debug("%s: upstream stream failed: %s", self.camera.entity_id, err)
+
+        finally:
+            upstream.close()
+
+            if self._upstream_task is task:
+                self._upstream_task = None
+                for viewer in self._viewers:
+                    viewer.close()
+                self._viewers.clear()
+
+
+def _boundary_marker(content_type: Optional[str]) -> Optional[bytes]:
+    """Return the bytes that start every part of a multipart stream."""
+    if content_type is None:
+        return None
+
+    boundary = parse_mimetype(content_type).parameters.get("boundary")
+    if not boundary:
+        return None
+
+    return boundary.strip('"').lstrip("-").encode()
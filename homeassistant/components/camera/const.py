@@ -2,8 +2,10 @@
 DOMAIN = "camera"
 
 DATA_CAMERA_PREFS = "camera_prefs"
+DATA_CAMERA_BROADCASTERS = "camera_broadcasters"
 
 PREF_PRELOAD_STREAM = "preload_stream"
+PREF_STILL_IMAGE_TTL = "still_image_ttl"
 
 SERVICE_RECORD = "record"
 
@@ -35,10 +35,11 @@ from homeassistant.helpers.event import (
     async_track_utc_time_change,
 )
 from homeassistant.helpers.restore_state import RestoreEntity
+from homeassistant.helpers.singleton import singleton
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.typing import ConfigType, GPSType, HomeAssistantType
 from homeassistant.setup import async_prepare_setup_platform
 from homeassistant.util import dt as dt_util
-from homeassistant.util.yaml import dump
 
 from .const import (
     ATTR_ATTRIBUTES,
@@ -115,6 +116,16 @@ SERVICE_SEE_PAYLOAD_SCHEMA = vol.Schema(
 YAML_DEVICES = "known_devices.yaml"
 EVENT_NEW_DEVICE = "device_tracker_new_device"
 
+DATA_KNOWN_DEVICES = "device_tracker_known_devices"
+STORAGE_KEY = "device_tracker.known_devices"
+STORAGE_VERSION = 1
+SAVE_DELAY = 10
+# The last time a known device was seen is saved at this resolution
+LAST_SEEN_RESOLUTION = timedelta(hours=1)
+# Devices that are not tracked are forgotten when not seen for this long
+UNTRACKED_EXPIRE = timedelta(days=30)
+NOTIFICATION_ID_UNTRACKED = "device_tracker_untracked_devices"
+
 
 def see(
     hass: HomeAssistantType,
@@ -378,6 +389,8 @@ async def get_tracker(hass, config):
         track_new = defaults.get(CONF_TRACK_NEW, DEFAULT_TRACK_NEW)
 
     devices = await async_load_config(yaml_path, hass, consider_home)
+    known_devices = await async_get_known_devices(hass)
+    devices = devices + known_devices.async_get_devices(consider_home, devices)
     tracker = DeviceTracker(hass, consider_home, track_new, defaults, devices)
     return tracker
 
@@ -404,7 +417,6 @@ class DeviceTracker:
             else defaults.get(CONF_TRACK_NEW, DEFAULT_TRACK_NEW)
         )
         self.defaults = defaults
-        self._is_updating = asyncio.Lock()
 
         for dev in devices:
             if self.devices[dev.dev_id] is not dev:
@@ -465,6 +477,7 @@ class DeviceTracker:
         This method is a coroutine.
         """
         registry = await async_get_registry(self.hass)
+        known_devices = await async_get_known_devices(self.hass)
         if mac is None and dev_id is None:
             raise HomeAssistantError("Neither mac or device id passed in")
         if mac is not None:
@@ -487,6 +500,7 @@ class DeviceTracker:
                 source_type,
                 consider_home,
             )
+            known_devices.async_seen(device)
             if device.track:
                 device.async_write_ha_state()
             return
@@ -536,22 +550,16 @@ class DeviceTracker:
             },
         )
 
-        # update known_devices.yaml
-        self.hass.async_create_task(
-            self.async_update_config(
-                self.hass.config.path(YAML_DEVICES), dev_id, device
-            )
-        )
+        # remember the device for the next start
+        self.hass.async_create_task(self.async_store_device(device))
 
-    async def async_update_config(self, path, dev_id, device):
-        """Add device to YAML configuration file.
+    async def async_store_device(self, device):
+        """Add device to the known devices store.
 
         This method is a coroutine.
         """
-        async with self._is_updating:
-            await self.hass.async_add_executor_job(
-                update_config, self.hass.config.path(YAML_DEVICES), dev_id, device
-            )
+        known_devices = await async_get_known_devices(self.hass)
+        known_devices.async_add(device)
 
     @callback
     def async_update_stale(self, now: dt_util.dt.datetime):
@@ -856,20 +864,133 @@ async def async_load_config(
     return result
 
 
-def update_config(path: str, dev_id: str, device: Device):
-    """Add device to YAML configuration file."""
-    with open(path, "a") as out:
-        device = {
-            device.dev_id: {
-                ATTR_NAME: device.name,
-                ATTR_MAC: device.mac,
-                ATTR_ICON: device.icon,
-                "picture": device.config_picture,
-                "track": device.track,
-            }
+@singleton(DATA_KNOWN_DEVICES)
+async def async_get_known_devices(hass: HomeAssistantType) -> "KnownDevices":
+    """Return the loaded known devices store."""
+    known_devices = KnownDevices(hass)
+    await known_devices.async_load()
+    return known_devices
+
+
+class KnownDevices:
+    """Store the devices found by platforms that are not in YAML.
+
+    New devices used to be appended to known_devices.yaml, which grows with
+    every phone of a visitor. They are kept in a store keyed by device ID
+    instead, devices that are not tracked are forgotten when they were not
+    seen for a while. Devices in known_devices.yaml take precedence, a device
+    is configured by adding it there. New devices that are not tracked are
+    listed in a persistent notification with the device ID and MAC to add.
+    """
+
+    def __init__(self, hass: HomeAssistantType) -> None:
+        """Initialize the store."""
+        self.hass = hass
+        self.devices: Dict[str, dict] = {}
+        self._store = Store(hass, STORAGE_VERSION, STORAGE_KEY)
+
+    async def async_load(self) -> None:
+        """Load the devices, forgetting the expired ones."""
+        data = await self._store.async_load()
+        if data is None:
+            return
+
+        expire = dt_util.utcnow() - UNTRACKED_EXPIRE
+        expired = False
+        for device in data["devices"]:
+            last_seen = dt_util.parse_datetime(device["last_seen"])
+            if not device["track"] and last_seen < expire:
+                expired = True
+                continue
+            self.devices[device["dev_id"]] = {**device, "last_seen": last_seen}
+
+        if expired:
+            self._async_schedule_save()
+
+    @callback
+    def async_get_devices(
+        self, consider_home: timedelta, configured: Sequence[Device]
+    ) -> List[Device]:
+        """Return the devices that are not configured in YAML."""
+        dev_ids = {device.dev_id for device in configured}
+        macs = {device.mac for device in configured if device.mac}
+        return [
+            Device(
+                self.hass,
+                consider_home,
+                device["track"],
+                device["dev_id"],
+                device["mac"],
+                device["name"],
+                device["picture"],
+                icon=device["icon"],
+            )
+            for device in self.devices.values()
+            if device["dev_id"] not in dev_ids and device["mac"] not in macs
+        ]
+
+    @callback
+    def async_add(self, device: Device) -> None:
+        """Add a new device."""
+        self.devices[device.dev_id] = {
+            "dev_id": device.dev_id,
+            ATTR_NAME: device.name,
+            ATTR_MAC: device.mac,
+            ATTR_ICON: device.icon,
+            "picture": device.config_picture,
+            "track": device.track,
+            "last_seen": dt_util.utcnow(),
+        }
+        self._async_schedule_save()
+
+        if not device.track:
+            self._async_notify_untracked()
+
+    @callback
+    def _async_notify_untracked(self) -> None:
+        """List the stored devices that are not tracked in a notification."""
+        untracked = "\n".join(
+            f"- `{device['dev_id']}` (MAC: {device[ATTR_MAC] or 'unknown'})"
+            for device in sorted(self.devices.values(), key=lambda dev: dev["dev_id"])
+            if not device["track"]
+        )
+        self.hass.components.persistent_notification.async_create(
+            f"Devices were found that are not tracked. To track one, add it to "
+            f"{YAML_DEVICES} with `track: true`. Devices that are not tracked "
+            f"are forgotten when they were not seen for "
+            f"{UNTRACKED_EXPIRE.days} days.\n\n{untracked}",
+            title="New devices found",
+            notification_id=NOTIFICATION_ID_UNTRACKED,
+        )
+
+    @callback
+    def async_seen(self, device: Device) -> None:
+        """Update when a stored device was last seen."""
+        stored = self.devices.get(device.dev_id)
+        if stored is None:
+            return
+
+        now = dt_util.utcnow()
+        if now - stored["last_seen"] < LAST_SEEN_RESOLUTION:
+            return
+
+        stored["last_seen"] = now
+        self._async_schedule_save()
+
+    @callback
+    def _async_schedule_save(self) -> None:
+        """Schedule saving the devices."""
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> dict:
+        """Return the data of the devices to store."""
+        return {
+            "devices": [
+                {**device, "last_seen": device["last_seen"].isoformat()}
+                for device in self.devices.values()
+            ]
         }
-        out.write("\n")
-        out.write(dump(device))
 
 
 def get_gravatar_for_email(email: str):
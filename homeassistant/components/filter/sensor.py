@@ -2,7 +2,6 @@
 from collections import Counter, deque
 from copy import copy
 from datetime import timedelta
-from functools import partial
 import logging
 from numbers import Number
 import statistics
@@ -10,9 +9,9 @@ from typing import Optional
 
 import voluptuous as vol
 
-from homeassistant.components import history
 from homeassistant.components.binary_sensor import DOMAIN as BINARY_SENSOR_DOMAIN
 from homeassistant.components.input_number import DOMAIN as INPUT_NUMBER_DOMAIN
+from homeassistant.components.recorder import preload
 from homeassistant.components.sensor import (
     DEVICE_CLASSES as SENSOR_DEVICE_CLASSES,
     DOMAIN as SENSOR_DOMAIN,
@@ -278,34 +277,28 @@ class SensorFilter(Entity):
 
             # Retrieve the largest window_size of each type
             if largest_window_items > 0:
-                filter_history = await self.hass.async_add_executor_job(
-                    partial(
-                        history.get_last_state_changes,
+                history_list.extend(
+                    await preload.async_load_history(
                         self.hass,
-                        largest_window_items,
-                        entity_id=self._entity,
+                        self._entity,
+                        number_of_states=largest_window_items,
+                        changes_only=True,
                     )
                 )
-                if self._entity in filter_history:
-                    history_list.extend(filter_history[self._entity])
             if largest_window_time > timedelta(seconds=0):
                 start = dt_util.utcnow() - largest_window_time
-                filter_history = await self.hass.async_add_executor_job(
-                    partial(
-                        history.state_changes_during_period,
-                        self.hass,
-                        start,
-                        entity_id=self._entity,
-                    )
+                # The state in effect at the start of the window is replayed
+                # as well, as state_changes_during_period always did.
+                filter_history = await preload.async_load_history(
+                    self.hass,
+                    self._entity,
+                    start_time=start,
+                    changes_only=True,
+                    include_start_state=True,
+                )
+                history_list.extend(
+                    [state for state in filter_history if state not in history_list]
                 )
-                if self._entity in filter_history:
-                    history_list.extend(
-                        [
-                            state
-                            for state in filter_history[self._entity]
-                            if state not in history_list
-                        ]
-                    )
 
             # Sort the window states
             history_list = sorted(history_list, key=lambda s: s.last_updated)
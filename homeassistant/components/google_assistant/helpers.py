@@ -14,12 +14,17 @@ from homeassistant.const import (
     ATTR_SUPPORTED_FEATURES,
     CLOUD_NEVER_EXPOSED_ENTITIES,
     CONF_NAME,
+    EVENT_CORE_CONFIG_UPDATE,
+    EVENT_STATE_CHANGED,
     STATE_UNAVAILABLE,
 )
-from homeassistant.core import Context, HomeAssistant, State, callback
+from homeassistant.core import Context, Event, HomeAssistant, State, callback
 from homeassistant.helpers.area_registry import AreaEntry
 from homeassistant.helpers.device_registry import DeviceEntry
-from homeassistant.helpers.entity_registry import RegistryEntry
+from homeassistant.helpers.entity_registry import (
+    EVENT_ENTITY_REGISTRY_UPDATED,
+    RegistryEntry,
+)
 from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.network import get_url
 from homeassistant.helpers.storage import Store
@@ -86,6 +91,12 @@ async def _get_device_info(device_entry) -> Optional[Dict[str, str]]:
     return device_info
 
 
+@callback
+def _async_entity_removed_filter(event: Event) -> bool:
+    """Filter state changes of removed entities."""
+    return event.data["new_state"] is None
+
+
 class AbstractConfig(ABC):
     """Hold the configuration for Google Assistant."""
 
@@ -97,12 +108,26 @@ class AbstractConfig(ABC):
         self._store = None
         self._google_sync_unsub = {}
         self._local_sdk_active = False
+        self._serialize_cache: Dict[str, Tuple[State, Optional[dict], dict]] = {}
 
     async def async_initialize(self):
         """Perform async initialization of config."""
         self._store = GoogleConfigStore(self.hass)
         await self._store.async_load()
 
+        self.hass.bus.async_listen(
+            EVENT_STATE_CHANGED,
+            self._async_handle_entity_removed,
+            _async_entity_removed_filter,
+        )
+        self.hass.bus.async_listen(
+            EVENT_ENTITY_REGISTRY_UPDATED, self._async_handle_entity_registry_updated
+        )
+        # Temperatures are serialized in the unit of the configuration
+        self.hass.bus.async_listen(
+            EVENT_CORE_CONFIG_UPDATE, self._async_handle_core_config_updated
+        )
+
     @property
     def enabled(self):
         """Return if Google is enabled."""
@@ -296,6 +321,36 @@ class AbstractConfig(ABC):
 
         return json_response(result)
 
+    @callback
+    def async_get_serialize_cache(self, state: State) -> dict:
+        """Return the cached serialized data of a state.
+
+        The data is dropped when the state object or the entity config of the
+        entity changes.
+        """
+        entity_config = self.entity_config.get(state.entity_id)
+        entry = self._serialize_cache.get(state.entity_id)
+        if entry is None or entry[0] is not state or entry[1] is not entity_config:
+            entry = self._serialize_cache[state.entity_id] = (state, entity_config, {})
+        return entry[2]
+
+    @callback
+    def _async_handle_entity_removed(self, event: Event):
+        """Drop the serialized data of a removed entity."""
+        self._serialize_cache.pop(event.data["entity_id"], None)
+
+    @callback
+    def _async_handle_entity_registry_updated(self, event: Event):
+        """Drop the serialized data of an updated registry entry."""
+        self._serialize_cache.pop(event.data["entity_id"], None)
+        if "old_entity_id" in event.data:
+            self._serialize_cache.pop(event.data["old_entity_id"], None)
+
+    @callback
+    def _async_handle_core_config_updated(self, event: Event):
+        """Drop all serialized data."""
+        self._serialize_cache.clear()
+
 
 class GoogleConfigStore:
     """A configuration store for google assistant."""
@@ -466,6 +521,7 @@ class GoogleEntity:
         )
 
         traits = self.traits()
+        cache = self.config.async_get_serialize_cache(state)
 
         device_type = get_google_type(domain, device_class)
 
@@ -494,8 +550,11 @@ class GoogleEntity:
                 "proxyDeviceId": agent_user_id,
             }
 
-        for trt in traits:
-            device["attributes"].update(trt.sync_attributes())
+        if "sync_attributes" not in cache:
+            attributes = cache["sync_attributes"] = {}
+            for trt in traits:
+                attributes.update(trt.sync_attributes())
+        device["attributes"].update(cache["sync_attributes"])
 
         room = entity_config.get(CONF_ROOM_HINT)
         if room:
@@ -522,11 +581,16 @@ class GoogleEntity:
         if state.state == STATE_UNAVAILABLE:
             return {"online": False}
 
+        cache = self.config.async_get_serialize_cache(state)
+        if "query" in cache:
+            return cache["query"]
+
         attrs = {"online": True}
 
         for trt in self.traits():
             deep_update(attrs, trt.query_attributes())
 
+        cache["query"] = attrs
         return attrs
 
     @callback
@@ -1,9 +1,11 @@
 """Google Report State implementation."""
 import logging
+from typing import Dict
 
 from homeassistant.const import MATCH_ALL
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.report_queue import ReportQueue
 from homeassistant.helpers.significant_change import create_checker
 
 from .const import DOMAIN
@@ -13,7 +15,8 @@ from .helpers import AbstractConfig, GoogleEntity, async_get_entities
 # Time to wait until the homegraph updates
 # https://github.com/actions-on-google/smart-home-nodejs/issues/196#issuecomment-439156639
 INITIAL_REPORT_DELAY = 60
-
+# States changing within this time are reported together
+REPORT_STATE_WINDOW = 1
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -23,6 +26,16 @@ def async_enable_report_state(hass: HomeAssistant, google_config: AbstractConfig
     """Enable state reporting."""
     checker = None
 
+    async def async_report_states(states: Dict[str, dict]) -> None:
+        """Report the queued states in one request."""
+        await google_config.async_report_state_all({"devices": {"states": states}})
+
+    # A scene turning on many lights changes all of them at about the same
+    # time, their states are sent together
+    queue: ReportQueue[dict] = ReportQueue(
+        hass, _LOGGER, window=REPORT_STATE_WINDOW, function=async_report_states
+    )
+
     async def async_entity_state_listener(changed_entity, old_state, new_state):
         if not hass.is_running:
             return
@@ -47,11 +60,9 @@ def async_enable_report_state(hass: HomeAssistant, google_config: AbstractConfig
         if not checker.async_is_significant_change(new_state, extra_arg=entity_data):
             return
 
-        _LOGGER.debug("Reporting state for %s: %s", changed_entity, entity_data)
+        _LOGGER.debug("Queueing state for %s: %s", changed_entity, entity_data)
 
-        await google_config.async_report_state_all(
-            {"devices": {"states": {changed_entity: entity_data}}}
-        )
+        queue.async_queue(changed_entity, entity_data)
 
     @callback
     def extra_significant_check(
@@ -69,7 +80,7 @@ def async_enable_report_state(hass: HomeAssistant, google_config: AbstractConfig
     async def inital_report(_now):
         """Report initially all states."""
         nonlocal unsub, checker
-        entities = {}
+        changes = []
 
         checker = await create_checker(hass, DOMAIN, extra_significant_check)
 
@@ -82,14 +93,17 @@ def async_enable_report_state(hass: HomeAssistant, google_config: AbstractConfig
             except SmartHomeError:
                 continue
 
-            # Tell our significant change checker that we're reporting
-            # So it knows with subsequent changes what was already reported.
-            if not checker.async_is_significant_change(
-                entity.state, extra_arg=entity_data
-            ):
-                continue
+            changes.append((entity.state, entity_data))
 
-            entities[entity.entity_id] = entity_data
+        # Tell our significant change checker that we're reporting
+        # So it knows with subsequent changes what was already reported.
+        entities = {
+            state.entity_id: entity_data
+            for (state, entity_data), significant in zip(
+                changes, checker.async_check_significant_changes(changes)
+            )
+            if significant
+        }
 
         if not entities:
             return
@@ -102,5 +116,10 @@ def async_enable_report_state(hass: HomeAssistant, google_config: AbstractConfig
 
     unsub = async_call_later(hass, INITIAL_REPORT_DELAY, inital_report)
 
-    # pylint: disable=unnecessary-lambda
-    return lambda: unsub()
+    @callback
+    def async_disable():
+        """Stop reporting states."""
+        unsub()
+        queue.async_cancel()
+
+    return async_disable
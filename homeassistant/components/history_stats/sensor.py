@@ -1,11 +1,12 @@
 """Component to make instant statistics about your history."""
+from collections import deque
 import datetime
 import logging
 import math
 
 import voluptuous as vol
 
-from homeassistant.components import history
+from homeassistant.components.recorder import preload
 from homeassistant.components.sensor import PLATFORM_SCHEMA
 from homeassistant.const import (
     CONF_ENTITY_ID,
@@ -121,6 +122,9 @@ class HistoryStatsSensor(Entity):
         self._period = (datetime.datetime.now(), datetime.datetime.now())
         self.value = None
         self.count = None
+        self._changes = HistoryStatsChanges()
+        # Changes of the entity seen since the last update
+        self._live_changes = deque()
 
     async def async_added_to_hass(self):
         """Create listeners when the entity is added."""
@@ -134,10 +138,23 @@ class HistoryStatsSensor(Entity):
                 """Force the component to refresh."""
                 self.async_schedule_update_ha_state(True)
 
+            @callback
+            def state_changed(event):
+                """Record the change and refresh."""
+                new_state = event.data.get("new_state")
+                if new_state is not None:
+                    self._live_changes.append(
+                        (
+                            new_state.last_changed.timestamp(),
+                            new_state.state in self._entity_states,
+                        )
+                    )
+                force_refresh()
+
             force_refresh()
             self.async_on_remove(
                 async_track_state_change_event(
-                    self.hass, [self._entity_id], force_refresh
+                    self.hass, [self._entity_id], state_changed
                 )
             )
 
@@ -187,7 +204,7 @@ class HistoryStatsSensor(Entity):
         """Return the icon to use in the frontend, if any."""
         return ICON
 
-    def update(self):
+    async def async_update(self):
         """Get the latest data and updates the states."""
         # Get previous values of start and end
         p_start, p_end = self._period
@@ -217,40 +234,53 @@ class HistoryStatsSensor(Entity):
             and end_timestamp <= now_timestamp
         ):
             # Don't compute anything as the value cannot have changed
+            if self._live_changes:
+                # Changes after the end are not tracked, reload if it moves
+                self._live_changes.clear()
+                self._changes.start = None
             return
 
-        # Get history between start and end
-        history_list = history.state_changes_during_period(
-            self.hass, start, end, str(self._entity_id)
-        )
-
-        if self._entity_id not in history_list:
-            return
+        changes = self._changes
+        end_time = dt_util.as_timestamp(end)
 
-        # Get the first state
-        last_state = history.get_state(self.hass, start, self._entity_id)
-        last_state = last_state is not None and last_state in self._entity_states
-        last_time = start_timestamp
-        elapsed = 0
-        count = 0
+        if (
+            changes.start is None
+            or start_timestamp < changes.start
+            or end_time < changes.last_time
+        ):
+            # Get history between start and end, starting with the state at start
+            states = await preload.async_load_history(
+                self.hass,
+                self._entity_id,
+                start_time=start,
+                end_time=end,
+                changes_only=True,
+                include_start_state=True,
+            )
 
-        # Make calculations
-        for item in history_list.get(self._entity_id):
-            current_state = item.state in self._entity_states
-            current_time = item.last_changed.timestamp()
+            if not states:
+                return
 
-            if last_state:
-                elapsed += current_time - last_time
-            if current_state and not last_state:
-                count += 1
+            changes.load(
+                start_timestamp,
+                (
+                    (item.last_changed.timestamp(), item.state in self._entity_states)
+                    for item in states
+                ),
+            )
+        else:
+            # Period moved forward, forget what happened before its start
+            changes.trim(start_timestamp)
 
-            last_state = current_state
-            last_time = current_time
+        # Add the changes seen since the history was loaded
+        live_changes = self._live_changes
+        while live_changes and live_changes[0][0] <= end_time:
+            change_time, matches = live_changes.popleft()
+            if change_time > changes.last_time:
+                changes.add(change_time, matches)
 
-        # Count time elapsed between last history state and end of measure
-        if last_state:
-            measure_end = min(end_timestamp, now_timestamp)
-            elapsed += measure_end - last_time
+        # Count time elapsed between last state change and end of measure
+        elapsed, count = changes.measure(min(end_timestamp, now_timestamp))
 
         # Save value in hours
         self.value = elapsed / 3600
@@ -266,7 +296,7 @@ class HistoryStatsSensor(Entity):
         # Parse start
         if self._start is not None:
             try:
-                start_rendered = self._start.render()
+                start_rendered = self._start.async_render()
             except (TemplateError, TypeError) as ex:
                 HistoryStatsHelper.handle_template_exception(ex, "start")
                 return
@@ -286,7 +316,7 @@ class HistoryStatsSensor(Entity):
         # Parse end
         if self._end is not None:
             try:
-                end_rendered = self._end.render()
+                end_rendered = self._end.async_render()
             except (TemplateError, TypeError) as ex:
                 HistoryStatsHelper.handle_template_exception(ex, "end")
                 return
@@ -319,6 +349,84 @@ class HistoryStatsSensor(Entity):
         self._period = start, end
 
 
+class HistoryStatsChanges:
+    """Changes of the entity in and out of the tracked states in a period.
+
+    Elapsed time and count are kept up to date while changes are added and
+    while the start of the period moves forward, so the history of a period
+    is only loaded from the recorder once. Being in a tracked state at the
+    start of the period is a change at the start and counts.
+    """
+
+    def __init__(self):
+        """Initialize without a loaded period."""
+        self.start = None
+        self.changes = deque()
+        self.elapsed = 0.0
+        self.count = 0
+
+    @property
+    def last_time(self):
+        """Return the time of the last change."""
+        return self.changes[-1][0] if self.changes else self.start
+
+    @property
+    def last_matches(self):
+        """Return if the entity is in a tracked state since the last change."""
+        return self.changes[-1][1] if self.changes else False
+
+    def load(self, start, changes):
+        """Replace the period with the loaded history."""
+        self.start = start
+        self.changes = deque()
+        self.elapsed = 0.0
+        self.count = 0
+
+        for change_time, matches in changes:
+            self.add(max(change_time, start), matches)
+
+    def add(self, change_time, matches):
+        """Add a change that happened after the last one."""
+        last_matches = self.last_matches
+        if matches == last_matches:
+            return
+
+        if last_matches:
+            self.elapsed += change_time - self.last_time
+        else:
+            self.count += 1
+        self.changes.append((change_time, matches))
+
+    def trim(self, start):
+        """Move the start of the period forward."""
+        if start <= self.start:
+            return
+
+        matches = False
+        while self.changes and self.changes[0][0] <= start:
+            change_time, matches = self.changes.popleft()
+            if not matches:
+                continue
+
+            self.count -= 1
+            if self.changes:
+                # Forget the part of the tracked time before the start
+                self.elapsed -= min(self.changes[0][0], start) - change_time
+
+        if matches:
+            # Same as loading the period, the state at the start counts
+            self.changes.appendleft((start, True))
+            self.count += 1
+        self.start = start
+
+    def measure(self, end):
+        """Return the elapsed seconds and count until the end of the period."""
+        elapsed = self.elapsed
+        if self.last_matches:
+            elapsed += end - self.last_time
+        return elapsed, self.count
+
+
 class HistoryStatsHelper:
     """Static methods to make the HistoryStatsSensor code lighter."""
 
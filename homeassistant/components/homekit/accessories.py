@@ -1,9 +1,11 @@
 """Extend the basic Accessory and Bridge functions."""
+import json
 import logging
+import threading
 
-from pyhap.accessory import Accessory, Bridge
+from pyhap.accessory import Accessory, Bridge, get_topic
 from pyhap.accessory_driver import AccessoryDriver
-from pyhap.const import CATEGORY_OTHER
+from pyhap.const import CATEGORY_OTHER, HAP_REPR_AID, HAP_REPR_CHARS, HAP_REPR_IID
 
 from homeassistant.components import cover
 from homeassistant.components.cover import (
@@ -497,6 +499,7 @@ class HomeDriver(AccessoryDriver):
         self._entry_id = entry_id
         self._bridge_name = bridge_name
         self._entry_title = entry_title
+        self._pending_events = []
 
     def pair(self, client_uuid, client_public):
         """Override super function to dismiss setup message if paired."""
@@ -505,6 +508,62 @@ class HomeDriver(AccessoryDriver):
             dismiss_setup_message(self.hass, self._entry_id)
         return success
 
+    def publish(self, data, sender_client_addr=None):
+        """Override super function to send the events of a loop iteration together.
+
+        When a scene changes many entities, every changed characteristic used
+        to be sent to every controller in a message of its own.
+        """
+        topic = get_topic(data[HAP_REPR_AID], data[HAP_REPR_IID])
+        if topic not in self.topics:
+            return
+
+        if threading.current_thread() == self.tid:
+            self.async_queue_event(topic, data, sender_client_addr)
+            return
+
+        self.loop.call_soon_threadsafe(
+            self.async_queue_event, topic, data, sender_client_addr
+        )
+
+    @ha_callback
+    def async_queue_event(self, topic, data, sender_client_addr):
+        """Queue an event to send at the end of the loop iteration."""
+        if not self._pending_events:
+            self.loop.call_soon(self._async_send_events)
+        self._pending_events.append((topic, data, sender_client_addr))
+
+    @ha_callback
+    def _async_send_events(self):
+        """Send the queued events in one message per controller."""
+        pending, self._pending_events = self._pending_events, []
+        if self.aio_stop_event.is_set():
+            return
+
+        client_chars = {}
+        client_topics = {}
+        for topic, data, sender_client_addr in pending:
+            for client_addr in self.topics.get(topic, ()):
+                # The controller that made the change already knows it
+                if client_addr == sender_client_addr:
+                    continue
+                client_chars.setdefault(client_addr, []).append(data)
+                client_topics.setdefault(client_addr, set()).add(topic)
+
+        _LOGGER.debug(
+            "Sending %d events to %d controllers", len(pending), len(client_chars)
+        )
+        for client_addr, chars in client_chars.items():
+            bytedata = json.dumps({HAP_REPR_CHARS: chars}).encode()
+            if self.http_server.push_event(bytedata, client_addr):
+                continue
+
+            _LOGGER.debug(
+                "Could not send event to %s, probably stale socket", client_addr
+            )
+            for topic in client_topics[client_addr]:
+                self.async_subscribe_client_topic(client_addr, topic, False)
+
     def unpair(self, client_uuid):
         """Override super function to show setup message if unpaired."""
         super().unpair(client_uuid)
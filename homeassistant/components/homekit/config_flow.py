@@ -1,4 +1,5 @@
 """Config flow for HomeKit integration."""
+from collections import Counter
 import random
 import re
 import string
@@ -39,6 +40,7 @@ from .const import (
     HOMEKIT_MODE_ACCESSORY,
     HOMEKIT_MODE_BRIDGE,
     HOMEKIT_MODES,
+    MAX_DEVICES,
     SHORT_BRIDGE_NAME,
     VIDEO_CODEC_COPY,
 )
@@ -143,12 +145,13 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             port = await async_find_next_available_port(
                 self.hass, DEFAULT_CONFIG_FLOW_PORT
             )
-            await self._async_add_entries_for_accessory_mode_entities(port)
+            last_port = await self._async_add_entries_for_accessory_mode_entities(port)
             self.hk_data[CONF_PORT] = port
             include_domains_filter = self.hk_data[CONF_FILTER][CONF_INCLUDE_DOMAINS]
             for domain in NEVER_BRIDGED_DOMAINS:
                 if domain in include_domains_filter:
                     include_domains_filter.remove(domain)
+            await self._async_add_entries_for_bridge_shards(last_port)
             return self.async_create_entry(
                 title=f"{self.hk_data[CONF_NAME]}:{self.hk_data[CONF_PORT]}",
                 data=self.hk_data,
@@ -182,6 +185,53 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     data={CONF_ENTITY_ID: entity_id, CONF_PORT: port},
                 )
             )
+        return next_port_to_check - 1
+
+    async def _async_add_entries_for_bridge_shards(self, last_assigned_port):
+        """Generate new flows for domains that do not fit on the bridge."""
+        entity_filter = self.hk_data[CONF_FILTER]
+        shards = _async_shard_domains(
+            self.hass,
+            entity_filter[CONF_INCLUDE_DOMAINS],
+            _async_get_entity_ids_for_accessory_mode(
+                self.hass, entity_filter[CONF_INCLUDE_DOMAINS]
+            ),
+        )
+        if len(shards) < 2:
+            return
+
+        entity_filter[CONF_INCLUDE_DOMAINS] = shards[0]
+        next_port_to_check = last_assigned_port + 1
+        for idx, domains in enumerate(shards[1:], 2):
+            port = await async_find_next_available_port(self.hass, next_port_to_check)
+            next_port_to_check = port + 1
+            self.hass.async_create_task(
+                self.hass.config_entries.flow.async_init(
+                    DOMAIN,
+                    context={"source": "bridge_shard"},
+                    data={
+                        CONF_NAME: f"{self.hk_data[CONF_NAME]} {idx}",
+                        CONF_DOMAINS: domains,
+                        CONF_PORT: port,
+                    },
+                )
+            )
+
+    async def async_step_bridge_shard(self, shard_input):
+        """Handle creation of a bridge for domains that do not fit on another."""
+        name = self._async_available_name(shard_input[CONF_NAME])
+        port = shard_input[CONF_PORT]
+        entity_filter = _EMPTY_ENTITY_FILTER.copy()
+        entity_filter[CONF_INCLUDE_DOMAINS] = shard_input[CONF_DOMAINS]
+
+        entry_data = {
+            CONF_PORT: port,
+            CONF_NAME: name,
+            CONF_HOMEKIT_MODE: HOMEKIT_MODE_BRIDGE,
+            CONF_EXCLUDE_ACCESSORY_MODE: True,
+            CONF_FILTER: entity_filter,
+        }
+        return self.async_create_entry(title=f"{name}:{port}", data=entry_data)
 
     async def async_step_accessory(self, accessory_input):
         """Handle creation a single accessory in accessory mode."""
@@ -486,6 +536,37 @@ def _async_get_entity_ids_for_accessory_mode(hass, include_domains):
     ]
 
 
+@callback
+def _async_shard_domains(hass, include_domains, accessory_mode_entity_ids):
+    """Split domains over as few bridges as their entities fit on.
+
+    A domain with more entities than a bridge can hold gets a bridge of its
+    own, the bridge will skip the entities over the limit.
+    """
+    excluded = set(accessory_mode_entity_ids)
+    counts = Counter(
+        state.domain
+        for state in hass.states.async_all(include_domains)
+        if state.entity_id not in excluded
+    )
+    # The bridge itself counts as an accessory
+    capacity = MAX_DEVICES - 1
+    shards = []
+    sizes = []
+
+    for domain in sorted(include_domains, key=lambda domain: -counts[domain]):
+        for idx, size in enumerate(sizes):
+            if size + counts[domain] <= capacity:
+                shards[idx].append(domain)
+                sizes[idx] += counts[domain]
+                break
+        else:
+            shards.append([domain])
+            sizes.append(counts[domain])
+
+    return shards
+
+
 @callback
 def _async_entity_ids_with_accessory_mode(hass):
     """Return a set of entity ids that have config entries in accessory mode."""
@@ -12,6 +12,8 @@ HOMEKIT = "homekit"
 UNDO_UPDATE_LISTENER = "undo_update_listener"
 SHUTDOWN_TIMEOUT = 30
 CONF_ENTRY_INDEX = "index"
+# Accessories of a bridge, the bridge itself included
+MAX_DEVICES = 150
 
 # ### Codecs ####
 VIDEO_CODEC_COPY = "copy"
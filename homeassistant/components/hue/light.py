@@ -1,4 +1,5 @@
 """Support for the Philips Hue lights."""
+import asyncio
 from datetime import timedelta
 from functools import partial
 import logging
@@ -26,8 +27,10 @@ from homeassistant.components.light import (
     SUPPORT_TRANSITION,
     LightEntity,
 )
+from homeassistant.const import SERVICE_TURN_OFF
 from homeassistant.core import callback
 from homeassistant.exceptions import PlatformNotReady
+from homeassistant.helpers import entity_platform
 from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.update_coordinator import (
     CoordinatorEntity,
@@ -205,6 +208,10 @@ async def async_setup_entry(hass, config_entry, async_add_entities):
     _setup_rooms_listener()
     await group_coordinator.async_refresh()
 
+    entity_platform.current_platform.get().async_register_batch_service_handler(
+        SERVICE_TURN_OFF, partial(async_turn_off_lights, bridge)
+    )
+
     update_lights_with_group_support = partial(
         async_update_items,
         bridge,
@@ -233,6 +240,77 @@ async def async_safe_fetch(bridge, fetch_method):
         raise UpdateFailed(f"Hue error: {err}") from err
 
 
+async def async_turn_off_lights(bridge, entities, call):
+    """Turn off lights with as few group commands as possible.
+
+    Hue groups of which all lights are targeted are turned off with a single
+    command. Returns the entities that are not covered by such a group.
+    """
+    lights = {
+        entity.light.id: entity
+        for entity in entities
+        if isinstance(entity, HueLight) and not entity.is_group
+    }
+    remaining = [entity for entity in entities if entity not in lights.values()]
+    groups = sorted(
+        (bridge.api.groups[group_id] for group_id in bridge.api.groups),
+        key=lambda group: len(group.lights),
+        reverse=True,
+    )
+    commands = []
+    coordinators = set()
+
+    for group in groups:
+        if len(group.lights) < 2 or not lights.keys() >= set(group.lights):
+            continue
+
+        group_lights = [lights.pop(light_id) for light_id in group.lights]
+        command = turn_off_command(
+            call.data, any(light.is_innr for light in group_lights)
+        )
+        commands.append(bridge.async_request_call(partial(group.set_action, **command)))
+        coordinators.update(light.coordinator for light in group_lights)
+
+    if not commands:
+        return entities
+
+    # Targeted Hue groups show the state of the lights that were turned off
+    coordinators.update(
+        entity.coordinator
+        for entity in remaining
+        if isinstance(entity, HueLight) and entity.is_group
+    )
+
+    _LOGGER.debug("Turning off %d lights with %d groups", len(entities), len(commands))
+    await asyncio.gather(*commands)
+    await asyncio.gather(
+        *(coordinator.async_request_refresh() for coordinator in coordinators)
+    )
+
+    return remaining + list(lights.values())
+
+
+def turn_off_command(kwargs, is_innr):
+    """Return the command to turn off a light or group."""
+    command = {"on": False}
+
+    if ATTR_TRANSITION in kwargs:
+        command["transitiontime"] = int(kwargs[ATTR_TRANSITION] * 10)
+
+    flash = kwargs.get(ATTR_FLASH)
+
+    if flash == FLASH_LONG:
+        command["alert"] = "lselect"
+        del command["on"]
+    elif flash == FLASH_SHORT:
+        command["alert"] = "select"
+        del command["on"]
+    elif not is_innr:
+        command["alert"] = "none"
+
+    return command
+
+
 @callback
 def async_update_items(
     bridge, api, current, async_add_entities, create_item, new_items_callback
@@ -507,21 +585,7 @@ class HueLight(CoordinatorEntity, LightEntity):
 
     async def async_turn_off(self, **kwargs):
         """Turn the specified or all lights off."""
-        command = {"on": False}
-
-        if ATTR_TRANSITION in kwargs:
-            command["transitiontime"] = int(kwargs[ATTR_TRANSITION] * 10)
-
-        flash = kwargs.get(ATTR_FLASH)
-
-        if flash == FLASH_LONG:
-            command["alert"] = "lselect"
-            del command["on"]
-        elif flash == FLASH_SHORT:
-            command["alert"] = "select"
-            del command["on"]
-        elif not self.is_innr:
-            command["alert"] = "none"
+        command = turn_off_command(kwargs, self.is_innr)
 
         if self.is_group:
             await self.bridge.async_request_call(
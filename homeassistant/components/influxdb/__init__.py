@@ -1,13 +1,16 @@
 """Support for sending data to an Influx database."""
+from contextlib import suppress
 from dataclasses import dataclass
 import logging
 import math
+import os
 import queue
 import threading
 import time
 from typing import Any, Callable, Dict, List
 
 from influxdb import InfluxDBClient, exceptions
+from influxdb.line_protocol import make_lines
 from influxdb_client import InfluxDBClient as InfluxDBClientV2
 from influxdb_client.client.write_api import ASYNCHRONOUS, SYNCHRONOUS
 from influxdb_client.rest import ApiException
@@ -61,6 +64,8 @@ from .const import (
     CONF_PORT,
     CONF_PRECISION,
     CONF_RETRY_COUNT,
+    CONF_SPOOL,
+    CONF_SPOOL_MAX_EVENTS,
     CONF_SSL,
     CONF_SSL_CA_CERT,
     CONF_TAGS,
@@ -68,12 +73,16 @@ from .const import (
     CONF_TOKEN,
     CONF_USERNAME,
     CONF_VERIFY_SSL,
+    CONF_WRITE_WORKERS,
     CONNECTION_ERROR,
     DEFAULT_API_VERSION,
     DEFAULT_HOST_V2,
     DEFAULT_MEASUREMENT_ATTR,
+    DEFAULT_SPOOL_MAX_EVENTS,
     DEFAULT_SSL_V2,
+    DEFAULT_WRITE_WORKERS,
     DOMAIN,
+    ENCODE_ERROR,
     EVENT_NEW_STATE,
     INFLUX_CONF_FIELDS,
     INFLUX_CONF_MEASUREMENT,
@@ -82,14 +91,22 @@ from .const import (
     INFLUX_CONF_TAGS,
     INFLUX_CONF_TIME,
     INFLUX_CONF_VALUE,
+    LINE_PROTOCOL_PRECISION,
+    MAX_WRITE_WORKERS,
     QUERY_ERROR,
     QUEUE_BACKLOG_SECONDS,
     RE_DECIMAL,
     RE_DIGIT_TAIL,
+    REPLAYED_MESSAGE,
     RESUMED_MESSAGE,
+    RESUMED_SPOOLED_MESSAGE,
     RETRY_DELAY,
     RETRY_INTERVAL,
     RETRY_MESSAGE,
+    SPOOL_FILE,
+    SPOOL_FULL_MESSAGE,
+    SPOOL_REPLAY_BATCH_SIZE,
+    SPOOLED_MESSAGE,
     TEST_QUERY_V1,
     TEST_QUERY_V2,
     TIMEOUT,
@@ -157,6 +174,13 @@ _CUSTOMIZE_ENTITY_SCHEMA = vol.Schema(
 _INFLUX_BASE_SCHEMA = INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA.extend(
     {
         vol.Optional(CONF_RETRY_COUNT, default=0): cv.positive_int,
+        vol.Optional(CONF_SPOOL, default=False): cv.boolean,
+        vol.Optional(
+            CONF_SPOOL_MAX_EVENTS, default=DEFAULT_SPOOL_MAX_EVENTS
+        ): cv.positive_int,
+        vol.Optional(CONF_WRITE_WORKERS, default=DEFAULT_WRITE_WORKERS): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=MAX_WRITE_WORKERS)
+        ),
         vol.Optional(CONF_DEFAULT_MEASUREMENT): cv.string,
         vol.Optional(CONF_MEASUREMENT_ATTR, default=DEFAULT_MEASUREMENT_ATTR): vol.In(
             ["unit_of_measurement", "domain__device_class", "entity_id"]
@@ -345,9 +369,9 @@ def get_influx_connection(conf, test_write=False, test_read=False):
         initial_write_mode = SYNCHRONOUS if test_write else ASYNCHRONOUS
         write_api = influx.write_api(write_options=initial_write_mode)
 
-        def write_v2(json):
-            """Write data to V2 influx."""
-            data = {"bucket": bucket, "record": json}
+        def write_v2(lines):
+            """Write line protocol data to V2 influx."""
+            data = {"bucket": bucket, "record": lines}
 
             if precision is not None:
                 data["write_precision"] = precision
@@ -358,7 +382,7 @@ def get_influx_connection(conf, test_write=False, test_read=False):
                 raise ConnectionError(CONNECTION_ERROR % exc) from exc
             except ApiException as exc:
                 if exc.status == CODE_INVALID_INPUTS:
-                    raise ValueError(WRITE_ERROR % (json, exc)) from exc
+                    raise ValueError(WRITE_ERROR % (lines, exc)) from exc
                 raise ConnectionError(CLIENT_ERROR_V2 % exc) from exc
 
         def query_v2(query, _=None):
@@ -424,10 +448,10 @@ def get_influx_connection(conf, test_write=False, test_read=False):
 
     influx = InfluxDBClient(**kwargs)
 
-    def write_v1(json):
-        """Write data to V1 influx."""
+    def write_v1(lines):
+        """Write line protocol data to V1 influx."""
         try:
-            influx.write_points(json, time_precision=precision)
+            influx.write_points(lines, time_precision=precision, protocol="line")
         except (
             requests.exceptions.RequestException,
             exceptions.InfluxDBServerError,
@@ -436,7 +460,7 @@ def get_influx_connection(conf, test_write=False, test_read=False):
             raise ConnectionError(CONNECTION_ERROR % exc) from exc
         except exceptions.InfluxDBClientError as exc:
             if exc.code == CODE_INVALID_INPUTS:
-                raise ValueError(WRITE_ERROR % (json, exc)) from exc
+                raise ValueError(WRITE_ERROR % (lines, exc)) from exc
             raise ConnectionError(CLIENT_ERROR_V1 % exc) from exc
 
     def query_v1(query, database=None):
@@ -480,7 +504,18 @@ def setup(hass, config):
 
     event_to_json = _generate_event_to_json(conf)
     max_tries = conf.get(CONF_RETRY_COUNT)
-    instance = hass.data[DOMAIN] = InfluxThread(hass, influx, event_to_json, max_tries)
+    spool = None
+    if conf[CONF_SPOOL]:
+        spool = InfluxSpool(hass.config.path(SPOOL_FILE), conf[CONF_SPOOL_MAX_EVENTS])
+    instance = hass.data[DOMAIN] = InfluxThread(
+        hass,
+        influx,
+        event_to_json,
+        max_tries,
+        precision=conf.get(CONF_PRECISION),
+        spool=spool,
+        write_workers=conf[CONF_WRITE_WORKERS],
+    )
     instance.start()
 
     def shutdown(event):
@@ -494,18 +529,111 @@ def setup(hass, config):
     return True
 
 
+class InfluxSpool:
+    """Durable on-disk spool for events that could not be written yet.
+
+    Events are stored as line protocol, one per line, so they can be
+    replayed without encoding them again. Replays are at-least-once;
+    rewriting a point with the same series and timestamp is idempotent
+    in InfluxDB.
+    """
+
+    def __init__(self, path, max_events):
+        """Initialize the spool and recover an interrupted replay."""
+        self.path = path
+        self.replay_path = f"{path}.replay"
+        self.max_events = max_events
+        self._lock = threading.Lock()
+        self._replaying = False
+        self._count = len(self._read(self.path))
+
+        if os.path.exists(self.replay_path):
+            self.put(self._read(self.replay_path))
+            os.remove(self.replay_path)
+
+    def __len__(self):
+        """Return the number of spooled events."""
+        return self._count
+
+    @staticmethod
+    def _read(path):
+        """Read the lines of a spool file."""
+        if not os.path.exists(path):
+            return []
+        with open(path, encoding="utf-8") as fil:
+            return [line for line in fil.read().splitlines() if line]
+
+    def put(self, lines):
+        """Append lines to the spool and return how many were stored."""
+        with self._lock:
+            room = max(self.max_events - self._count, 0)
+            if len(lines) > room:
+                _LOGGER.warning(SPOOL_FULL_MESSAGE, len(lines) - room)
+                lines = lines[:room]
+
+            if not lines:
+                return 0
+
+            with open(self.path, "a", encoding="utf-8") as fil:
+                fil.write("\n".join(lines) + "\n")
+                fil.flush()
+                os.fsync(fil.fileno())
+
+            self._count += len(lines)
+            return len(lines)
+
+    def take(self):
+        """Move the spooled lines aside for replay and return them."""
+        with self._lock:
+            if self._replaying or not self._count:
+                return []
+            os.replace(self.path, self.replay_path)
+            self._replaying = True
+            self._count = 0
+
+        return self._read(self.replay_path)
+
+    def replay_done(self):
+        """Remove the replay file once its lines are written or spooled again."""
+        with self._lock:
+            with suppress(FileNotFoundError):
+                os.remove(self.replay_path)
+            self._replaying = False
+
+
 class InfluxThread(threading.Thread):
     """A threaded event handler class."""
 
-    def __init__(self, hass, influx, event_to_json, max_tries):
+    def __init__(
+        self,
+        hass,
+        influx,
+        event_to_json,
+        max_tries,
+        precision=None,
+        spool=None,
+        write_workers=DEFAULT_WRITE_WORKERS,
+    ):
         """Initialize the listener."""
         threading.Thread.__init__(self, name=DOMAIN)
         self.queue = queue.Queue()
+        self.batches = queue.Queue(maxsize=write_workers)
         self.influx = influx
         self.event_to_json = event_to_json
         self.max_tries = max_tries
+        self.precision = precision
+        self.line_precision = LINE_PROTOCOL_PRECISION.get(precision, precision)
+        self.spool = spool
+        self.workers = [
+            threading.Thread(target=self._write_worker, name=f"{DOMAIN}_writer_{idx}")
+            for idx in range(write_workers)
+        ]
+        # Events lost since the last successful write
         self.write_errors = 0
+        # Events spooled since the last successful write
+        self.spooled = 0
         self.shutdown = False
+        self._lock = threading.Lock()
         hass.bus.listen(EVENT_STATE_CHANGED, self._event_listener)
 
     @callback
@@ -519,33 +647,58 @@ class InfluxThread(threading.Thread):
         """Return number of seconds to wait for more events."""
         return BATCH_TIMEOUT
 
-    def get_events_json(self):
-        """Return a batch of events formatted for writing."""
+    def json_to_line(self, json):
+        """Encode one event to line protocol, None if it can't be encoded."""
+        try:
+            return make_lines({"points": [json]}, self.line_precision).rstrip("\n")
+        except (ValueError, TypeError) as err:
+            _LOGGER.error(ENCODE_ERROR, json, err)
+            return None
+
+    def get_events_lines(self):
+        """Return a batch of events encoded as line protocol for writing."""
         queue_seconds = QUEUE_BACKLOG_SECONDS + self.max_tries * RETRY_DELAY
 
         count = 0
-        json = []
+        lines = []
+        backlog = []
+        oldest = None
 
         dropped = 0
 
         try:
-            while len(json) < BATCH_BUFFER_SIZE and not self.shutdown:
+            while len(lines) < BATCH_BUFFER_SIZE and not self.shutdown:
                 timeout = None if count == 0 else self.batch_timeout()
                 item = self.queue.get(timeout=timeout)
                 count += 1
 
                 if item is None:
                     self.shutdown = True
-                else:
-                    timestamp, event = item
-                    age = time.monotonic() - timestamp
+                    continue
 
-                    if age < queue_seconds:
-                        event_json = self.event_to_json(event)
-                        if event_json:
-                            json.append(event_json)
-                    else:
-                        dropped += 1
+                timestamp, event = item
+                age = time.monotonic() - timestamp
+
+                if age >= queue_seconds and self.spool is None:
+                    dropped += 1
+                    continue
+
+                event_json = self.event_to_json(event)
+                if not event_json:
+                    continue
+
+                line = self.json_to_line(event_json)
+                if line is None:
+                    continue
+
+                if age < queue_seconds:
+                    lines.append(line)
+                    if oldest is None:
+                        oldest = timestamp
+                else:
+                    # Keep the writers on live data and replay
+                    # the backlog from disk once caught up
+                    backlog.append(line)
 
         except queue.Empty:
             pass
@@ -553,39 +706,114 @@ class InfluxThread(threading.Thread):
         if dropped:
             _LOGGER.warning(CATCHING_UP_MESSAGE, dropped)
 
-        return count, json
+        if backlog:
+            self._spool_lines(backlog)
 
-    def write_to_influxdb(self, json):
-        """Write preprocessed events to influxdb, with retry."""
-        for retry in range(self.max_tries + 1):
-            try:
-                self.influx.write(json)
+        return count, lines, oldest
 
-                if self.write_errors:
-                    _LOGGER.error(RESUMED_MESSAGE, self.write_errors)
-                    self.write_errors = 0
+    def _spool_lines(self, lines):
+        """Store lines in the spool so they are written later.
 
-                _LOGGER.debug(WROTE_MESSAGE, len(json))
-                break
+        Lines that don't fit in the spool are lost, the number of stored
+        lines is returned.
+        """
+        stored = self.spool.put(lines)
+        if stored:
+            _LOGGER.debug(SPOOLED_MESSAGE, stored)
+        if stored < len(lines):
+            with self._lock:
+                self.write_errors += len(lines) - stored
+        return stored
+
+    def write_to_influxdb(self, lines, oldest=None, spool=True):
+        """Write line protocol events to influxdb, with retry.
+
+        Events that can't be written are spooled when the spool is enabled,
+        unless spool is False because the caller handles them.
+        """
+        for retry in range(self.max_tries + 1):
+            try:
+                self.influx.write(lines)
+
+                with self._lock:
+                    if self.write_errors:
+                        _LOGGER.error(RESUMED_MESSAGE, self.write_errors)
+                        self.write_errors = 0
+                    if self.spooled:
+                        _LOGGER.warning(RESUMED_SPOOLED_MESSAGE, self.spooled)
+                        self.spooled = 0
+
+                if oldest is not None:
+                    _LOGGER.debug(WROTE_MESSAGE, len(lines), time.monotonic() - oldest)
+                return True
             except ValueError as err:
                 _LOGGER.error(err)
-                break
+                return True
             except ConnectionError as err:
                 if retry < self.max_tries:
                     time.sleep(RETRY_DELAY)
-                else:
-                    if not self.write_errors:
+                    continue
+
+                with self._lock:
+                    if not self.write_errors and not self.spooled:
                         _LOGGER.error(err)
-                    self.write_errors += len(json)
+
+                if self.spool is None:
+                    with self._lock:
+                        self.write_errors += len(lines)
+                elif spool:
+                    stored = self._spool_lines(lines)
+                    with self._lock:
+                        self.spooled += stored
+        return False
+
+    def replay_spool(self):
+        """Write spooled events once influxdb accepts writes again."""
+        lines = self.spool.take()
+        if not lines:
+            return
+
+        written = 0
+        for start in range(0, len(lines), SPOOL_REPLAY_BATCH_SIZE):
+            batch = lines[start : start + SPOOL_REPLAY_BATCH_SIZE]
+            if not self.write_to_influxdb(batch, spool=False):
+                # Spool the failed batch and the rest again, without counting
+                # them as newly spooled
+                self._spool_lines(lines[start:])
+                break
+            written += len(batch)
+
+        self.spool.replay_done()
+
+        if written:
+            _LOGGER.info(REPLAYED_MESSAGE, written)
+
+    def _write_worker(self):
+        """Write batches handed over by the event thread."""
+        while True:
+            batch = self.batches.get()
+
+            if batch is None:
+                return
+
+            count, lines, oldest = batch
+            if lines and self.write_to_influxdb(lines, oldest) and self.spool:
+                self.replay_spool()
+            for _ in range(count):
+                self.queue.task_done()
 
     def run(self):
         """Process incoming events."""
+        for worker in self.workers:
+            worker.start()
+
         while not self.shutdown:
-            count, json = self.get_events_json()
-            if json:
-                self.write_to_influxdb(json)
-            for _ in range(count):
-                self.queue.task_done()
+            self.batches.put(self.get_events_lines())
+
+        for _ in self.workers:
+            self.batches.put(None)
+        for worker in self.workers:
+            worker.join()
 
     def block_till_done(self):
         """Block till all events processed."""
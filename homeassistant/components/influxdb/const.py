@@ -32,6 +32,9 @@ CONF_RETRY_COUNT = "max_retries"
 CONF_IGNORE_ATTRIBUTES = "ignore_attributes"
 CONF_PRECISION = "precision"
 CONF_SSL_CA_CERT = "ssl_ca_cert"
+CONF_SPOOL = "spool"
+CONF_SPOOL_MAX_EVENTS = "spool_max_events"
+CONF_WRITE_WORKERS = "write_workers"
 
 CONF_LANGUAGE = "language"
 CONF_QUERIES = "queries"
@@ -59,6 +62,9 @@ DEFAULT_RANGE_START = "-15m"
 DEFAULT_RANGE_STOP = "now()"
 DEFAULT_FUNCTION_FLUX = "|> limit(n: 1)"
 DEFAULT_MEASUREMENT_ATTR = "unit_of_measurement"
+DEFAULT_SPOOL_MAX_EVENTS = 100000
+DEFAULT_WRITE_WORKERS = 1
+MAX_WRITE_WORKERS = 8
 
 INFLUX_CONF_MEASUREMENT = "measurement"
 INFLUX_CONF_TAGS = "tags"
@@ -78,6 +84,10 @@ QUEUE_BACKLOG_SECONDS = 30
 RETRY_INTERVAL = 60  # seconds
 BATCH_TIMEOUT = 1
 BATCH_BUFFER_SIZE = 100
+SPOOL_FILE = ".influxdb.spool"
+SPOOL_REPLAY_BATCH_SIZE = 5000
+# Line protocol names of the precisions that differ from the config
+LINE_PROTOCOL_PRECISION = {"us": "u", "ns": "n"}
 LANGUAGE_INFLUXQL = "influxQL"
 LANGUAGE_FLUX = "flux"
 TEST_QUERY_V1 = "SHOW DATABASES;"
@@ -113,13 +123,18 @@ NO_DATABASE_ERROR = (
     "Check the name is correct and the user has access to it."
 )
 WRITE_ERROR = "Could not write '%s' to influx due to '%s'."
+ENCODE_ERROR = "Could not encode '%s' to line protocol due to '%s'."
 QUERY_ERROR = (
     "Could not execute query '%s' due to '%s'. Check the syntax of your query."
 )
 RETRY_MESSAGE = f"%s Retrying in {RETRY_INTERVAL} seconds."
 CATCHING_UP_MESSAGE = "Catching up, dropped %d old events."
 RESUMED_MESSAGE = "Resumed, lost %d events."
-WROTE_MESSAGE = "Wrote %d events."
+RESUMED_SPOOLED_MESSAGE = "Resumed, replaying %d events spooled while unreachable."
+WROTE_MESSAGE = "Wrote %d events, oldest was %.3f seconds old."
+SPOOLED_MESSAGE = "Spooled %d events to disk until InfluxDB is reachable again."
+SPOOL_FULL_MESSAGE = "Spool is full, dropped %d events."
+REPLAYED_MESSAGE = "Replayed %d spooled events."
 RUNNING_QUERY_MESSAGE = "Running query: %s."
 QUERY_NO_RESULTS_MESSAGE = "Query returned no results, sensor state set to UNKNOWN: %s."
 QUERY_MULTIPLE_RESULTS_MESSAGE = (
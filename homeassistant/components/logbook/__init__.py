@@ -433,7 +433,7 @@ def _get_events(
     if entity_ids is not None:
         entities_filter = generate_filter([], entity_ids, [], [])
 
-    with session_scope(hass=hass) as session:
+    with session_scope(hass=hass, read_only=True) as session:
         old_state = aliased(States, name="old_state")
 
         if entity_ids is not None:
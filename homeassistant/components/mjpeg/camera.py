@@ -161,6 +161,15 @@ class MjpegCamera(Camera):
 
         return await async_aiohttp_proxy_web(self.hass, request, stream_coro)
 
+    async def async_open_mjpeg_stream(self):
+        """Open the MJPEG stream so it can be shared between viewers."""
+        # aiohttp don't support DigestAuth -> Fallback
+        if self._authentication == HTTP_DIGEST_AUTHENTICATION:
+            return None
+
+        websession = async_get_clientsession(self.hass, verify_ssl=self._verify_ssl)
+        return await websession.get(self._mjpeg_url, auth=self._auth)
+
     @property
     def name(self):
         """Return the name of this camera."""
@@ -34,6 +34,7 @@ from homeassistant.const import (
 )
 from homeassistant.helpers import entityfilter, state as state_helper
 import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.entity_registry import EVENT_ENTITY_REGISTRY_UPDATED
 from homeassistant.helpers.entity_values import EntityValues
 from homeassistant.util.temperature import fahrenheit_to_celsius
 
@@ -104,6 +105,9 @@ def setup(hass, config):
     )
 
     hass.bus.listen(EVENT_STATE_CHANGED, metrics.handle_event)
+    hass.bus.listen(
+        EVENT_ENTITY_REGISTRY_UPDATED, metrics.handle_entity_registry_updated
+    )
     return True
 
 
@@ -140,11 +144,17 @@ class PrometheusMetrics:
             self.metrics_prefix = ""
         self._metrics = {}
         self._climate_units = climate_units
+        # Resolved per domain and per entity so state changes
+        # do not repeat the lookups for every update
+        self._domain_handlers = {}
+        self._entity_labels = {}
+        self._entity_sensor_metric = {}
 
     def handle_event(self, event):
         """Listen for new messages on the bus, and add them to Prometheus."""
         state = event.data.get("new_state")
         if state is None:
+            self._forget_entity(event.data.get("entity_id"))
             return
 
         entity_id = state.entity_id
@@ -154,10 +164,15 @@ class PrometheusMetrics:
         if not self._filter(state.entity_id):
             return
 
-        handler = f"_handle_{domain}"
+        try:
+            handler = self._domain_handlers[domain]
+        except KeyError:
+            handler = self._domain_handlers[domain] = getattr(
+                self, f"_handle_{domain}", None
+            )
 
-        if hasattr(self, handler) and state.state != STATE_UNAVAILABLE:
-            getattr(self, handler)(state)
+        if handler is not None and state.state != STATE_UNAVAILABLE:
+            handler(state)
 
         labels = self._labels(state)
         state_change = self._metric(
@@ -179,6 +194,17 @@ class PrometheusMetrics:
         )
         last_updated_time_seconds.labels(**labels).set(state.last_updated.timestamp())
 
+    def handle_entity_registry_updated(self, event):
+        """Forget the cached data of removed and renamed entities."""
+        if event.data["action"] == "remove":
+            self._forget_entity(event.data["entity_id"])
+        elif event.data["action"] == "update" and "old_entity_id" in event.data:
+            self._forget_entity(event.data["old_entity_id"])
+
+    def _forget_entity(self, entity_id):
+        self._entity_labels.pop(entity_id, None)
+        self._entity_sensor_metric.pop(entity_id, None)
+
     def _handle_attributes(self, state):
         for key, value in state.attributes.items():
             metric = self._metric(
@@ -194,13 +220,12 @@ class PrometheusMetrics:
                 pass
 
     def _metric(self, metric, factory, documentation, extra_labels=None):
-        labels = ["entity", "friendly_name", "domain"]
-        if extra_labels is not None:
-            labels.extend(extra_labels)
-
         try:
             return self._metrics[metric]
         except KeyError:
+            labels = ["entity", "friendly_name", "domain"]
+            if extra_labels is not None:
+                labels.extend(extra_labels)
             full_metric_name = self._sanitize_metric_name(
                 f"{self.metrics_prefix}{metric}"
             )
@@ -231,13 +256,16 @@ class PrometheusMetrics:
             value = 0
         return value
 
-    @staticmethod
-    def _labels(state):
-        return {
-            "entity": state.entity_id,
-            "domain": state.domain,
-            "friendly_name": state.attributes.get(ATTR_FRIENDLY_NAME),
-        }
+    def _labels(self, state):
+        friendly_name = state.attributes.get(ATTR_FRIENDLY_NAME)
+        labels = self._entity_labels.get(state.entity_id)
+        if labels is None or labels["friendly_name"] != friendly_name:
+            labels = self._entity_labels[state.entity_id] = {
+                "entity": state.entity_id,
+                "domain": state.domain,
+                "friendly_name": friendly_name,
+            }
+        return labels
 
     def _battery(self, state):
         if "battery_level" in state.attributes:
@@ -380,12 +408,7 @@ class PrometheusMetrics:
                 )
 
     def _handle_sensor(self, state):
-        unit = self._unit_string(state.attributes.get(ATTR_UNIT_OF_MEASUREMENT))
-
-        for metric_handler in self._sensor_metric_handlers:
-            metric = metric_handler(state, unit)
-            if metric is not None:
-                break
+        unit, metric = self._sensor_metric(state)
 
         if metric is not None:
             _metric = self._metric(
@@ -402,6 +425,26 @@ class PrometheusMetrics:
 
         self._battery(state)
 
+    def _sensor_metric(self, state):
+        """Return the unit and metric name of a sensor, memoized per entity."""
+        key = (
+            state.attributes.get(ATTR_UNIT_OF_MEASUREMENT),
+            state.attributes.get(ATTR_DEVICE_CLASS),
+        )
+        cached = self._entity_sensor_metric.get(state.entity_id)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        unit = self._unit_string(key[0])
+
+        for metric_handler in self._sensor_metric_handlers:
+            metric = metric_handler(state, unit)
+            if metric is not None:
+                break
+
+        self._entity_sensor_metric[state.entity_id] = (key, (unit, metric))
+        return unit, metric
+
     def _sensor_default_metric(self, state, unit):
         """Get default metric."""
         return self._default_metric
@@ -487,7 +530,12 @@ class PrometheusView(HomeAssistantView):
         """Handle request for Prometheus metrics."""
         _LOGGER.debug("Received Prometheus metrics request")
 
+        # Rendering thousands of series takes long enough
+        # to stall the event loop, so do it in the executor
+        hass = request.app["hass"]
+        body = await hass.async_add_executor_job(self.prometheus_cli.generate_latest)
+
         return web.Response(
-            body=self.prometheus_cli.generate_latest(),
+            body=body,
             content_type=CONTENT_TYPE_TEXT_PLAIN,
         )
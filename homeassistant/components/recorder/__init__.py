@@ -12,7 +12,7 @@ from typing import Any, Callable, List, Optional
 
 from sqlalchemy import create_engine, event as sqlalchemy_event, exc, select
 from sqlalchemy.orm import scoped_session, sessionmaker
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.pool import QueuePool, StaticPool
 import voluptuous as vol
 
 from homeassistant.components import persistent_notification
@@ -41,7 +41,9 @@ from .models import Base, Events, RecorderRuns, States
 from .util import (
     dburl_to_path,
     move_away_broken_database,
+    run_sqlite_maintenance,
     session_scope,
+    setup_connection_for_dialect,
     validate_or_move_away_sqlite_database,
 )
 
@@ -70,6 +72,11 @@ DEFAULT_DB_MAX_RETRIES = 10
 DEFAULT_DB_RETRY_WAIT = 3
 DEFAULT_COMMIT_INTERVAL = 1
 KEEPALIVE_TIME = 30
+# Checkpoint the WAL and run PRAGMA optimize once an hour
+SQLITE_MAINTENANCE_TIME = 3600
+# Connections kept open for history and logbook queries
+# when using a sqlite3 database file
+SQLITE_READ_POOL_SIZE = 4
 
 # Controls how often we clean up
 # States and Events objects
@@ -133,7 +140,7 @@ def run_information(hass, point_in_time: Optional[datetime] = None):
     if run_info:
         return run_info
 
-    with session_scope(hass=hass) as session:
+    with session_scope(hass=hass, read_only=True) as session:
         return run_information_with_session(session, point_in_time)
 
 
@@ -262,6 +269,7 @@ class Recorder(threading.Thread):
         self.async_db_ready = asyncio.Future()
         self._queue_watch = threading.Event()
         self.engine: Any = None
+        self.read_engine: Any = None
         self.run_info: Any = None
 
         self.entity_filter = entity_filter
@@ -270,10 +278,12 @@ class Recorder(threading.Thread):
         self._timechanges_seen = 0
         self._commits_without_expire = 0
         self._keepalive_count = 0
+        self._maintenance_count = 0
         self._old_states = {}
         self._pending_expunge = []
         self.event_session = None
         self.get_session = None
+        self.get_read_session = None
         self._completed_database_setup = None
 
         self.enabled = True
@@ -433,6 +443,12 @@ class Recorder(threading.Thread):
             if self._keepalive_count >= KEEPALIVE_TIME:
                 self._keepalive_count = 0
                 self._send_keep_alive()
+            if self._using_file_sqlite:
+                self._maintenance_count += 1
+                if self._maintenance_count >= SQLITE_MAINTENANCE_TIME:
+                    self._maintenance_count = 0
+                    self._commit_event_session_or_recover()
+                    self._run_sqlite_maintenance()
             if self.commit_interval:
                 self._timechanges_seen += 1
                 if self._timechanges_seen >= self.commit_interval:
@@ -594,6 +610,13 @@ class Recorder(threading.Thread):
             )
             self._reopen_event_session()
 
+    def _run_sqlite_maintenance(self):
+        """Run periodic maintenance on the sqlite3 database file."""
+        try:
+            run_sqlite_maintenance(self.engine)
+        except Exception as err:  # pylint: disable=broad-except
+            _LOGGER.error("Error running sqlite3 maintenance: %s", err)
+
     @callback
     def event_listener(self, event):
         """Listen for new events and put them in the process queue."""
@@ -622,27 +645,21 @@ class Recorder(threading.Thread):
 
         def setup_recorder_connection(dbapi_connection, connection_record):
             """Dbapi specific connection settings."""
-            if self._completed_database_setup:
-                return
-
-            # We do not import sqlite3 here so mysql/other
-            # users do not have to pay for it to be loaded in
-            # memory
-            if self.db_url.startswith(SQLITE_URL_PREFIX):
-                old_isolation = dbapi_connection.isolation_level
-                dbapi_connection.isolation_level = None
-                cursor = dbapi_connection.cursor()
-                cursor.execute("PRAGMA journal_mode=WAL")
-                cursor.close()
-                dbapi_connection.isolation_level = old_isolation
-                # WAL mode only needs to be setup once
-                # instead of every time we open the sqlite connection
-                # as its persistent and isn't free to call every time.
-                self._completed_database_setup = True
-            elif self.db_url.startswith("mysql"):
-                cursor = dbapi_connection.cursor()
-                cursor.execute("SET session wait_timeout=28800")
-                cursor.close()
+            setup_connection_for_dialect(
+                self.engine.dialect.name,
+                dbapi_connection,
+                not self._completed_database_setup,
+            )
+            self._completed_database_setup = True
+
+        def setup_read_connection(dbapi_connection, connection_record):
+            """Dbapi specific settings for read only connections."""
+            setup_connection_for_dialect(
+                self.read_engine.dialect.name,
+                dbapi_connection,
+                False,
+                read_only=True,
+            )
 
         if self.db_url == SQLITE_URL_PREFIX or ":memory:" in self.db_url:
             kwargs["connect_args"] = {"check_same_thread": False}
@@ -666,6 +683,9 @@ class Recorder(threading.Thread):
 
         if self.engine is not None:
             self.engine.dispose()
+        if self.read_engine is not None:
+            self.read_engine.dispose()
+            self.read_engine = None
 
         self.engine = create_engine(self.db_url, **kwargs)
 
@@ -674,6 +694,25 @@ class Recorder(threading.Thread):
         Base.metadata.create_all(self.engine)
         self.get_session = scoped_session(sessionmaker(bind=self.engine))
 
+        if not self._using_file_sqlite or ":memory:" in self.db_url:
+            # In memory databases only have a single connection and
+            # other databases already pool connections for readers
+            self.get_read_session = self.get_session
+            return
+
+        # Readers get their own pool of query only connections so history
+        # and logbook queries do not wait on the connection used by the
+        # recorder thread. In WAL mode readers do not block the writer.
+        self.read_engine = create_engine(
+            self.db_url,
+            connect_args={"check_same_thread": False},
+            poolclass=QueuePool,
+            pool_size=SQLITE_READ_POOL_SIZE,
+            max_overflow=SQLITE_READ_POOL_SIZE,
+        )
+        sqlalchemy_event.listen(self.read_engine, "connect", setup_read_connection)
+        self.get_read_session = scoped_session(sessionmaker(bind=self.read_engine))
+
     @property
     def _using_file_sqlite(self):
         """Short version to check if we are using sqlite3 as a file."""
@@ -683,9 +722,13 @@ class Recorder(threading.Thread):
 
     def _close_connection(self):
         """Close the connection."""
+        if self.read_engine is not None:
+            self.read_engine.dispose()
+            self.read_engine = None
         self.engine.dispose()
         self.engine = None
         self.get_session = None
+        self.get_read_session = None
 
     def _setup_run(self):
         """Log the start of the current run."""
@@ -718,5 +761,8 @@ class Recorder(threading.Thread):
                     "Error saving the event session during shutdown: %s", err
                 )
 
+        if self._using_file_sqlite:
+            self._run_sqlite_maintenance()
+
         self.run_info = None
         self._close_connection()
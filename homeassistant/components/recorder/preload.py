@@ -0,0 +1,267 @@
+"""Load the recorded history of many entities with a few queries."""
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from datetime import datetime
+import json
+import logging
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import literal, select, union_all
+
+from homeassistant.core import Context, CoreState, HomeAssistant, State, callback
+from homeassistant.helpers.singleton import singleton
+
+from .const import DOMAIN
+from .models import States, process_timestamp
+from .util import session_scope
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_HISTORY_PRELOADER = "recorder_history_preloader"
+
+# Collect requests for this long before loading them during startup
+PRELOAD_DELAY = 0.5
+# Maximum number of subqueries combined in one query
+MAX_SUBQUERIES = 100
+
+STATE_COLUMNS = [
+    States.entity_id,
+    States.state,
+    States.attributes,
+    States.last_changed,
+    States.last_updated,
+]
+
+
+@dataclass(frozen=True)
+class HistoryRequest:
+    """Recorded states of an entity to load."""
+
+    entity_id: str
+    # Only states updated from start_time until before end_time
+    start_time: Optional[datetime] = None
+    end_time: Optional[datetime] = None
+    # Only the last number_of_states states
+    number_of_states: Optional[int] = None
+    # Skip states where only the attributes changed
+    changes_only: bool = False
+    # Add the state at start_time as first state
+    include_start_state: bool = False
+
+
+async def async_load_history(
+    hass: HomeAssistant,
+    entity_id: str,
+    *,
+    start_time: Optional[datetime] = None,
+    end_time: Optional[datetime] = None,
+    number_of_states: Optional[int] = None,
+    changes_only: bool = False,
+    include_start_state: bool = False,
+) -> List[State]:
+    """Return the recorded states of an entity, oldest first.
+
+    Requests made at about the same time are loaded together. Nothing is
+    loaded when the recorder is not set up.
+    """
+    if DOMAIN not in hass.config.components:
+        return []
+
+    return await async_get_history_preloader(hass).async_load(
+        HistoryRequest(
+            entity_id.lower(),
+            start_time,
+            end_time,
+            number_of_states,
+            changes_only,
+            include_start_state,
+        )
+    )
+
+
+@callback
+@singleton(DATA_HISTORY_PRELOADER)
+def async_get_history_preloader(hass: HomeAssistant) -> HistoryPreloader:
+    """Return the history preloader."""
+    return HistoryPreloader(hass)
+
+
+class HistoryPreloader:
+    """Batch the history requests of entities.
+
+    Integrations restoring their state from the recorder all do so while Home
+    Assistant starts. Their requests are collected for a moment and loaded
+    with a single session, combined in as few queries as possible.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the preloader."""
+        self.hass = hass
+        self.requests = 0
+        self.queries = 0
+        self._pending: Dict[HistoryRequest, asyncio.Future] = {}
+        self._flush_scheduled = False
+
+    async def async_load(self, request: HistoryRequest) -> List[State]:
+        """Load the states of a request with other pending requests."""
+        future = self._pending.get(request)
+        if future is None:
+            future = self._pending[request] = self.hass.loop.create_future()
+            self._async_schedule_flush()
+        return list(await future)
+
+    @callback
+    def _async_schedule_flush(self) -> None:
+        """Schedule loading the pending requests."""
+        if self._flush_scheduled:
+            return
+
+        self._flush_scheduled = True
+        self.hass.async_create_task(self._async_flush())
+
+    async def _async_flush(self) -> None:
+        """Load the pending requests, collect more first during startup."""
+        if self.hass.state == CoreState.running:
+            await asyncio.sleep(0)
+        else:
+            await asyncio.sleep(PRELOAD_DELAY)
+
+        self._flush_scheduled = False
+        pending, self._pending = self._pending, {}
+        await self._async_load_pending(pending)
+
+    async def _async_load_pending(
+        self, pending: Dict[HistoryRequest, asyncio.Future]
+    ) -> None:
+        """Load requests and resolve their futures."""
+        start = time.monotonic()
+        try:
+            results = await self.hass.async_add_executor_job(
+                self._load_requests, list(pending)
+            )
+        except Exception as err:  # pylint: disable=broad-except
+            for future in pending.values():
+                if not future.done():
+                    future.set_exception(err)
+            return
+
+        for request, future in pending.items():
+            if not future.done():
+                future.set_result(results[request])
+
+        _LOGGER.debug(
+            "Loaded history of %d requests in %.3fs",
+            len(pending),
+            time.monotonic() - start,
+        )
+
+    def _load_requests(
+        self, requests: List[HistoryRequest]
+    ) -> Dict[HistoryRequest, List[State]]:
+        """Load requests with a single session."""
+        with session_scope(hass=self.hass, read_only=True) as session:
+            results, queries = load_requests(session, requests)
+        self.requests += len(requests)
+        self.queries += queries
+        return results
+
+
+def load_requests(
+    session, requests: Iterable[HistoryRequest]
+) -> Tuple[Dict[HistoryRequest, List[State]], int]:
+    """Load the states of requests, return them and the number of queries."""
+    requests = list(requests)
+    results: Dict[HistoryRequest, List[State]] = {request: [] for request in requests}
+    start_states: Dict[HistoryRequest, State] = {}
+    subqueries = []
+
+    for idx, request in enumerate(requests):
+        subqueries.append(_states_subquery(request, idx))
+        if request.include_start_state and request.start_time is not None:
+            # Negative indexes identify the start states
+            subqueries.append(_start_state_subquery(request, -idx - 1))
+
+    queries = 0
+    for offset in range(0, len(subqueries), MAX_SUBQUERIES):
+        part = subqueries[offset : offset + MAX_SUBQUERIES]
+        query = union_all(*part) if len(part) > 1 else part[0]
+        queries += 1
+
+        for row in session.execute(query):
+            state = _row_to_state(row)
+            if state is None:
+                continue
+            if row.request >= 0:
+                results[requests[row.request]].append(state)
+                continue
+
+            request = requests[-row.request - 1]
+            state.last_changed = state.last_updated = request.start_time
+            start_states[request] = state
+
+    for request, states in results.items():
+        states.sort(key=lambda state: state.last_updated)
+        if request in start_states:
+            states.insert(0, start_states[request])
+
+    return results, queries
+
+
+def _states_subquery(request: HistoryRequest, idx: int):
+    """Return a query for the states of a request."""
+    query = select([*STATE_COLUMNS, literal(idx).label("request")]).where(
+        States.entity_id == request.entity_id
+    )
+
+    if request.changes_only:
+        query = query.where(States.last_changed == States.last_updated)
+    if request.start_time is not None:
+        query = query.where(States.last_updated >= request.start_time)
+    if request.end_time is not None:
+        query = query.where(States.last_updated < request.end_time)
+    if request.number_of_states is None:
+        return query
+
+    # Wrap limited queries so they can be combined
+    return select(
+        [
+            query.order_by(States.last_updated.desc())
+            .limit(request.number_of_states)
+            .alias()
+        ]
+    )
+
+
+def _start_state_subquery(request: HistoryRequest, idx: int):
+    """Return a query for the state of an entity at the start of a request."""
+    query = (
+        select([*STATE_COLUMNS, literal(idx).label("request")])
+        .where(
+            (States.entity_id == request.entity_id)
+            & (States.last_updated < request.start_time)
+        )
+        .order_by(States.last_updated.desc())
+        .limit(1)
+    )
+    return select([query.alias()])
+
+
+def _row_to_state(row) -> Optional[State]:
+    """Convert a row to a state."""
+    try:
+        return State(
+            row.entity_id,
+            row.state,
+            json.loads(row.attributes),
+            process_timestamp(row.last_changed),
+            process_timestamp(row.last_updated),
+            context=Context(id=None),
+            validate_entity_id=False,
+        )
+    except ValueError:
+        # When json.loads fails
+        _LOGGER.exception("Error converting row to state: %s", row)
+        return None
@@ -23,12 +23,34 @@ SQLITE3_POSTFIXES = ["", "-wal", "-shm"]
 # should do a check on the sqlite3 database.
 MAX_RESTART_TIME = timedelta(minutes=10)
 
+# Connection specific settings applied to every sqlite3 connection.
+# WAL mode is persistent, so synchronous=NORMAL is still crash safe
+# (only the last commits can be lost on power failure) while avoiding
+# an fsync for every commit. A negative cache_size is in KiB.
+SQLITE_CACHE_SIZE = -16384
+SQLITE_MMAP_SIZE = 64 * 1024 * 1024
+SQLITE_CONNECTION_PRAGMAS = [
+    "PRAGMA synchronous=NORMAL",
+    f"PRAGMA cache_size={SQLITE_CACHE_SIZE}",
+    f"PRAGMA mmap_size={SQLITE_MMAP_SIZE}",
+    "PRAGMA temp_store=MEMORY",
+]
+
 
 @contextmanager
-def session_scope(*, hass=None, session=None):
-    """Provide a transactional scope around a series of operations."""
+def session_scope(*, hass=None, session=None, read_only=False):
+    """Provide a transactional scope around a series of operations.
+
+    Pass read_only=True for queries that never write so they are served
+    from the read connection pool and do not contend with the recorder
+    thread for the writer connection.
+    """
     if session is None and hass is not None:
-        session = hass.data[DATA_INSTANCE].get_session()
+        instance = hass.data[DATA_INSTANCE]
+        if read_only:
+            session = instance.get_read_session()
+        else:
+            session = instance.get_session()
 
     if session is None:
         raise RuntimeError("Session required")
@@ -110,6 +132,50 @@ def execute(qry, to_native=False, validate_entity_ids=True):
             time.sleep(QUERY_RETRY_WAIT)
 
 
+def execute_on_connection(dbapi_connection, statement):
+    """Execute a single statement with a dbapi connection."""
+    cursor = dbapi_connection.cursor()
+    cursor.execute(statement)
+    cursor.close()
+
+
+def setup_connection_for_dialect(
+    dialect_name, dbapi_connection, first_connection, read_only=False
+):
+    """Execute statements needed for dialect connection."""
+    if dialect_name == "sqlite":
+        if first_connection:
+            old_isolation = dbapi_connection.isolation_level
+            dbapi_connection.isolation_level = None
+            # WAL mode only needs to be setup once
+            # instead of every time we open the sqlite connection
+            # as its persistent and isn't free to call every time.
+            execute_on_connection(dbapi_connection, "PRAGMA journal_mode=WAL")
+            dbapi_connection.isolation_level = old_isolation
+
+        for pragma in SQLITE_CONNECTION_PRAGMAS:
+            execute_on_connection(dbapi_connection, pragma)
+
+        if read_only:
+            execute_on_connection(dbapi_connection, "PRAGMA query_only=ON")
+
+    elif dialect_name == "mysql":
+        execute_on_connection(dbapi_connection, "SET session wait_timeout=28800")
+
+
+def run_sqlite_maintenance(engine):
+    """Checkpoint the WAL and refresh the query planner statistics."""
+    if engine.dialect.name != "sqlite":
+        return
+
+    timer_start = time.perf_counter()
+    with engine.connect() as conn:
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        conn.execute("PRAGMA optimize")
+
+    _LOGGER.debug("sqlite3 maintenance took %fs", time.perf_counter() - timer_start)
+
+
 def validate_or_move_away_sqlite_database(dburl: str, db_integrity_check: bool) -> bool:
     """Ensure that the database is valid or move it away."""
     dbpath = dburl_to_path(dburl)
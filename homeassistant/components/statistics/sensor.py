@@ -1,12 +1,9 @@
 """Support for statistics for sensor values."""
-from collections import deque
 import logging
-import statistics
 
 import voluptuous as vol
 
-from homeassistant.components.recorder.models import States
-from homeassistant.components.recorder.util import execute, session_scope
+from homeassistant.components.recorder import preload
 from homeassistant.components.sensor import PLATFORM_SCHEMA
 from homeassistant.const import (
     ATTR_UNIT_OF_MEASUREMENT,
@@ -27,6 +24,7 @@ from homeassistant.helpers.reload import async_setup_reload_service
 from homeassistant.util import dt as dt_util
 
 from . import DOMAIN, PLATFORMS
+from .window import StatisticsWindow
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -97,8 +95,9 @@ class StatisticsSensor(Entity):
         self._max_age = max_age
         self._precision = precision
         self._unit_of_measurement = None
-        self.states = deque(maxlen=self._sampling_size)
-        self.ages = deque(maxlen=self._sampling_size)
+        self.window = StatisticsWindow(self._sampling_size, not self.is_binary)
+        self.states = self.window.values
+        self.ages = self.window.ages
 
         self.count = 0
         self.mean = self.median = self.stdev = self.variance = None
@@ -151,11 +150,9 @@ class StatisticsSensor(Entity):
 
         try:
             if self.is_binary:
-                self.states.append(new_state.state)
+                self.window.append(new_state.state, new_state.last_updated)
             else:
-                self.states.append(float(new_state.state))
-
-            self.ages.append(new_state.last_updated)
+                self.window.append(float(new_state.state), new_state.last_updated)
         except ValueError:
             _LOGGER.error(
                 "%s: parsing error, expected number and received %s",
@@ -227,8 +224,7 @@ class StatisticsSensor(Entity):
                 dt_util.as_local(self.ages[0]),
                 (now - self.ages[0]),
             )
-            self.ages.popleft()
-            self.states.popleft()
+            self.window.popleft()
 
     def _next_to_purge_timestamp(self):
         """Find the timestamp when the next purge would occur."""
@@ -239,6 +235,12 @@ class StatisticsSensor(Entity):
             return self.ages[0] + self._max_age
         return None
 
+    def _round(self, value):
+        """Round a statistic to the precision, unknown if it is not defined."""
+        if value is None:
+            return STATE_UNKNOWN
+        return round(value, self._precision)
+
     async def async_update(self):
         """Get the latest data and updates the states."""
         _LOGGER.debug("%s: updating statistics", self.entity_id)
@@ -248,24 +250,16 @@ class StatisticsSensor(Entity):
         self.count = len(self.states)
 
         if not self.is_binary:
-            try:  # require only one data point
-                self.mean = round(statistics.mean(self.states), self._precision)
-                self.median = round(statistics.median(self.states), self._precision)
-            except statistics.StatisticsError as err:
-                _LOGGER.debug("%s: %s", self.entity_id, err)
-                self.mean = self.median = STATE_UNKNOWN
-
-            try:  # require at least two data points
-                self.stdev = round(statistics.stdev(self.states), self._precision)
-                self.variance = round(statistics.variance(self.states), self._precision)
-            except statistics.StatisticsError as err:
-                _LOGGER.debug("%s: %s", self.entity_id, err)
-                self.stdev = self.variance = STATE_UNKNOWN
+            # Mean and median require one data point, the deviation two
+            self.mean = self._round(self.window.mean)
+            self.median = self._round(self.window.median)
+            self.stdev = self._round(self.window.stdev)
+            self.variance = self._round(self.window.variance)
 
             if self.states:
-                self.total = round(sum(self.states), self._precision)
-                self.min = round(min(self.states), self._precision)
-                self.max = round(max(self.states), self._precision)
+                self.total = self._round(self.window.total)
+                self.min = self._round(self.window.min)
+                self.max = self._round(self.window.max)
 
                 self.min_age = self.ages[0]
                 self.max_age = self.ages[-1]
@@ -315,38 +309,31 @@ class StatisticsSensor(Entity):
     async def _async_initialize_from_database(self):
         """Initialize the list of states from the database.
 
-        The query will get the list of states in DESCENDING order so that we
-        can limit the result to self._sample_size. Afterwards reverse the
-        list so that we get it in the right order again.
-
-        If MaxAge is provided then query will restrict to entries younger then
-        current datetime - MaxAge.
+        Loads the last self._sampling_size states. If MaxAge is provided
+        then only states younger then current datetime - MaxAge are loaded.
         """
 
         _LOGGER.debug("%s: initializing values from the database", self.entity_id)
 
-        with session_scope(hass=self.hass) as session:
-            query = session.query(States).filter(
-                States.entity_id == self._entity_id.lower()
-            )
-
-            if self._max_age is not None:
-                records_older_then = dt_util.utcnow() - self._max_age
-                _LOGGER.debug(
-                    "%s: retrieve records not older then %s",
-                    self.entity_id,
-                    records_older_then,
-                )
-                query = query.filter(States.last_updated >= records_older_then)
-            else:
-                _LOGGER.debug("%s: retrieving all records", self.entity_id)
-
-            query = query.order_by(States.last_updated.desc()).limit(
-                self._sampling_size
+        records_older_then = None
+        if self._max_age is not None:
+            records_older_then = dt_util.utcnow() - self._max_age
+            _LOGGER.debug(
+                "%s: retrieve records not older then %s",
+                self.entity_id,
+                records_older_then,
             )
-            states = execute(query, to_native=True, validate_entity_ids=False)
+        else:
+            _LOGGER.debug("%s: retrieving all records", self.entity_id)
+
+        states = await preload.async_load_history(
+            self.hass,
+            self._entity_id,
+            start_time=records_older_then,
+            number_of_states=self._sampling_size,
+        )
 
-        for state in reversed(states):
+        for state in states:
             self._add_state_to_queue(state)
 
         self.async_schedule_update_ha_state(True)
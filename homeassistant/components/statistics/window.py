@@ -0,0 +1,131 @@
+"""Sliding window of samples with incrementally maintained statistics."""
+from bisect import bisect_left, insort
+from collections import deque
+from datetime import datetime
+import math
+from typing import Any, Deque, List, Optional
+
+# Recompute the running sums after this many updates to bound rounding drift
+MIN_RESYNC_INTERVAL = 100
+
+
+class StatisticsWindow:
+    """Keep the last samples of a sensor and their statistics.
+
+    Adding or evicting a sample updates a running total, the mean and the sum
+    of squared deviations (Welford) in constant time. A sorted copy of the
+    values gives the median, minimum and maximum without sorting the window.
+    Finding a value's position in the copy takes logarithmic time. Inserting
+    or removing it shifts the list, which is linear but a single memmove.
+    Non-numeric windows only keep the samples.
+    """
+
+    def __init__(self, maxlen: int, numeric: bool = True) -> None:
+        """Initialize the window."""
+        self.maxlen = maxlen
+        self.numeric = numeric
+        self.values: Deque[Any] = deque()
+        self.ages: Deque[datetime] = deque()
+        self._sorted: List[float] = []
+        self._total = 0.0
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._updates = 0
+
+    def __len__(self) -> int:
+        """Return the number of samples."""
+        return len(self.values)
+
+    def append(self, value: Any, age: datetime) -> None:
+        """Add a sample, evicting the oldest one if the window is full."""
+        if len(self.values) >= self.maxlen:
+            self.popleft()
+
+        self.values.append(value)
+        self.ages.append(age)
+
+        if not self.numeric:
+            return
+
+        insort(self._sorted, value)
+        self._total += value
+        delta = value - self._mean
+        self._mean += delta / len(self.values)
+        self._m2 += delta * (value - self._mean)
+        self._count_update()
+
+    def popleft(self) -> Any:
+        """Evict and return the oldest sample."""
+        value = self.values.popleft()
+        self.ages.popleft()
+
+        if not self.numeric:
+            return value
+
+        del self._sorted[bisect_left(self._sorted, value)]
+        count = len(self.values)
+        if not count:
+            self._total = self._mean = self._m2 = 0.0
+            return value
+
+        self._total -= value
+        delta = value - self._mean
+        self._mean -= delta / count
+        self._m2 -= delta * (value - self._mean)
+        self._count_update()
+        return value
+
+    def _count_update(self) -> None:
+        """Recompute the running sums once enough updates accumulated."""
+        self._updates += 1
+        if self._updates < max(self.maxlen, MIN_RESYNC_INTERVAL):
+            return
+
+        self._updates = 0
+        self._total = math.fsum(self.values)
+        self._mean = self._total / len(self.values)
+        self._m2 = math.fsum((value - self._mean) ** 2 for value in self.values)
+
+    @property
+    def total(self) -> Optional[float]:
+        """Return the sum of the samples."""
+        return self._total if self._sorted else None
+
+    @property
+    def mean(self) -> Optional[float]:
+        """Return the mean of the samples."""
+        return self._mean if self._sorted else None
+
+    @property
+    def median(self) -> Optional[float]:
+        """Return the median of the samples."""
+        count = len(self._sorted)
+        if not count:
+            return None
+        middle = count // 2
+        if count % 2:
+            return self._sorted[middle]
+        return (self._sorted[middle - 1] + self._sorted[middle]) / 2
+
+    @property
+    def variance(self) -> Optional[float]:
+        """Return the sample variance, requires at least two samples."""
+        if len(self._sorted) < 2:
+            return None
+        return max(self._m2, 0.0) / (len(self._sorted) - 1)
+
+    @property
+    def stdev(self) -> Optional[float]:
+        """Return the sample standard deviation."""
+        variance = self.variance
+        return None if variance is None else math.sqrt(variance)
+
+    @property
+    def min(self) -> Optional[float]:
+        """Return the smallest sample."""
+        return self._sorted[0] if self._sorted else None
+
+    @property
+    def max(self) -> Optional[float]:
+        """Return the largest sample."""
+        return self._sorted[-1] if self._sorted else None
@@ -20,24 +20,52 @@ import threading
 import time
 from types import MappingProxyType
 
+import voluptuous as vol
+
 from homeassistant.const import EVENT_HOMEASSISTANT_STOP
 from homeassistant.core import callback
 from homeassistant.exceptions import HomeAssistantError
+import homeassistant.helpers.config_validation as cv
 
 from .const import (
     ATTR_ENDPOINTS,
+    ATTR_SETTINGS,
     ATTR_STREAMS,
+    CONF_LL_HLS,
+    CONF_PART_DURATION,
     DOMAIN,
     MAX_SEGMENTS,
+    MIN_PART_DURATION,
+    MIN_SEGMENT_DURATION,
     OUTPUT_IDLE_TIMEOUT,
     STREAM_RESTART_INCREMENT,
     STREAM_RESTART_RESET_TIME,
+    TARGET_PART_DURATION,
 )
-from .core import PROVIDERS, IdleTimer
+from .core import PROVIDERS, IdleTimer, StreamSettings
 from .hls import async_setup_hls
 
 _LOGGER = logging.getLogger(__name__)
 
+CONFIG_SCHEMA = vol.Schema(
+    {
+        DOMAIN: vol.Maybe(
+            vol.Schema(
+                {
+                    vol.Optional(CONF_LL_HLS, default=False): cv.boolean,
+                    vol.Optional(
+                        CONF_PART_DURATION, default=TARGET_PART_DURATION
+                    ): vol.All(
+                        vol.Coerce(float),
+                        vol.Range(min=MIN_PART_DURATION, max=MIN_SEGMENT_DURATION),
+                    ),
+                }
+            )
+        )
+    },
+    extra=vol.ALLOW_EXTRA,
+)
+
 
 def create_stream(hass, stream_source, options=None):
     """Create a stream with the specified identfier based on the source url.
@@ -78,6 +106,12 @@ async def async_setup(hass, config):
     hass.data[DOMAIN][ATTR_ENDPOINTS] = {}
     hass.data[DOMAIN][ATTR_STREAMS] = []
 
+    conf = config.get(DOMAIN) or {}
+    hass.data[DOMAIN][ATTR_SETTINGS] = StreamSettings(
+        ll_hls=conf.get(CONF_LL_HLS, False),
+        part_target_duration=conf.get(CONF_PART_DURATION, TARGET_PART_DURATION),
+    )
+
     # Setup HLS
     hls_endpoint = async_setup_hls(hass)
     hass.data[DOMAIN][ATTR_ENDPOINTS]["hls"] = hls_endpoint
@@ -188,7 +222,9 @@ class Stream:
         # pylint: disable=import-outside-toplevel
         from .worker import SegmentBuffer, stream_worker
 
-        segment_buffer = SegmentBuffer(self.outputs)
+        segment_buffer = SegmentBuffer(
+            self.outputs, self.hass.data.get(DOMAIN, {}).get(ATTR_SETTINGS)
+        )
         wait_timeout = 0
         while not self._thread_quit.wait(timeout=wait_timeout):
             start_time = time.time()
@@ -2,8 +2,12 @@
 DOMAIN = "stream"
 
 ATTR_ENDPOINTS = "endpoints"
+ATTR_SETTINGS = "settings"
 ATTR_STREAMS = "streams"
 
+CONF_LL_HLS = "ll_hls"
+CONF_PART_DURATION = "part_duration"
+
 OUTPUT_FORMATS = ["hls"]
 
 SEGMENT_CONTAINER_FORMAT = "mp4"  # format for segments
@@ -17,6 +21,8 @@ OUTPUT_IDLE_TIMEOUT = 300  # Idle timeout due to inactivity
 NUM_PLAYLIST_SEGMENTS = 3  # Number of segments to use in HLS playlist
 MAX_SEGMENTS = 4  # Max number of segments to keep around
 MIN_SEGMENT_DURATION = 1.5  # Each segment is at least this many seconds
+TARGET_PART_DURATION = 1.0  # Target duration of LL-HLS partial segments
+MIN_PART_DURATION = 0.2  # Shortest LL-HLS partial segment duration allowed
 
 PACKETS_TO_WAIT_FOR_AUDIO = 20  # Some streams have an audio stream with no audio
 MAX_TIMESTAMP_GAP = 10000  # seconds - anything from 10 to 50000 is probably reasonable
@@ -12,11 +12,19 @@ from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.event import async_call_later
 from homeassistant.util.decorator import Registry
 
-from .const import ATTR_STREAMS, DOMAIN
+from .const import ATTR_STREAMS, DOMAIN, TARGET_PART_DURATION
 
 PROVIDERS = Registry()
 
 
+@attr.s
+class StreamSettings:
+    """Represent the stream settings."""
+
+    ll_hls: bool = attr.ib(default=False)
+    part_target_duration: float = attr.ib(default=TARGET_PART_DURATION)
+
+
 @attr.s
 class StreamBuffer:
     """Represent a segment."""
@@ -27,6 +35,15 @@ class StreamBuffer:
     astream = attr.ib(default=None)  # type=Optional[av.AudioStream]
 
 
+@attr.s
+class Part:
+    """Represent a partial segment."""
+
+    duration: float = attr.ib()
+    has_keyframe: bool = attr.ib()
+    data: bytes = attr.ib()
+
+
 @attr.s
 class Segment:
     """Represent a segment."""
@@ -36,6 +53,8 @@ class Segment:
     duration: float = attr.ib()
     # For detecting discontinuities across stream restarts
     stream_id: int = attr.ib(default=0)
+    # Partial segments, only produced for low latency HLS
+    parts: List[Part] = attr.ib(factory=list)
 
 
 class IdleTimer:
@@ -146,6 +165,12 @@ class StreamOutput:
         """Store output."""
         self._hass.loop.call_soon_threadsafe(self._async_put, segment)
 
+    def put_part(self, sequence: int, stream_id: int, part: Part) -> None:
+        """Store a partial segment of the segment being recorded.
+
+        Outputs that only handle complete segments ignore parts.
+        """
+
     @callback
     def _async_put(self, segment: Segment) -> None:
         """Store output from event loop."""
@@ -173,7 +198,7 @@ class StreamView(HomeAssistantView):
     requires_auth = False
     platform = None
 
-    async def get(self, request, token, sequence=None):
+    async def get(self, request, token, sequence=None, part_num=None):
         """Start a GET request."""
         hass = request.app["hass"]
 
@@ -188,8 +213,8 @@ class StreamView(HomeAssistantView):
         # Start worker if not already started
         stream.start()
 
-        return await self.handle(request, stream, sequence)
+        return await self.handle(request, stream, sequence, part_num)
 
-    async def handle(self, request, stream, sequence):
+    async def handle(self, request, stream, sequence, part_num):
         """Handle the stream request."""
         raise NotImplementedError()
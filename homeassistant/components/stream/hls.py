@@ -1,12 +1,30 @@
 """Provide functionality to stream HLS."""
+import asyncio
+from contextlib import suppress
 import io
+from typing import List, Optional
 
 from aiohttp import web
+import async_timeout
 
 from homeassistant.core import callback
 
-from .const import FORMAT_CONTENT_TYPE, MAX_SEGMENTS, NUM_PLAYLIST_SEGMENTS
-from .core import PROVIDERS, HomeAssistant, IdleTimer, StreamOutput, StreamView
+from .const import (
+    ATTR_SETTINGS,
+    DOMAIN,
+    FORMAT_CONTENT_TYPE,
+    MAX_SEGMENTS,
+    NUM_PLAYLIST_SEGMENTS,
+)
+from .core import (
+    PROVIDERS,
+    HomeAssistant,
+    IdleTimer,
+    Part,
+    Segment,
+    StreamOutput,
+    StreamView,
+)
 from .fmp4utils import get_codec_string, get_init, get_m4s
 
 
@@ -15,6 +33,7 @@ def async_setup_hls(hass):
     """Set up api endpoints."""
     hass.http.register_view(HlsPlaylistView())
     hass.http.register_view(HlsSegmentView())
+    hass.http.register_view(HlsPartView())
     hass.http.register_view(HlsInitView())
     hass.http.register_view(HlsMasterPlaylistView())
     return "/api/hls/{}/master_playlist.m3u8"
@@ -45,7 +64,7 @@ class HlsMasterPlaylistView(StreamView):
         ]
         return "\n".join(lines) + "\n"
 
-    async def handle(self, request, stream, sequence):
+    async def handle(self, request, stream, sequence, part_num):
         """Return m3u8 playlist."""
         track = stream.add_provider("hls")
         stream.start()
@@ -67,14 +86,36 @@ class HlsPlaylistView(StreamView):
     @staticmethod
     def render_preamble(track):
         """Render preamble."""
-        return [
+        preamble = [
             "#EXT-X-VERSION:7",
             f"#EXT-X-TARGETDURATION:{track.target_duration}",
             '#EXT-X-MAP:URI="init.mp4"',
         ]
+        if track.part_target_duration:
+            part_target = track.part_target_duration
+            preamble.extend(
+                [
+                    f"#EXT-X-PART-INF:PART-TARGET={part_target:.3f}",
+                    "#EXT-X-SERVER-CONTROL:CAN-BLOCK-RELOAD=YES,"
+                    f"PART-HOLD-BACK={3 * part_target:.3f}",
+                ]
+            )
+        return preamble
 
     @staticmethod
-    def render_playlist(track):
+    def render_parts(sequence, parts):
+        """Render the partial segments of a segment."""
+        return [
+            '#EXT-X-PART:DURATION={:.3f},URI="./segment/{}.{}.m4s"{}'.format(
+                part.duration,
+                sequence,
+                part_num,
+                ",INDEPENDENT=YES" if part.has_keyframe else "",
+            )
+            for part_num, part in enumerate(parts)
+        ]
+
+    def render_playlist(self, track):
         """Render playlist."""
         segments = list(track.get_segment())[-NUM_PLAYLIST_SEGMENTS:]
 
@@ -90,6 +131,7 @@ class HlsPlaylistView(StreamView):
         for segment in segments:
             if last_stream_id != segment.stream_id:
                 playlist.append("#EXT-X-DISCONTINUITY")
+            playlist.extend(self.render_parts(segment.sequence, segment.parts))
             playlist.extend(
                 [
                     "#EXTINF:{:.04f},".format(float(segment.duration)),
@@ -98,6 +140,22 @@ class HlsPlaylistView(StreamView):
             )
             last_stream_id = segment.stream_id
 
+        if not track.part_target_duration:
+            return playlist
+
+        # Parts of the segment being recorded, followed by a hint for the
+        # next part so clients can request it before it is complete
+        next_sequence = segments[-1].sequence + 1
+        next_part = 0
+        if track.part_sequence == next_sequence:
+            if track.part_stream_id != last_stream_id:
+                playlist.append("#EXT-X-DISCONTINUITY")
+            playlist.extend(self.render_parts(next_sequence, track.parts))
+            next_part = len(track.parts)
+        playlist.append(
+            f'#EXT-X-PRELOAD-HINT:TYPE=PART,URI="./segment/{next_sequence}.{next_part}.m4s"'
+        )
+
         return playlist
 
     def render(self, track):
@@ -105,10 +163,22 @@ class HlsPlaylistView(StreamView):
         lines = ["#EXTM3U"] + self.render_preamble(track) + self.render_playlist(track)
         return "\n".join(lines) + "\n"
 
-    async def handle(self, request, stream, sequence):
+    async def handle(self, request, stream, sequence, part_num):
         """Return m3u8 playlist."""
         track = stream.add_provider("hls")
         stream.start()
+        # Blocking playlist reload, wait until the requested part is ready
+        if track.part_target_duration and "_HLS_msn" in request.query:
+            try:
+                msn = int(request.query["_HLS_msn"])
+                part_num = request.query.get("_HLS_part")
+                if part_num is not None:
+                    part_num = int(part_num)
+            except ValueError:
+                return web.HTTPBadRequest()
+            if msn > max(track.segments, default=0) + 2:
+                return web.HTTPBadRequest()
+            await track.async_wait_for_part(msn, part_num)
         # Wait for a segment to be ready
         if not track.segments:
             if not await track.recv():
@@ -124,7 +194,7 @@ class HlsInitView(StreamView):
     name = "api:stream:hls:init"
     cors_allowed = True
 
-    async def handle(self, request, stream, sequence):
+    async def handle(self, request, stream, sequence, part_num):
         """Return init.mp4."""
         track = stream.add_provider("hls")
         segments = track.get_segment()
@@ -141,7 +211,7 @@ class HlsSegmentView(StreamView):
     name = "api:stream:hls:segment"
     cors_allowed = True
 
-    async def handle(self, request, stream, sequence):
+    async def handle(self, request, stream, sequence, part_num):
         """Return fmp4 segment."""
         track = stream.add_provider("hls")
         segment = track.get_segment(int(sequence))
@@ -154,6 +224,28 @@ class HlsSegmentView(StreamView):
         )
 
 
+class HlsPartView(StreamView):
+    """Stream view to serve a LL-HLS fmp4 partial segment."""
+
+    url = r"/api/hls/{token:[a-f0-9]+}/segment/{sequence:\d+}.{part_num:\d+}.m4s"
+    name = "api:stream:hls:part"
+    cors_allowed = True
+
+    async def handle(self, request, stream, sequence, part_num):
+        """Return fmp4 partial segment."""
+        track = stream.add_provider("hls")
+        sequence = int(sequence)
+        part_num = int(part_num)
+        # The part of a preload hint is requested before it is ready
+        if sequence <= max(track.segments, default=0) + 1:
+            await track.async_wait_for_part(sequence, part_num)
+        part = track.get_part(sequence, part_num)
+        if not part:
+            return web.HTTPNotFound()
+        headers = {"Content-Type": "video/iso.segment"}
+        return web.Response(body=part.data, headers=headers)
+
+
 @PROVIDERS.register("hls")
 class HlsStreamOutput(StreamOutput):
     """Represents HLS Output formats."""
@@ -161,8 +253,113 @@ class HlsStreamOutput(StreamOutput):
     def __init__(self, hass: HomeAssistant, idle_timer: IdleTimer) -> None:
         """Initialize recorder output."""
         super().__init__(hass, idle_timer, deque_maxlen=MAX_SEGMENTS)
+        settings = hass.data.get(DOMAIN, {}).get(ATTR_SETTINGS)
+        self._part_target_duration = None
+        if settings is not None and settings.ll_hls:
+            self._part_target_duration = settings.part_target_duration
+        # Parts of the segment being recorded
+        self._part_sequence = None
+        self._part_stream_id = 0
+        self._parts: List[Part] = []
+        # Set for every part and segment, recv only wakes up for segments
+        self._part_event = asyncio.Event()
 
     @property
     def name(self) -> str:
         """Return provider name."""
         return "hls"
+
+    @property
+    def part_target_duration(self) -> Optional[float]:
+        """Return the duration no part exceeds in seconds, None if disabled."""
+        return self._part_target_duration
+
+    @property
+    def part_sequence(self) -> Optional[int]:
+        """Return the sequence of the segment being recorded."""
+        return self._part_sequence
+
+    @property
+    def part_stream_id(self) -> int:
+        """Return the stream id of the segment being recorded."""
+        return self._part_stream_id
+
+    @property
+    def parts(self) -> List[Part]:
+        """Return the parts of the segment being recorded."""
+        return self._parts
+
+    def get_part(self, sequence: int, part_num: int) -> Optional[Part]:
+        """Retrieve a specific partial segment."""
+        self._idle_timer.awake()
+
+        if sequence == self._part_sequence:
+            parts = self._parts
+        else:
+            segment = self.get_segment(sequence)
+            if not segment:
+                return None
+            parts = segment.parts
+
+        if part_num < len(parts):
+            return parts[part_num]
+        return None
+
+    def has_part(self, sequence: int, part_num: Optional[int]) -> bool:
+        """Return True if the part or a later one is available.
+
+        Without a part number, wait for the whole segment.
+        """
+        if self._part_sequence is not None and sequence <= self._part_sequence:
+            if sequence < self._part_sequence:
+                return True
+            return part_num is not None and part_num < len(self._parts)
+        if not self._segments:
+            return False
+        last_segment = self._segments[-1]
+        if sequence != last_segment.sequence:
+            return sequence < last_segment.sequence
+        return part_num is None or part_num < len(last_segment.parts)
+
+    async def async_wait_for_part(self, sequence: int, part_num: Optional[int]) -> bool:
+        """Wait until a part is available, bounded by the target duration."""
+        with suppress(asyncio.TimeoutError):
+            async with async_timeout.timeout(3 * self.target_duration):
+                while not self.has_part(sequence, part_num):
+                    await self._part_event.wait()
+        return self.has_part(sequence, part_num)
+
+    def put_part(self, sequence: int, stream_id: int, part: Part) -> None:
+        """Store a partial segment of the segment being recorded."""
+        self._hass.loop.call_soon_threadsafe(
+            self._async_put_part, sequence, stream_id, part
+        )
+
+    @callback
+    def _async_put_part(self, sequence: int, stream_id: int, part: Part) -> None:
+        """Store a partial segment from event loop."""
+        self._idle_timer.start()
+        if sequence != self._part_sequence:
+            self._part_sequence = sequence
+            self._part_stream_id = stream_id
+            self._parts = []
+        self._parts.append(part)
+        self._part_event.set()
+        self._part_event.clear()
+
+    @callback
+    def _async_put(self, segment: Segment) -> None:
+        """Store output from event loop."""
+        if segment.sequence == self._part_sequence:
+            self._part_sequence = None
+            self._parts = []
+        super()._async_put(segment)
+        self._part_event.set()
+        self._part_event.clear()
+
+    def cleanup(self):
+        """Handle cleanup."""
+        super().cleanup()
+        self._part_event.set()
+        self._part_sequence = None
+        self._parts = []
@@ -14,18 +14,25 @@ from .const import (
     SEGMENT_CONTAINER_FORMAT,
     STREAM_TIMEOUT,
 )
-from .core import Segment, StreamBuffer
+from .core import Part, Segment, StreamBuffer
+from .fmp4utils import find_box
 
 _LOGGER = logging.getLogger(__name__)
 
 
-def create_stream_buffer(video_stream, audio_stream, sequence):
+def create_stream_buffer(video_stream, audio_stream, sequence, ll_hls=False):
     """Create a new StreamBuffer."""
 
     segment = io.BytesIO()
+    movflags = (
+        "frag_custom+empty_moov+default_base_moof+frag_discont+negative_cts_offsets"
+    )
+    if ll_hls:
+        # Write a fragment per frame, parts are cut from whole fragments
+        movflags += "+frag_every_frame"
     container_options = {
         # Removed skip_sidx - see https://github.com/home-assistant/core/pull/39970
-        "movflags": "frag_custom+empty_moov+default_base_moof+frag_discont+negative_cts_offsets",
+        "movflags": movflags,
         "avoid_negative_ts": "disabled",
         "fragment_index": str(sequence),
     }
@@ -49,7 +56,7 @@ def create_stream_buffer(video_stream, audio_stream, sequence):
 class SegmentBuffer:
     """Buffer for writing a sequence of packets to the output as a segment."""
 
-    def __init__(self, outputs_callback) -> None:
+    def __init__(self, outputs_callback, settings=None) -> None:
         """Initialize SegmentBuffer."""
         self._stream_id = 0
         self._video_stream = None
@@ -60,6 +67,17 @@ class SegmentBuffer:
         self._sequence = 0
         self._segment_start_pts = None
         self._stream_buffer = None
+        self._part_duration = None
+        if settings is not None and settings.ll_hls:
+            self._part_duration = settings.part_target_duration
+        # Partial segments of the segment being recorded
+        self._parts = []
+        self._part_start_pts = None
+        self._part_has_keyframe = False
+        # End of the last frame written to the current part, not cut yet
+        self._part_frame_end = None
+        self._frame_is_keyframe = False
+        self._memory_file_pos = 0
 
     def set_streams(self, video_stream, audio_stream):
         """Initialize output buffer with streams from container."""
@@ -76,8 +94,17 @@ class SegmentBuffer:
         # worker started.
         self._outputs = self._outputs_callback().values()
         self._stream_buffer = create_stream_buffer(
-            self._video_stream, self._audio_stream, self._sequence
+            self._video_stream,
+            self._audio_stream,
+            self._sequence,
+            self._part_duration is not None,
         )
+        self._parts = []
+        self._part_start_pts = video_pts
+        self._part_has_keyframe = False
+        self._part_frame_end = None
+        self._frame_is_keyframe = False
+        self._memory_file_pos = 0
 
     def mux_packet(self, packet):
         """Mux a packet to the appropriate StreamBuffers."""
@@ -87,24 +114,89 @@ class SegmentBuffer:
             duration = (packet.pts - self._segment_start_pts) * packet.time_base
             if duration >= MIN_SEGMENT_DURATION:
                 # Save segment to outputs
-                self.flush(duration)
+                self.flush(duration, packet.pts)
 
                 # Reinitialize
                 self.reset(packet.pts)
 
         # Mux the packet
         if packet.stream == self._video_stream:
+            pts = packet.pts
+            is_keyframe = packet.is_keyframe
             packet.stream = self._stream_buffer.vstream
             self._stream_buffer.output.mux(packet)
+            if self._part_duration:
+                self._check_part(pts, is_keyframe)
         elif packet.stream == self._audio_stream:
             packet.stream = self._stream_buffer.astream
             self._stream_buffer.output.mux(packet)
 
-    def flush(self, duration):
+    def _check_part(self, video_pts, is_keyframe):
+        """Add the frame the muxer wrote when given the next video packet."""
+        memory_file = self._stream_buffer.segment
+        if not self._memory_file_pos:
+            # The first write is the init section, not a fragment
+            self._memory_file_pos = memory_file.tell()
+        else:
+            self._add_part_frame(video_pts, memory_file.tell())
+        self._frame_is_keyframe = is_keyframe
+
+    def _add_part_frame(self, end_pts, end_pos):
+        """Add a written frame to the current part, cut parts at the target.
+
+        A part ends at the last frame that keeps it within the part duration,
+        which is only known once the frame after it is written.
+        """
+        time_base = self._video_stream.time_base
+        if (
+            self._part_frame_end is not None
+            and (end_pts - self._part_start_pts) * time_base > self._part_duration
+        ):
+            self._flush_part(*self._part_frame_end)
+
+        self._part_has_keyframe |= self._frame_is_keyframe
+        self._part_frame_end = (end_pts, end_pos)
+        if (end_pts - self._part_start_pts) * time_base >= self._part_duration:
+            self._flush_part(end_pts, end_pos)
+
+    def _flush_part(self, end_pts, end_pos):
+        """Create a part from the frames written since the last part."""
+        with self._stream_buffer.segment.getbuffer() as buffer:
+            data = bytes(buffer[self._memory_file_pos : end_pos])
+        part = Part(
+            duration=float(
+                (end_pts - self._part_start_pts) * self._video_stream.time_base
+            ),
+            has_keyframe=self._part_has_keyframe,
+            data=data,
+        )
+        self._parts.append(part)
+        self._memory_file_pos = end_pos
+        self._part_start_pts = end_pts
+        self._part_has_keyframe = False
+        self._part_frame_end = None
+
+        for stream_output in self._outputs:
+            stream_output.put_part(self._sequence, self._stream_id, part)
+
+    def flush(self, duration, end_pts=None):
         """Create a segment from the buffered packets and write to output."""
         self._stream_buffer.output.close()
+        if self._part_duration and self._memory_file_pos:
+            # Closing writes the last fragment, usually followed by an mfra box
+            memory_file = self._stream_buffer.segment
+            end_pos = next(find_box(memory_file, b"mfra"), None)
+            if end_pos is None:
+                end_pos = memory_file.seek(0, io.SEEK_END)
+            self._add_part_frame(end_pts, end_pos)
+            if self._part_frame_end is not None:
+                self._flush_part(*self._part_frame_end)
         segment = Segment(
-            self._sequence, self._stream_buffer.segment, duration, self._stream_id
+            self._sequence,
+            self._stream_buffer.segment,
+            duration,
+            self._stream_id,
+            parts=self._parts,
         )
         for stream_output in self._outputs:
             stream_output.put(segment)
@@ -238,6 +238,12 @@ class ChannelPool:
         """Return True if device does not require channel configuration."""
         return self._channels.zha_device.skip_configuration
 
+    @property
+    def only_cache(self) -> bool:
+        """Return True if cached attributes are not read from the device."""
+        zha_device = self._channels.zha_device
+        return not zha_device.is_mains_powered or zha_device.only_cache
+
     @property
     def unique_id(self):
         """Return the unique id for this channel."""
@@ -262,7 +262,7 @@ class ZigbeeChannel(LogMixin):
             self._cluster,
             [attribute],
             allow_cache=from_cache,
-            only_cache=from_cache and not self._ch_pool.is_mains_powered,
+            only_cache=from_cache and self._ch_pool.only_cache,
             manufacturer=manufacturer,
         )
         return result.get(attribute)
@@ -277,7 +277,7 @@ class ZigbeeChannel(LogMixin):
             result, _ = await self.cluster.read_attributes(
                 attributes,
                 allow_cache=from_cache,
-                only_cache=from_cache and not self._ch_pool.is_mains_powered,
+                only_cache=from_cache and self._ch_pool.only_cache,
                 manufacturer=manufacturer,
             )
             return result
@@ -97,6 +97,7 @@ class ZHADevice(LogMixin):
         self._available = False
         self._available_signal = f"{self.name}_{self.ieee}_{SIGNAL_AVAILABLE}"
         self._checkins_missed_count = 0
+        self.state_writes_coalesced = 0
         self.unsubs = []
         self.quirk_applied = isinstance(self._zigpy_device, zigpy.quirks.CustomDevice)
         self.quirk_class = (
@@ -116,6 +117,7 @@ class ZHADevice(LogMixin):
         )
         self._ha_device_id = None
         self.status = DeviceStatus.CREATED
+        self.only_cache = False
         self._channels = channels.Channels(self)
 
     @property
@@ -405,10 +407,18 @@ class ZHADevice(LogMixin):
                 EFFECT_OKAY, EFFECT_DEFAULT_VARIANT
             )
 
-    async def async_initialize(self, from_cache=False):
-        """Initialize channels."""
+    async def async_initialize(self, from_cache=False, only_cache=False):
+        """Initialize channels.
+
+        With only_cache, attributes are read from the zigpy cache only, also
+        for mains powered devices.
+        """
         self.debug("started initialization")
-        await self._channels.async_initialize(from_cache)
+        self.only_cache = only_cache
+        try:
+            await self._channels.async_initialize(from_cache)
+        finally:
+            self.only_cache = False
         self.debug("power source: %s", self.power_source)
         self.status = DeviceStatus.INITIALIZED
         self.debug("completed initialization")
@@ -437,6 +447,7 @@ class ZHADevice(LogMixin):
             }
             for entity_ref in self.gateway.device_registry[self.ieee]
         ]
+        device_info["state_writes_coalesced"] = self.state_writes_coalesced
 
         # Return the neighbor information
         device_info[ATTR_NEIGHBORS] = [
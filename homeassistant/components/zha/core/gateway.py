@@ -15,6 +15,7 @@ from serial import SerialException
 from zigpy.config import CONF_DEVICE
 import zigpy.device as zigpy_dev
 
+from homeassistant.components import automation, script
 from homeassistant.components.system_log import LogEntry, _figure_out_source
 from homeassistant.core import callback
 from homeassistant.exceptions import ConfigEntryNotReady
@@ -84,6 +85,12 @@ from .device import (
     ZHADevice,
 )
 from .group import GroupMember, ZHAGroup
+from .init_scheduler import (
+    PRIORITY_AUTOMATION,
+    PRIORITY_ENTITY,
+    PRIORITY_OTHER,
+    InitScheduler,
+)
 from .registries import GROUP_ENTITY_DOMAINS
 from .store import async_get_registry
 from .typing import ZhaGroupType, ZigpyEndpointType, ZigpyGroupType
@@ -129,6 +136,8 @@ class ZHAGateway:
         self._log_relay_handler = LogRelayHandler(hass, self)
         self._config_entry = config_entry
         self._unsubs = []
+        self.init_scheduler = InitScheduler()
+        self._init_task: Optional[asyncio.Task] = None
 
     async def async_initialize(self):
         """Initialize controller and connect radio."""
@@ -215,31 +224,51 @@ class ZHAGateway:
             discovery.GROUP_PROBE.discover_group_entities(zha_group)
 
     async def async_initialize_devices_and_entities(self) -> None:
-        """Initialize devices and load entities."""
-        semaphore = asyncio.Semaphore(2)
-
-        async def _throttle(zha_device: zha_typing.ZhaDeviceType, cached: bool):
-            async with semaphore:
-                await zha_device.async_initialize(from_cache=cached)
+        """Initialize devices and load entities.
 
-        _LOGGER.debug("Loading battery powered devices")
+        Devices are initialized from the zigpy cache so their entities can be
+        loaded right away, mains powered devices are then refreshed from the
+        network in the background.
+        """
+        _LOGGER.debug("Loading devices from cache")
         await asyncio.gather(
             *[
-                _throttle(dev, cached=True)
+                dev.async_initialize(from_cache=True, only_cache=True)
                 for dev in self.devices.values()
-                if not dev.is_mains_powered
             ]
         )
 
-        _LOGGER.debug("Loading mains powered devices")
-        await asyncio.gather(
-            *[
-                _throttle(dev, cached=False)
+        self._init_task = self._hass.async_create_task(
+            self.init_scheduler.async_initialize(
+                (dev, self._async_init_priority(dev))
                 for dev in self.devices.values()
                 if dev.is_mains_powered
-            ]
+            )
         )
 
+    @callback
+    def _async_init_priority(self, zha_device: zha_typing.ZhaDeviceType) -> int:
+        """Return how urgently a device should be refreshed from the network."""
+        if automation.automations_with_device(
+            self._hass, zha_device.device_id
+        ) or script.scripts_with_device(self._hass, zha_device.device_id):
+            return PRIORITY_AUTOMATION
+
+        entries = [
+            entry
+            for entry in async_entries_for_device(
+                self.ha_entity_registry, zha_device.device_id
+            )
+            if not entry.disabled
+        ]
+        for entry in entries:
+            if automation.automations_with_entity(
+                self._hass, entry.entity_id
+            ) or script.scripts_with_entity(self._hass, entry.entity_id):
+                return PRIORITY_AUTOMATION
+
+        return PRIORITY_ENTITY if entries else PRIORITY_OTHER
+
     def device_joined(self, device):
         """Handle device joined.
 
@@ -667,6 +696,8 @@ class ZHAGateway:
         _LOGGER.debug("Shutting down ZHA ControllerApplication")
         for unsubscribe in self._unsubs:
             unsubscribe()
+        if self._init_task is not None:
+            self._init_task.cancel()
         await self.application_controller.pre_shutdown()
 
     def handle_message(
@@ -0,0 +1,184 @@
+"""Scheduler for the initialization of ZHA devices."""
+import asyncio
+import logging
+import time
+from typing import Dict, Iterable, Optional, Tuple
+
+from homeassistant.core import callback
+
+from . import typing as zha_typing
+
+_LOGGER = logging.getLogger(__name__)
+
+INITIAL_CONCURRENCY = 2
+MIN_CONCURRENCY = 1
+MAX_CONCURRENCY = 8
+# Weight of the last initialization in the average latency
+LATENCY_SMOOTHING = 0.3
+# Add a slot while the average latency is within this factor of the best one
+LATENCY_TOLERANCE = 1.5
+# Halve the slots once the average latency exceeds this factor of the best one
+LATENCY_BACKOFF = 2.5
+
+# Devices referenced by automations or scripts
+PRIORITY_AUTOMATION = 0
+# Devices with enabled entities
+PRIORITY_ENTITY = 1
+PRIORITY_OTHER = 2
+
+STATUS_QUEUED = "queued"
+STATUS_INITIALIZING = "initializing"
+STATUS_INITIALIZED = "initialized"
+STATUS_FAILED = "failed"
+
+
+class DeviceInitTiming:
+    """Initialization progress and timing of a device."""
+
+    __slots__ = ("ieee", "name", "priority", "status", "queued", "started", "finished")
+
+    def __init__(self, ieee: str, name: str, priority: int) -> None:
+        """Initialize the timing."""
+        self.ieee = ieee
+        self.name = name
+        self.priority = priority
+        self.status = STATUS_QUEUED
+        self.queued = time.monotonic()
+        self.started: Optional[float] = None
+        self.finished: Optional[float] = None
+
+    @property
+    def duration(self) -> Optional[float]:
+        """Return how long the initialization took."""
+        if self.started is None or self.finished is None:
+            return None
+        return self.finished - self.started
+
+    def as_dict(self) -> Dict:
+        """Return the timing as a dict."""
+        return {
+            "ieee": self.ieee,
+            "name": self.name,
+            "priority": self.priority,
+            "status": self.status,
+            "wait_time": None
+            if self.started is None
+            else round(self.started - self.queued, 3),
+            "duration": None if self.duration is None else round(self.duration, 3),
+        }
+
+
+class InitScheduler:
+    """Initialize devices with a concurrency adapted to the radio latency.
+
+    Devices are initialized in order of priority. Every initialization that
+    completes updates an average of the initialization time: while it stays
+    close to the best average seen, the radio keeps up and another device is
+    initialized concurrently, once it grows the concurrency is halved.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the scheduler."""
+        self.concurrency = INITIAL_CONCURRENCY
+        self.devices: Dict[str, DeviceInitTiming] = {}
+        self._latency: Optional[float] = None
+        self._best_latency: Optional[float] = None
+
+    @property
+    def progress(self) -> Dict:
+        """Return the progress of the initialization."""
+        counts = {
+            status: 0
+            for status in (
+                STATUS_QUEUED,
+                STATUS_INITIALIZING,
+                STATUS_INITIALIZED,
+                STATUS_FAILED,
+            )
+        }
+        for timing in self.devices.values():
+            counts[timing.status] += 1
+
+        return {
+            "total": len(self.devices),
+            **counts,
+            "concurrency": self.concurrency,
+            "latency": None if self._latency is None else round(self._latency, 3),
+            "devices": [timing.as_dict() for timing in self.devices.values()],
+        }
+
+    async def async_initialize(
+        self, devices: Iterable[Tuple[zha_typing.ZhaDeviceType, int]]
+    ) -> None:
+        """Initialize devices from the network, most important first."""
+        queue = []
+        for zha_device, priority in sorted(devices, key=lambda item: item[1]):
+            timing = DeviceInitTiming(str(zha_device.ieee), zha_device.name, priority)
+            self.devices[timing.ieee] = timing
+            queue.append((zha_device, timing))
+
+        _LOGGER.debug("Initializing %d devices from the network", len(queue))
+        start = time.monotonic()
+        queue.reverse()
+        running = set()
+
+        try:
+            while queue or running:
+                while queue and len(running) < self.concurrency:
+                    running.add(
+                        asyncio.create_task(self._async_initialize(*queue.pop()))
+                    )
+                _, running = await asyncio.wait(
+                    running, return_when=asyncio.FIRST_COMPLETED
+                )
+        finally:
+            # Stop the devices still initializing when cancelled
+            for task in running:
+                task.cancel()
+
+        _LOGGER.debug(
+            "Initialized %d devices from the network in %.2fs",
+            len(self.devices),
+            time.monotonic() - start,
+        )
+
+    async def _async_initialize(
+        self, zha_device: zha_typing.ZhaDeviceType, timing: DeviceInitTiming
+    ) -> None:
+        """Initialize a device and adapt the concurrency to its timing."""
+        timing.status = STATUS_INITIALIZING
+        timing.started = time.monotonic()
+
+        try:
+            await zha_device.async_initialize(from_cache=False)
+        except Exception as err:  # pylint: disable=broad-except
+            timing.status = STATUS_FAILED
+            _LOGGER.warning("Failed to initialize %s: %s", timing.name, err)
+        else:
+            timing.status = STATUS_INITIALIZED
+        finally:
+            timing.finished = time.monotonic()
+
+        self._async_adapt(timing)
+
+    @callback
+    def _async_adapt(self, timing: DeviceInitTiming) -> None:
+        """Adapt the concurrency to the latest initialization."""
+        assert timing.duration is not None
+
+        if timing.status == STATUS_FAILED:
+            self.concurrency = max(MIN_CONCURRENCY, self.concurrency // 2)
+            return
+
+        if self._latency is None:
+            self._latency = timing.duration
+        else:
+            self._latency += LATENCY_SMOOTHING * (timing.duration - self._latency)
+
+        if self._best_latency is None or self._latency < self._best_latency:
+            self._best_latency = self._latency
+
+        if self._latency > self._best_latency * LATENCY_BACKOFF:
+            self.concurrency = max(MIN_CONCURRENCY, self.concurrency // 2)
+        elif self._latency <= self._best_latency * LATENCY_TOLERANCE:
+            self.concurrency = min(MAX_CONCURRENCY, self.concurrency + 1)
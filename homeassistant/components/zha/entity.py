@@ -5,7 +5,7 @@ import functools
 import logging
 from typing import Any, Awaitable, Dict, List, Optional
 
-from homeassistant.core import CALLBACK_TYPE, Event, callback
+from homeassistant.core import CALLBACK_TYPE, Event, callback, is_callback
 from homeassistant.helpers import entity
 from homeassistant.helpers.device_registry import CONNECTION_ZIGBEE
 from homeassistant.helpers.dispatcher import (
@@ -47,6 +47,8 @@ class BaseZhaEntity(LogMixin, entity.Entity):
         self._device_state_attributes: Dict[str, Any] = {}
         self._zha_device: ZhaDeviceType = zha_device
         self._unsubs: List[CALLABLE_T] = []
+        self._coalesce_writes: bool = False
+        self._pending_write: Optional[asyncio.Task] = None
         self.remove_future: Awaitable[None] = None
 
     @property
@@ -93,6 +95,49 @@ class BaseZhaEntity(LogMixin, entity.Entity):
             "via_device": (DOMAIN, self.hass.data[DATA_ZHA][DATA_ZHA_BRIDGE_ID]),
         }
 
+    @callback
+    def async_write_ha_state(self) -> None:
+        """Write the state, coalescing writes of a radio frame.
+
+        Attribute reports received in one frame are handled in the same loop
+        iteration, so while handling a channel signal the write is deferred
+        to the next iteration and done once.
+        """
+        if self._pending_write is not None:
+            self._zha_device.state_writes_coalesced += 1
+            if self._coalesce_writes:
+                return
+            self._pending_write.cancel()
+            self._pending_write = None
+
+        if not self._coalesce_writes:
+            super().async_write_ha_state()
+            return
+
+        self._pending_write = self.hass.async_create_task(
+            self._async_write_pending_state()
+        )
+
+    async def _async_write_pending_state(self) -> None:
+        """Write the state deferred while handling channel signals."""
+        self._pending_write = None
+        super().async_write_ha_state()
+
+    @callback
+    def _async_coalesce_writes(self, func: CALLABLE_T) -> CALLABLE_T:
+        """Wrap a channel signal handler to coalesce its state writes."""
+
+        @callback
+        @functools.wraps(func)
+        def _handle_signal(*args: Any) -> None:
+            self._coalesce_writes = True
+            try:
+                func(*args)
+            finally:
+                self._coalesce_writes = False
+
+        return _handle_signal
+
     @callback
     def async_state_changed(self) -> None:
         """Entity state changed."""
@@ -110,6 +155,9 @@ class BaseZhaEntity(LogMixin, entity.Entity):
 
     async def async_will_remove_from_hass(self) -> None:
         """Disconnect entity object when removed."""
+        if self._pending_write is not None:
+            self._pending_write.cancel()
+            self._pending_write = None
         for unsub in self._unsubs[:]:
             unsub()
             self._unsubs.remove(unsub)
@@ -123,6 +171,8 @@ class BaseZhaEntity(LogMixin, entity.Entity):
         if signal_override:
             unsub = async_dispatcher_connect(self.hass, signal, func)
         else:
+            if is_callback(func):
+                func = self._async_coalesce_writes(func)
             unsub = async_dispatcher_connect(
                 self.hass, f"{channel.unique_id}_{signal}", func
             )
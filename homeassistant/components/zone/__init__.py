@@ -34,6 +34,7 @@ from homeassistant.loader import bind_hass
 from homeassistant.util.location import distance
 
 from .const import ATTR_PASSIVE, ATTR_RADIUS, CONF_PASSIVE, DOMAIN, HOME_ZONE
+from .index import async_get_zone_index
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -97,17 +98,21 @@ def async_active_zone(
 
     This method must be run in the event loop.
     """
-    # Sort entity IDs so that we are deterministic if equal distance to 2 zones
-    zones = (
-        cast(State, hass.states.get(entity_id))
-        for entity_id in sorted(hass.states.async_entity_ids(DOMAIN))
+    # Candidates are sorted so that we are deterministic if equal distance to 2 zones
+    entity_ids = async_get_zone_index(hass).async_candidates(
+        latitude, longitude, radius
     )
 
     min_dist = None
     closest = None
 
-    for zone in zones:
-        if zone.state == STATE_UNAVAILABLE or zone.attributes.get(ATTR_PASSIVE):
+    for entity_id in entity_ids:
+        zone = hass.states.get(entity_id)
+        if (
+            zone is None
+            or zone.state == STATE_UNAVAILABLE
+            or zone.attributes.get(ATTR_PASSIVE)
+        ):
             continue
 
         zone_dist = distance(
@@ -0,0 +1,144 @@
+"""Grid index of the zones to find the zones near a location."""
+from __future__ import annotations
+
+import math
+from typing import Dict, List, Optional, Set, Tuple
+
+from homeassistant.const import ATTR_LATITUDE, ATTR_LONGITUDE
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers.event import TrackStates, async_track_state_change_filtered
+from homeassistant.helpers.singleton import singleton
+
+from .const import ATTR_RADIUS, DOMAIN
+
+DATA_ZONE_INDEX = "zone_index"
+
+# Size of a grid cell in degrees, about 11 km of latitude
+CELL_SIZE = 0.1
+# Zones and lookups covering more cells are not looked up in the grid
+MAX_CELLS = 64
+# Shortest degree of latitude in meters, with a margin so boxes cover circles
+METERS_PER_DEGREE = 110000 / 1.2
+# Boxes reaching beyond this latitude are not looked up in the grid
+MAX_LATITUDE = 85
+
+_Cell = Tuple[int, int]
+
+
+@callback
+@singleton(DATA_ZONE_INDEX)
+def async_get_zone_index(hass: HomeAssistant) -> ZoneIndex:
+    """Return the zone index."""
+    return ZoneIndex(hass)
+
+
+class ZoneIndex:
+    """Index the zones in a grid of cells.
+
+    Every zone is added to the cells its circle overlaps, a location is
+    only compared with the zones in the cells around it. Zones too large for
+    the grid, like those near the poles or the antimeridian, are compared
+    with every location.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the index."""
+        self.hass = hass
+        self._cells: Dict[_Cell, List[str]] = {}
+        self._unindexed: List[str] = []
+        self._entity_ids: List[str] = []
+        self._dirty = True
+        self._tracker = async_track_state_change_filtered(
+            hass, TrackStates(False, set(), {DOMAIN}), self._async_zone_changed
+        )
+
+    @callback
+    def _async_zone_changed(self, event: Event) -> None:
+        """Mark the index outdated when a zone changes."""
+        self._dirty = True
+        if event.data["old_state"] is None:
+            # Follow the changes of the added zone too
+            self._tracker.async_update_listeners(
+                TrackStates(
+                    False, set(self.hass.states.async_entity_ids(DOMAIN)), {DOMAIN}
+                )
+            )
+
+    @callback
+    def _async_rebuild(self) -> None:
+        """Index the current zones."""
+        self._cells = {}
+        self._unindexed = []
+        self._entity_ids = sorted(self.hass.states.async_entity_ids(DOMAIN))
+
+        for entity_id in self._entity_ids:
+            zone = self.hass.states.get(entity_id)
+            cells = None
+            try:
+                cells = _cells_around(
+                    float(zone.attributes[ATTR_LATITUDE]),  # type: ignore
+                    float(zone.attributes[ATTR_LONGITUDE]),  # type: ignore
+                    float(zone.attributes[ATTR_RADIUS]),  # type: ignore
+                )
+            except (KeyError, TypeError, ValueError):
+                pass
+
+            if cells is None:
+                self._unindexed.append(entity_id)
+                continue
+
+            for cell in cells:
+                self._cells.setdefault(cell, []).append(entity_id)
+
+        self._dirty = False
+
+    @callback
+    def async_candidates(
+        self, latitude: float, longitude: float, radius: float = 0
+    ) -> List[str]:
+        """Return the sorted entity IDs of zones a location may be in."""
+        if self._dirty:
+            self._async_rebuild()
+
+        try:
+            cells = _cells_around(latitude, longitude, radius)
+        except TypeError:
+            cells = None
+        if cells is None:
+            return self._entity_ids
+
+        entity_ids: Set[str] = set(self._unindexed)
+        for cell in cells:
+            entity_ids.update(self._cells.get(cell, ()))
+        return sorted(entity_ids)
+
+
+def _cells_around(
+    latitude: float, longitude: float, radius: float
+) -> Optional[List[_Cell]]:
+    """Return the cells of the box around a circle, None if it is too large."""
+    if not radius >= 0:
+        return None
+
+    lat_delta = radius / METERS_PER_DEGREE
+    min_lat = latitude - lat_delta
+    max_lat = latitude + lat_delta
+    if min_lat < -MAX_LATITUDE or max_lat > MAX_LATITUDE:
+        return None
+
+    lon_delta = lat_delta / math.cos(math.radians(max(abs(min_lat), abs(max_lat))))
+    min_lon = longitude - lon_delta
+    max_lon = longitude + lon_delta
+    if min_lon < -180 or max_lon > 180:
+        return None
+
+    lat_cells = range(
+        math.floor(min_lat / CELL_SIZE), math.floor(max_lat / CELL_SIZE) + 1
+    )
+    lon_cells = range(
+        math.floor(min_lon / CELL_SIZE), math.floor(max_lon / CELL_SIZE) + 1
+    )
+    if len(lat_cells) * len(lon_cells) > MAX_CELLS:
+        return None
+
+    return [(lat, lon) for lat in lat_cells for lon in lon_cells]
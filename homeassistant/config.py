@@ -4,8 +4,9 @@ import logging
 import os
 import re
 import shutil
+from time import monotonic
 from types import ModuleType
-from typing import Any, Callable, Dict, Optional, Sequence, Set, Tuple, Union
+from typing import Any, Callable, Dict, Optional, Sequence, Set, Tuple, Union, cast
 
 from awesomeversion import AwesomeVersion
 import voluptuous as vol
@@ -51,6 +52,7 @@ from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import config_per_platform, extract_domain_configs
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entity_values import EntityValues
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.loader import Integration, IntegrationNotFound
 from homeassistant.requirements import (
@@ -60,6 +62,8 @@ from homeassistant.requirements import (
 from homeassistant.util.package import is_docker_env
 from homeassistant.util.unit_system import IMPERIAL_SYSTEM, METRIC_SYSTEM
 from homeassistant.util.yaml import SECRET_YAML, load_yaml
+from homeassistant.util.yaml.loader import track_dependencies
+from homeassistant.util.yaml.snapshot import dump_snapshot, load_snapshot
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -68,6 +72,8 @@ RE_YAML_ERROR = re.compile(r"homeassistant\.util\.yaml")
 RE_ASCII = re.compile(r"\033\[[^m]*m")
 YAML_CONFIG_FILE = "configuration.yaml"
 VERSION_FILE = ".HA_VERSION"
+CONFIG_SNAPSHOT_STORAGE_KEY = "core.config_snapshot"
+CONFIG_SNAPSHOT_VERSION = 1
 CONFIG_DIR_NAME = ".homeassistant"
 DATA_CUSTOMIZE = "hass_customize"
 
@@ -318,15 +324,89 @@ async def async_hass_config_yaml(hass: HomeAssistant) -> Dict:
     This function allow a component inside the asyncio loop to reload its
     configuration by itself. Include package merge.
     """
+    start = monotonic()
+    store = Store(hass, CONFIG_SNAPSHOT_VERSION, CONFIG_SNAPSHOT_STORAGE_KEY)
+    try:
+        snapshot = await store.async_load()
+    except (HomeAssistantError, NotImplementedError) as err:
+        _LOGGER.debug("Unable to load configuration snapshot: %s", err)
+        snapshot = None
+
     # Not using async_add_executor_job because this is an internal method.
-    config = await hass.loop.run_in_executor(
-        None, load_yaml_config_file, hass.config.path(YAML_CONFIG_FILE)
+    config, new_snapshot = await hass.loop.run_in_executor(
+        None,
+        load_yaml_config_file_snapshot,
+        hass.config.path(YAML_CONFIG_FILE),
+        snapshot,
     )
+    if new_snapshot is not None:
+        await store.async_save(new_snapshot)
+    loaded = monotonic()
     core_config = config.get(CONF_CORE, {})
     await merge_packages_config(hass, config, core_config.get(CONF_PACKAGES, {}))
+    _LOGGER.info(
+        "Loaded configuration in %.3f seconds (%.3f seconds merging packages)",
+        monotonic() - start,
+        monotonic() - loaded,
+    )
     return config
 
 
+def load_yaml_config_file_snapshot(
+    config_path: str, snapshot: Optional[Dict]
+) -> Tuple[Dict, Optional[Dict]]:
+    """Load a YAML configuration file, from a snapshot if it did not change.
+
+    The snapshot is used as long as none of the included files, secrets or
+    environment variables changed. Returns the configuration and a new
+    snapshot to store, None if the snapshot was used or can't be made.
+
+    This method needs to run in an executor.
+    """
+    start = monotonic()
+    config = _load_config_snapshot(config_path, snapshot)
+    if config is not None:
+        _LOGGER.info(
+            "Loaded %s from snapshot in %.3f seconds",
+            os.path.basename(config_path),
+            monotonic() - start,
+        )
+        return config, None
+
+    with track_dependencies() as dependencies:
+        config = load_yaml_config_file(config_path)
+    _LOGGER.info(
+        "Parsed %d YAML files in %.3f seconds",
+        len(dependencies.files),
+        monotonic() - start,
+    )
+
+    # Configurations that don't come from the file can't be checked for changes
+    if not dependencies.trackable or config_path not in dependencies.files:
+        return config, None
+    try:
+        content = dump_snapshot(config, dependencies)
+    except TypeError as err:
+        _LOGGER.debug("Unable to make configuration snapshot: %s", err)
+        return config, None
+    return config, {"ha_version": __version__, "path": config_path, **content}
+
+
+def _load_config_snapshot(config_path: str, snapshot: Optional[Dict]) -> Optional[Dict]:
+    """Load the configuration from a snapshot if it is current."""
+    if (
+        snapshot is None
+        or snapshot.get("ha_version") != __version__
+        or snapshot.get("path") != config_path
+    ):
+        return None
+    try:
+        return cast(Optional[Dict], load_snapshot(snapshot))
+    except Exception as err:  # pylint: disable=broad-except
+        _LOGGER.debug("Unable to load configuration snapshot: %s", err)
+        return None
+
+
 def load_yaml_config_file(config_path: str) -> Dict[Any, Any]:
     """Parse a YAML configuration file.
 
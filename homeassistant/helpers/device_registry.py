@@ -1,6 +1,7 @@
 """Provide a way to connect entities belonging to one device."""
 from collections import OrderedDict
 import logging
+from operator import itemgetter
 import time
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple, Union, cast
 
@@ -141,7 +142,12 @@ class DeviceRegistry:
     def __init__(self, hass: HomeAssistantType) -> None:
         """Initialize the device registry."""
         self.hass = hass
-        self._store = hass.helpers.storage.Store(STORAGE_VERSION, STORAGE_KEY)
+        self._store = hass.helpers.storage.Store(
+            STORAGE_VERSION,
+            STORAGE_KEY,
+            journal_record_id=itemgetter("id"),
+            storage_format=hass.helpers.storage.STORAGE_FORMAT_COMPACT_JSON,
+        )
         self._clear_index()
         self.hass.bus.async_listen(
             EVENT_CONFIG_ENTRY_DISABLED_BY_UPDATED,
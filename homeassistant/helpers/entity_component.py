@@ -95,11 +95,7 @@ class EntityComponent:
 
     def get_entity(self, entity_id: str) -> Optional[entity.Entity]:
         """Get an entity."""
-        for platform in self._platforms.values():
-            entity_obj = platform.entities.get(entity_id)
-            if entity_obj is not None:
-                return entity_obj
-        return None
+        return self._platforms[self.domain].domain_entities.get(entity_id)
 
     def setup(self, config: ConfigType) -> None:
         """Set up a full entity component.
@@ -3,10 +3,20 @@ from __future__ import annotations
 
 import asyncio
 from contextvars import ContextVar
-from datetime import datetime, timedelta
+from datetime import timedelta
 from logging import Logger
 from types import ModuleType
-from typing import TYPE_CHECKING, Callable, Coroutine, Dict, Iterable, List, Optional
+from typing import (
+    TYPE_CHECKING,
+    Awaitable,
+    Callable,
+    Coroutine,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+)
 
 from homeassistant import config_entries
 from homeassistant.const import ATTR_RESTORED, DEVICE_DEFAULT_NAME
@@ -23,7 +33,8 @@ from homeassistant.helpers.typing import HomeAssistantType
 from homeassistant.util.async_ import run_callback_threadsafe
 
 from .entity_registry import DISABLED_INTEGRATION
-from .event import async_call_later, async_track_time_interval
+from .event import async_call_later
+from .poll_scheduler import PollStats, async_get_poll_scheduler
 
 if TYPE_CHECKING:
     from .entity import Entity
@@ -36,8 +47,13 @@ SLOW_ADD_MIN_TIMEOUT = 500
 
 PLATFORM_NOT_READY_RETRIES = 10
 DATA_ENTITY_PLATFORM = "entity_platform"
+DATA_DOMAIN_ENTITIES = "domain_entities"
 PLATFORM_NOT_READY_BASE_WAIT_TIME = 30  # seconds
 
+BatchServiceHandler = Callable[
+    [List["Entity"], ServiceCall], Awaitable[Iterable["Entity"]]
+]
+
 
 class EntityPlatform:
     """Manage the entities for a single platform."""
@@ -63,17 +79,24 @@ class EntityPlatform:
         self.entity_namespace = entity_namespace
         self.config_entry: Optional[config_entries.ConfigEntry] = None
         self.entities: Dict[str, Entity] = {}  # pylint: disable=used-before-assignment
+        # Entities of all platforms of the domain, by entity_id
+        self.domain_entities: Dict[str, Entity] = hass.data.setdefault(
+            DATA_DOMAIN_ENTITIES, {}
+        ).setdefault(domain, {})
         self._tasks: List[asyncio.Future] = []
         # Stop tracking tasks after setup is completed
         self._setup_complete = False
-        # Method to cancel the state change listener
-        self._async_unsub_polling: Optional[CALLBACK_TYPE] = None
+        # If the entities are polled by the poll scheduler
+        self._polling = False
+        self.poll_stats = PollStats()
         # Method to cancel the retry of setup
         self._async_cancel_retry_setup: Optional[CALLBACK_TYPE] = None
-        self._process_updates: Optional[asyncio.Lock] = None
 
         self.parallel_updates: Optional[asyncio.Semaphore] = None
 
+        # Handlers that call a service on several entities at once
+        self.batch_service_handlers: Dict[Tuple[str, str], BatchServiceHandler] = {}
+
         # Platform is None for the EntityComponent "catch-all" EntityPlatform
         # which powers entity_component.add_entities
         self.parallel_updates_created = platform is None
@@ -330,16 +353,13 @@ class EntityPlatform:
             )
             raise
 
-        if self._async_unsub_polling is not None or not any(
+        if not self._polling and not any(
             entity.should_poll for entity in self.entities.values()
         ):
             return
 
-        self._async_unsub_polling = async_track_time_interval(
-            self.hass,
-            self._update_entity_states,
-            self.scan_interval,
-        )
+        self._polling = True
+        async_get_poll_scheduler(self.hass).async_add_platform(self)
 
     async def _async_add_entity(  # type: ignore[no-untyped-def]
         self, entity, update_before_add, entity_registry, device_registry
@@ -495,6 +515,7 @@ class EntityPlatform:
 
         entity_id = entity.entity_id
         self.entities[entity_id] = entity
+        self.domain_entities[entity_id] = entity
 
         if not restored:
             # Reserve the state in the state machine
@@ -504,7 +525,13 @@ class EntityPlatform:
             # has a chance to finish.
             self.hass.states.async_reserve(entity.entity_id)
 
-        entity.async_on_remove(lambda: self.entities.pop(entity_id))
+        @callback
+        def remove_entity_cb() -> None:
+            """Remove entity from entities list."""
+            self.entities.pop(entity_id)
+            self.domain_entities.pop(entity_id)
+
+        entity.async_on_remove(remove_entity_cb)
 
         await entity.add_to_platform_finish()
 
@@ -524,9 +551,9 @@ class EntityPlatform:
 
         await asyncio.gather(*tasks)
 
-        if self._async_unsub_polling is not None:
-            self._async_unsub_polling()
-            self._async_unsub_polling = None
+        if self._polling:
+            async_get_poll_scheduler(self.hass).async_remove_platform(self)
+            self._polling = False
         self._setup_complete = False
 
     async def async_destroy(self) -> None:
@@ -541,12 +568,12 @@ class EntityPlatform:
         """Remove entity id from platform."""
         await self.entities[entity_id].async_remove()
 
-        # Clean up polling job if no longer needed
-        if self._async_unsub_polling is not None and not any(
+        # Clean up polling if no longer needed
+        if self._polling and not any(
             entity.should_poll for entity in self.entities.values()
         ):
-            self._async_unsub_polling()
-            self._async_unsub_polling = None
+            async_get_poll_scheduler(self.hass).async_remove_platform(self)
+            self._polling = False
 
     async def async_extract_from_service(
         self, service_call: ServiceCall, expand_group: bool = True
@@ -591,34 +618,21 @@ class EntityPlatform:
             self.platform_name, name, handle_service, schema
         )
 
-    async def _update_entity_states(self, now: datetime) -> None:
-        """Update the states of all the polling entities.
-
-        To protect from flooding the executor, we will update async entities
-        in parallel and other entities sequential.
+    @callback
+    def async_register_batch_service_handler(
+        self,
+        name: str,
+        handler: BatchServiceHandler,
+    ) -> None:
+        """Register a handler to call a service on several entities at once.
 
-        This method must be run in the event loop.
+        When a service of the entity domain targets more than one entity of
+        this platform, the handler is called with those entities and the
+        service call instead, for example to send a single group command. It
+        returns the entities it did not handle, the service is then called on
+        them one by one.
         """
-        if self._process_updates is None:
-            self._process_updates = asyncio.Lock()
-        if self._process_updates.locked():
-            self.logger.warning(
-                "Updating %s %s took longer than the scheduled update interval %s",
-                self.platform_name,
-                self.domain,
-                self.scan_interval,
-            )
-            return
-
-        async with self._process_updates:
-            tasks = []
-            for entity in self.entities.values():
-                if not entity.should_poll:
-                    continue
-                tasks.append(entity.async_update_ha_state(True))
-
-            if tasks:
-                await asyncio.gather(*tasks)
+        self.batch_service_handlers[(self.domain, name)] = handler
 
 
 current_platform: ContextVar[Optional[EntityPlatform]] = ContextVar(
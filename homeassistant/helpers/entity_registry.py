@@ -9,6 +9,7 @@ timer.
 """
 from collections import OrderedDict
 import logging
+from operator import itemgetter
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -154,7 +155,12 @@ class EntityRegistry:
         self.hass = hass
         self.entities: Dict[str, RegistryEntry]
         self._index: Dict[Tuple[str, str, str], str] = {}
-        self._store = hass.helpers.storage.Store(STORAGE_VERSION, STORAGE_KEY)
+        self._store = hass.helpers.storage.Store(
+            STORAGE_VERSION,
+            STORAGE_KEY,
+            journal_record_id=itemgetter("entity_id"),
+            storage_format=hass.helpers.storage.STORAGE_FORMAT_COMPACT_JSON,
+        )
         self.hass.bus.async_listen(
             EVENT_DEVICE_REGISTRY_UPDATED, self.async_device_modified
         )
@@ -1,7 +1,7 @@
 """Helper class to implement include/exclude of entities and domains."""
 import fnmatch
 import re
-from typing import Callable, Dict, List, Pattern
+from typing import Callable, Dict, List, Optional, Pattern
 
 import voluptuous as vol
 
@@ -18,8 +18,11 @@ CONF_EXCLUDE_ENTITIES = "exclude_entities"
 
 CONF_ENTITY_GLOBS = "entity_globs"
 
+# Number of entity IDs whose decision is cached by a filter
+MAX_CACHED_DECISIONS = 16384
 
-def convert_filter(config: Dict[str, List[str]]) -> Callable[[str], bool]:
+
+def convert_filter(config: Dict[str, List[str]]) -> "EntityFilter":
     """Convert the filter schema into a filter."""
     filt = generate_filter(
         config[CONF_INCLUDE_DOMAINS],
@@ -29,8 +32,8 @@ def convert_filter(config: Dict[str, List[str]]) -> Callable[[str], bool]:
         config[CONF_INCLUDE_ENTITY_GLOBS],
         config[CONF_EXCLUDE_ENTITY_GLOBS],
     )
-    setattr(filt, "config", config)
-    setattr(filt, "empty_filter", sum(len(val) for val in config.values()) == 0)
+    filt.config = config
+    filt.empty_filter = sum(len(val) for val in config.values()) == 0
     return filt
 
 
@@ -58,7 +61,7 @@ FILTER_SCHEMA = vol.All(BASE_FILTER_SCHEMA, convert_filter)
 
 def convert_include_exclude_filter(
     config: Dict[str, Dict[str, List[str]]]
-) -> Callable[[str], bool]:
+) -> "EntityFilter":
     """Convert the include exclude filter schema into a filter."""
     include = config[CONF_INCLUDE]
     exclude = config[CONF_EXCLUDE]
@@ -72,7 +75,7 @@ def convert_include_exclude_filter(
             CONF_EXCLUDE_ENTITIES: exclude[CONF_ENTITIES],
         }
     )
-    setattr(filt, "config", config)
+    filt.config = config
     return filt
 
 
@@ -102,18 +105,54 @@ INCLUDE_EXCLUDE_FILTER_SCHEMA = vol.All(
 )
 
 
-def _glob_to_re(glob: str) -> Pattern[str]:
-    """Translate and compile glob string into pattern."""
-    return re.compile(fnmatch.translate(glob))
+def _globs_to_re(globs: List[str]) -> Optional[Pattern[str]]:
+    """Translate and compile glob strings into a single pattern."""
+    if not globs:
+        return None
+    return re.compile("|".join(fnmatch.translate(glob) for glob in sorted(set(globs))))
+
+
+def _test_against_pattern(pattern: Optional[Pattern[str]], entity_id: str) -> bool:
+    """Test entity against a pattern, false without a pattern."""
+    return pattern is not None and pattern.match(entity_id) is not None
+
+
+class EntityFilter:
+    """Filter of entity IDs that caches its decisions.
+
+    Integrations filter the entity of every event they see, the rules of a
+    filter are evaluated once per entity ID and the decision is kept. When the
+    cache is full the oldest decision is dropped.
+    """
+
+    def __init__(self, decide: Callable[[str], bool]) -> None:
+        """Initialize the filter."""
+        self.config: dict = {}
+        self.empty_filter = False
+        self.hits = 0
+        self.misses = 0
+        self._decide = decide
+        self._decisions: Dict[str, bool] = {}
 
+    def __call__(self, entity_id: str) -> bool:
+        """Return if an entity passes the filter."""
+        decision = self._decisions.get(entity_id)
+        if decision is not None:
+            self.hits += 1
+            return decision
 
-def _test_against_patterns(patterns: List[Pattern[str]], entity_id: str) -> bool:
-    """Test entity against list of patterns, true if any match."""
-    for pattern in patterns:
-        if pattern.match(entity_id):
-            return True
+        self.misses += 1
+        decision = self._decide(entity_id)
+        if len(self._decisions) >= MAX_CACHED_DECISIONS:
+            del self._decisions[next(iter(self._decisions))]
+        self._decisions[entity_id] = decision
+        return decision
 
-    return False
+    @property
+    def hit_rate(self) -> Optional[float]:
+        """Return the fraction of decisions taken from the cache."""
+        total = self.hits + self.misses
+        return self.hits / total if total else None
 
 
 # It's safe since we don't modify it. And None causes typing warnings
@@ -125,16 +164,35 @@ def generate_filter(
     exclude_entities: List[str],
     include_entity_globs: List[str] = [],
     exclude_entity_globs: List[str] = [],
+) -> EntityFilter:
+    """Return a filter of entities based on the args."""
+    return EntityFilter(
+        _generate_decide(
+            include_domains,
+            include_entities,
+            exclude_domains,
+            exclude_entities,
+            include_entity_globs,
+            exclude_entity_globs,
+        )
+    )
+
+
+def _generate_decide(
+    include_domains: List[str],
+    include_entities: List[str],
+    exclude_domains: List[str],
+    exclude_entities: List[str],
+    include_entity_globs: List[str],
+    exclude_entity_globs: List[str],
 ) -> Callable[[str], bool]:
     """Return a function that will filter entities based on the args."""
     include_d = set(include_domains)
     include_e = set(include_entities)
     exclude_d = set(exclude_domains)
     exclude_e = set(exclude_entities)
-    include_eg_set = set(include_entity_globs)
-    exclude_eg_set = set(exclude_entity_globs)
-    include_eg = list(map(_glob_to_re, include_eg_set))
-    exclude_eg = list(map(_glob_to_re, exclude_eg_set))
+    include_eg = _globs_to_re(include_entity_globs)
+    exclude_eg = _globs_to_re(exclude_entity_globs)
 
     have_exclude = bool(exclude_e or exclude_d or exclude_eg)
     have_include = bool(include_e or include_d or include_eg)
@@ -144,7 +202,7 @@ def generate_filter(
         return (
             entity_id in include_e
             or domain in include_d
-            or bool(include_eg and _test_against_patterns(include_eg, entity_id))
+            or _test_against_pattern(include_eg, entity_id)
         )
 
     def entity_excluded(domain: str, entity_id: str) -> bool:
@@ -152,7 +210,7 @@ def generate_filter(
         return (
             entity_id in exclude_e
             or domain in exclude_d
-            or bool(exclude_eg and _test_against_patterns(exclude_eg, entity_id))
+            or _test_against_pattern(exclude_eg, entity_id)
         )
 
     # Case 1 - no includes or excludes - pass all entities
@@ -194,11 +252,9 @@ def generate_filter(
             if domain in include_d:
                 return not (
                     entity_id in exclude_e
-                    or bool(
-                        exclude_eg and _test_against_patterns(exclude_eg, entity_id)
-                    )
+                    or _test_against_pattern(exclude_eg, entity_id)
                 )
-            if _test_against_patterns(include_eg, entity_id):
+            if _test_against_pattern(include_eg, entity_id):
                 return not entity_excluded(domain, entity_id)
             return entity_id in include_e
 
@@ -216,9 +272,7 @@ def generate_filter(
         def entity_filter_4b(entity_id: str) -> bool:
             """Return filter function for case 4b."""
             domain = split_entity_id(entity_id)[0]
-            if domain in exclude_d or (
-                exclude_eg and _test_against_patterns(exclude_eg, entity_id)
-            ):
+            if domain in exclude_d or _test_against_pattern(exclude_eg, entity_id):
                 return entity_id in include_e
             return entity_id not in exclude_e
 
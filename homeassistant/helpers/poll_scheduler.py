@@ -0,0 +1,195 @@
+"""Poll the entities of all entity platforms from a shared scheduler."""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+import heapq
+import time
+from typing import TYPE_CHECKING, Dict, List, Optional, Set, Tuple
+
+from homeassistant.core import CALLBACK_TYPE, HassJob, callback
+from homeassistant.helpers import event
+from homeassistant.helpers.singleton import singleton
+from homeassistant.helpers.typing import HomeAssistantType
+import homeassistant.util.dt as dt_util
+
+if TYPE_CHECKING:
+    from .entity import Entity
+    from .entity_platform import EntityPlatform
+
+DATA_POLL_SCHEDULER = "poll_scheduler"
+
+# Entities polled at the same interval start spread over this part of it
+POLL_SPREAD = 0.25
+POLL_SPREAD_MAX = timedelta(seconds=5)
+# Entities due within this time of each other are polled together
+POLL_RESOLUTION = timedelta(milliseconds=250)
+# Weight of the last update in the average update latency
+LATENCY_SMOOTHING = 0.2
+# Fractional part of the golden ratio, spreads consecutive slots evenly
+_GOLDEN_RATIO = 0.6180339887498949
+
+_PollKey = Tuple["EntityPlatform", str]
+
+
+@dataclass
+class PollStats:
+    """Polling statistics of an entity platform."""
+
+    updates: int = 0
+    # Polls skipped because the previous update of the entity was running
+    overruns: int = 0
+    last_latency: Optional[float] = None
+    average_latency: Optional[float] = None
+    max_latency: float = 0
+
+    @callback
+    def async_record_update(self, latency: float) -> None:
+        """Record the latency of an update."""
+        self.updates += 1
+        self.last_latency = latency
+        self.max_latency = max(self.max_latency, latency)
+        if self.average_latency is None:
+            self.average_latency = latency
+        else:
+            self.average_latency += LATENCY_SMOOTHING * (latency - self.average_latency)
+
+
+@callback
+@singleton(DATA_POLL_SCHEDULER)
+def async_get_poll_scheduler(hass: HomeAssistantType) -> PollScheduler:
+    """Return the poll scheduler."""
+    return PollScheduler(hass)
+
+
+class PollScheduler:
+    """Poll entities of all platforms from a single timer.
+
+    Every entity is polled at the scan interval of its platform, at a phase of
+    its own so entities sharing an interval are spread instead of updating all
+    at the same moment. An entity whose previous update is still running is
+    skipped, platforms keep limiting concurrent updates with PARALLEL_UPDATES.
+    """
+
+    def __init__(self, hass: HomeAssistantType) -> None:
+        """Initialize the scheduler."""
+        self.hass = hass
+        self._due: Dict[_PollKey, datetime] = {}
+        self._queue: List[Tuple[datetime, int, EntityPlatform, str]] = []
+        self._seq = 0
+        self._updating: Set[_PollKey] = set()
+        self._slots: Dict[timedelta, int] = {}
+        self._timer_due: Optional[datetime] = None
+        self._unsub_timer: Optional[CALLBACK_TYPE] = None
+        self._job = HassJob(self._async_poll)
+
+    @callback
+    def async_add_platform(self, platform: EntityPlatform) -> None:
+        """Start polling the entities of a platform that are not polled yet."""
+        now = dt_util.utcnow()
+        interval = platform.scan_interval
+        spread = min(interval * POLL_SPREAD, POLL_SPREAD_MAX)
+
+        for entity_id in platform.entities:
+            key = (platform, entity_id)
+            if key in self._due:
+                continue
+
+            slot = self._slots.get(interval, 0)
+            self._slots[interval] = slot + 1
+            phase = spread * ((slot * _GOLDEN_RATIO) % 1)
+            self._async_schedule(key, now + interval - phase)
+
+        self._async_update_timer()
+
+    @callback
+    def async_remove_platform(self, platform: EntityPlatform) -> None:
+        """Stop polling the entities of a platform."""
+        for key in [key for key in self._due if key[0] is platform]:
+            del self._due[key]
+
+    @callback
+    def async_remove_entity(self, platform: EntityPlatform, entity_id: str) -> None:
+        """Stop polling an entity."""
+        self._due.pop((platform, entity_id), None)
+
+    @callback
+    def _async_schedule(self, key: _PollKey, due: datetime) -> None:
+        """Schedule the next poll of an entity."""
+        self._due[key] = due
+        self._seq += 1
+        heapq.heappush(self._queue, (due, self._seq, *key))
+
+    @callback
+    def _async_update_timer(self) -> None:
+        """Schedule the timer at the next poll that is due."""
+        while self._queue:
+            due, _, platform, entity_id = self._queue[0]
+            if self._due.get((platform, entity_id)) == due:
+                break
+            # Entity was removed or rescheduled
+            heapq.heappop(self._queue)
+        else:
+            if self._unsub_timer is not None:
+                self._unsub_timer()
+                self._unsub_timer = self._timer_due = None
+            return
+
+        if self._timer_due is not None and self._timer_due <= due:
+            return
+
+        if self._unsub_timer is not None:
+            self._unsub_timer()
+        self._timer_due = due
+        self._unsub_timer = event.async_track_point_in_utc_time(
+            self.hass, self._job, due
+        )
+
+    @callback
+    def _async_poll(self, _: datetime) -> None:
+        """Poll the entities that are due."""
+        self._unsub_timer = self._timer_due = None
+        limit = event.time_tracker_utcnow() + POLL_RESOLUTION
+        due_keys = []
+
+        while self._queue and self._queue[0][0] <= limit:
+            due, _, platform, entity_id = heapq.heappop(self._queue)
+            if self._due.get((platform, entity_id)) == due:
+                due_keys.append((platform, entity_id))
+
+        now = dt_util.utcnow()
+
+        for key in due_keys:
+            platform, entity_id = key
+            entity = platform.entities.get(entity_id)
+            if entity is None:
+                del self._due[key]
+                continue
+
+            self._async_schedule(key, now + platform.scan_interval)
+
+            if not entity.should_poll:
+                continue
+
+            if key in self._updating:
+                platform.poll_stats.overruns += 1
+                platform.logger.warning(
+                    "Updating %s took longer than the scheduled update interval %s",
+                    entity_id,
+                    platform.scan_interval,
+                )
+                continue
+
+            self._updating.add(key)
+            self.hass.async_create_task(self._async_update(key, entity))
+
+        self._async_update_timer()
+
+    async def _async_update(self, key: _PollKey, entity: Entity) -> None:
+        """Update an entity and record how long it took."""
+        start = time.monotonic()
+        try:
+            await entity.async_update_ha_state(True)
+        finally:
+            self._updating.discard(key)
+            key[0].poll_stats.async_record_update(time.monotonic() - start)
@@ -0,0 +1,89 @@
+"""Helper to report changes in batches."""
+from logging import Logger
+import time
+from typing import Any, Awaitable, Callable, Dict, Generic, Optional, TypeVar
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+
+T = TypeVar("T")
+
+
+class ReportQueue(Generic[T]):
+    """Collect changes by key and report them together.
+
+    Changes queued within the report window are passed to the function at
+    once, the latest change of a key replaces a queued one. Changes queued
+    while a report is sent go out in the next report.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        logger: Logger,
+        *,
+        window: float,
+        function: Callable[[Dict[str, T]], Awaitable[Any]],
+    ) -> None:
+        """Initialize the queue."""
+        self.hass = hass
+        self.logger = logger
+        self.window = window
+        self.function = function
+        self.pending: Dict[str, T] = {}
+        self.reports = 0
+        # Seconds between queueing the first change of a report and sending it
+        self.last_latency: Optional[float] = None
+        self.max_latency = 0.0
+        self._queued_at: Optional[float] = None
+        self._unsub_report: Optional[CALLBACK_TYPE] = None
+        self._reporting = False
+
+    @callback
+    def async_queue(self, key: str, change: T) -> None:
+        """Queue a change to report."""
+        if self._queued_at is None:
+            self._queued_at = time.monotonic()
+        self.pending[key] = change
+        self._async_schedule_report()
+
+    @callback
+    def async_cancel(self) -> None:
+        """Drop the queued changes."""
+        if self._unsub_report is not None:
+            self._unsub_report()
+            self._unsub_report = None
+        self.pending = {}
+        self._queued_at = None
+
+    @callback
+    def _async_schedule_report(self) -> None:
+        """Schedule a report unless one is scheduled or being sent."""
+        if self._unsub_report is None and not self._reporting:
+            self._unsub_report = async_call_later(
+                self.hass, self.window, self._async_report
+            )
+
+    async def _async_report(self, _now: Any) -> None:
+        """Report the queued changes."""
+        self._unsub_report = None
+        if not self.pending:
+            return
+
+        pending, self.pending = self.pending, {}
+        latency = time.monotonic() - self._queued_at  # type: ignore
+        self._queued_at = None
+        self.reports += 1
+        self.last_latency = latency
+        self.max_latency = max(self.max_latency, latency)
+
+        self.logger.debug(
+            "Reporting %d changes, queued for %.3fs", len(pending), latency
+        )
+        self._reporting = True
+        try:
+            await self.function(pending)
+        finally:
+            self._reporting = False
+            if self.pending:
+                self._async_schedule_report()
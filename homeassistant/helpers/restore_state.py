@@ -4,7 +4,7 @@ from __future__ import annotations
 import asyncio
 from datetime import datetime, timedelta
 import logging
-from typing import Any, Dict, List, Optional, Set, cast
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, cast
 
 from homeassistant.const import EVENT_HOMEASSISTANT_START, EVENT_HOMEASSISTANT_STOP
 from homeassistant.core import (
@@ -20,7 +20,7 @@ from homeassistant.helpers.entity import Entity
 from homeassistant.helpers.event import async_track_time_interval
 from homeassistant.helpers.json import JSONEncoder
 from homeassistant.helpers.singleton import singleton
-from homeassistant.helpers.storage import Store
+from homeassistant.helpers.storage import STORAGE_FORMAT_COMPACT_JSON, Store
 import homeassistant.util.dt as dt_util
 
 DATA_RESTORE_STATE_TASK = "restore_state_task"
@@ -36,6 +36,9 @@ STATE_DUMP_INTERVAL = timedelta(minutes=15)
 # How long should a saved state be preserved if the entity no longer exists
 STATE_EXPIRATION = timedelta(days=7)
 
+# How long the last seen time of an unchanged state is kept when dumping
+STATE_LAST_SEEN_REFRESH = timedelta(days=1)
+
 
 class StoredState:
     """Object to represent a stored state."""
@@ -104,10 +107,17 @@ class RestoreStateData:
         """Initialize the restore state data class."""
         self.hass: HomeAssistant = hass
         self.store: Store = Store(
-            hass, STORAGE_VERSION, STORAGE_KEY, encoder=JSONEncoder
+            hass,
+            STORAGE_VERSION,
+            STORAGE_KEY,
+            encoder=JSONEncoder,
+            journal_record_id=_stored_state_entity_id,
+            storage_format=STORAGE_FORMAT_COMPACT_JSON,
         )
         self.last_states: Dict[str, StoredState] = {}
         self.entity_ids: Set[str] = set()
+        # The state, last seen time and dict of each entity in the last dump
+        self._dumped: Dict[str, Tuple[State, datetime, Dict[str, Any]]] = {}
 
     @callback
     def async_get_stored_states(self) -> List[StoredState]:
@@ -152,15 +162,54 @@ class RestoreStateData:
         return stored_states
 
     async def async_dump_states(self) -> None:
-        """Save the current state machine to storage."""
+        """Save the current state machine to storage.
+
+        Only states that changed since the last dump are converted again, the
+        others reuse their previous representation. Unchanged states keep
+        their last seen time until it is STATE_LAST_SEEN_REFRESH old, so the
+        journal of the store only receives the changed states.
+        """
         _LOGGER.debug("Dumping states")
-        try:
-            await self.store.async_save(
-                [
-                    stored_state.as_dict()
-                    for stored_state in self.async_get_stored_states()
-                ]
+        refresh_time = dt_util.utcnow() - STATE_LAST_SEEN_REFRESH
+        dumped = {}
+        dicts: List[Optional[Dict[str, Any]]] = []
+        changed: List[Tuple[int, StoredState]] = []
+
+        for stored_state in self.async_get_stored_states():
+            state = stored_state.state
+            previous = self._dumped.get(state.entity_id)
+
+            if (
+                previous is not None
+                and previous[0] is state
+                and (
+                    previous[1] == stored_state.last_seen or previous[1] >= refresh_time
+                )
+            ):
+                dumped[state.entity_id] = previous
+                dicts.append(previous[2])
+                continue
+
+            changed.append((len(dicts), stored_state))
+            dicts.append(None)
+
+        _LOGGER.debug("Converting %d of %d states", len(changed), len(dicts))
+        converted = await self.hass.async_add_executor_job(
+            _stored_states_as_dicts, [stored_state for _, stored_state in changed]
+        )
+
+        for (index, stored_state), stored_dict in zip(changed, converted):
+            dicts[index] = stored_dict
+            dumped[stored_state.state.entity_id] = (
+                stored_state.state,
+                stored_state.last_seen,
+                stored_dict,
             )
+
+        self._dumped = dumped
+
+        try:
+            await self.store.async_save(dicts)
         except HomeAssistantError as exc:
             _LOGGER.error("Error saving current states", exc_info=exc)
 
@@ -204,6 +253,18 @@ class RestoreStateData:
         self.entity_ids.remove(entity_id)
 
 
+def _stored_state_entity_id(stored_dict: Dict[str, Any]) -> str:
+    """Return the entity id of a stored state dict."""
+    return cast(str, stored_dict["state"]["entity_id"])
+
+
+def _stored_states_as_dicts(
+    stored_states: Iterable[StoredState],
+) -> List[Dict[str, Any]]:
+    """Return the dict representation of stored states."""
+    return [stored_state.as_dict() for stored_state in stored_states]
+
+
 def _encode(value: Any) -> Any:
     """Little helper to JSON encode a value."""
     try:
@@ -72,6 +72,7 @@ CONF_SERVICE_DATA_TEMPLATE = "data_template"
 _LOGGER = logging.getLogger(__name__)
 
 SERVICE_DESCRIPTION_CACHE = "service_description_cache"
+DATA_TARGET_INDEX = "service_target_index"
 
 
 class ServiceParams(TypedDict):
@@ -344,6 +345,7 @@ async def async_extract_referenced_entity_ids(
         ),
     )
 
+    index = _async_get_target_index(hass, dev_reg, ent_reg)
     picked_devices = set()
 
     if selects_device_ids:
@@ -368,26 +370,85 @@ async def async_extract_referenced_entity_ids(
         for area_id in area_lookup:
             if area_id not in area_reg.areas:
                 selected.missing_areas.add(area_id)
-                continue
 
-        # Find entities tied to an area
-        for entity_entry in ent_reg.entities.values():
-            if entity_entry.area_id in area_lookup:
-                selected.indirectly_referenced.add(entity_entry.entity_id)
+            # Find entities tied to an area
+            selected.indirectly_referenced.update(index.area_entities.get(area_id, ()))
 
-        # Find devices for this area
-        for device_entry in dev_reg.devices.values():
-            if device_entry.area_id in area_lookup:
-                picked_devices.add(device_entry.id)
+            # Find devices for this area
+            picked_devices.update(index.area_devices.get(area_id, ()))
 
-    if not picked_devices:
-        return selected
+    for device_id in picked_devices:
+        selected.indirectly_referenced.update(index.device_entities.get(device_id, ()))
+
+    return selected
+
+
+@dataclasses.dataclass
+class _TargetIndex:
+    """Index of the registries to expand areas and devices to entities."""
+
+    entity_registry: entity_registry.EntityRegistry
+    device_registry: device_registry.DeviceRegistry
+
+    # Entities tied to an area, by area.
+    area_entities: Dict[str, Set[str]] = dataclasses.field(default_factory=dict)
+
+    # Devices tied to an area, by area.
+    area_devices: Dict[str, Set[str]] = dataclasses.field(default_factory=dict)
+
+    # Entities not tied to an area, by device.
+    device_entities: Dict[str, Set[str]] = dataclasses.field(default_factory=dict)
+
+
+@ha.callback
+def _async_get_target_index(
+    hass: HomeAssistantType,
+    dev_reg: device_registry.DeviceRegistry,
+    ent_reg: entity_registry.EntityRegistry,
+) -> _TargetIndex:
+    """Return the index of the registries, building it if it is outdated."""
+    index: Optional[_TargetIndex] = hass.data.get(DATA_TARGET_INDEX)
+
+    if (
+        index is not None
+        and index.entity_registry is ent_reg
+        and index.device_registry is dev_reg
+    ):
+        return index
+
+    if DATA_TARGET_INDEX not in hass.data:
+
+        @ha.callback
+        def _async_clear_index(_event: ha.Event) -> None:
+            """Clear the index when a registry is updated."""
+            hass.data[DATA_TARGET_INDEX] = None
+
+        hass.bus.async_listen(
+            entity_registry.EVENT_ENTITY_REGISTRY_UPDATED, _async_clear_index
+        )
+        hass.bus.async_listen(
+            device_registry.EVENT_DEVICE_REGISTRY_UPDATED, _async_clear_index
+        )
+
+    index = hass.data[DATA_TARGET_INDEX] = _TargetIndex(ent_reg, dev_reg)
 
     for entity_entry in ent_reg.entities.values():
-        if not entity_entry.area_id and entity_entry.device_id in picked_devices:
-            selected.indirectly_referenced.add(entity_entry.entity_id)
+        if entity_entry.area_id:
+            index.area_entities.setdefault(entity_entry.area_id, set()).add(
+                entity_entry.entity_id
+            )
+        elif entity_entry.device_id:
+            index.device_entities.setdefault(entity_entry.device_id, set()).add(
+                entity_entry.entity_id
+            )
 
-    return selected
+    for device_entry in dev_reg.devices.values():
+        if device_entry.area_id:
+            index.area_devices.setdefault(device_entry.area_id, set()).add(
+                device_entry.id
+            )
+
+    return index
 
 
 def _load_services_file(hass: HomeAssistantType, integration: Integration) -> JSON_TYPE:
@@ -555,11 +616,7 @@ async def entity_service_call(
             else:
                 assert all_referenced is not None
                 entity_candidates.extend(
-                    [
-                        entity
-                        for entity in platform.entities.values()
-                        if entity.entity_id in all_referenced
-                    ]
+                    _get_referenced_platform_entities(platform, all_referenced)
                 )
 
     elif target_all_entities:
@@ -579,10 +636,7 @@ async def entity_service_call(
 
         for platform in platforms:
             platform_entities = []
-            for entity in platform.entities.values():
-
-                if entity.entity_id not in all_referenced:
-                    continue
+            for entity in _get_referenced_platform_entities(platform, all_referenced):
 
                 if not entity_perms(entity.entity_id, POLICY_CONTROL):
                     raise Unauthorized(
@@ -627,19 +681,25 @@ async def entity_service_call(
     if not entities:
         return
 
-    done, pending = await asyncio.wait(
-        [
-            asyncio.create_task(
-                entity.async_request_call(
-                    _handle_entity_call(hass, entity, func, data, call.context)
+    single_entities = entities
+
+    if len(entities) > 1:
+        single_entities = await _async_handle_batch_calls(entities, call)
+
+    if single_entities:
+        done, pending = await asyncio.wait(
+            [
+                asyncio.create_task(
+                    entity.async_request_call(
+                        _handle_entity_call(hass, entity, func, data, call.context)
+                    )
                 )
-            )
-            for entity in entities
-        ]
-    )
-    assert not pending
-    for future in done:
-        future.result()  # pop exception if have
+                for entity in single_entities
+            ]
+        )
+        assert not pending
+        for future in done:
+            future.result()  # pop exception if have
 
     tasks = []
 
@@ -659,6 +719,55 @@ async def entity_service_call(
             future.result()  # pop exception if have
 
 
+def _get_referenced_platform_entities(
+    platform: EntityPlatform, referenced: Set[str]
+) -> List[Entity]:
+    """Return the entities of a platform that are referenced."""
+    entities = platform.entities
+
+    if len(referenced) < len(entities):
+        return [
+            entities[entity_id] for entity_id in referenced if entity_id in entities
+        ]
+
+    return [entity for entity in entities.values() if entity.entity_id in referenced]
+
+
+async def _async_handle_batch_calls(
+    entities: List[Entity], call: ha.ServiceCall
+) -> List[Entity]:
+    """Call the service through the batch handlers of the platforms.
+
+    Returns the entities the service still has to be called on.
+    """
+    key = (call.domain, call.service)
+    single_entities = []
+    platform_entities: Dict[EntityPlatform, List[Entity]] = {}
+
+    for entity in entities:
+        if entity.platform is None or key not in entity.platform.batch_service_handlers:
+            single_entities.append(entity)
+        else:
+            platform_entities.setdefault(entity.platform, []).append(entity)
+
+    handlers = []
+
+    for platform, batch in platform_entities.items():
+        if len(batch) == 1:
+            single_entities.extend(batch)
+            continue
+
+        for entity in batch:
+            entity.async_set_context(call.context)
+
+        handlers.append(platform.batch_service_handlers[key](batch, call))
+
+    for unhandled in await asyncio.gather(*handlers):
+        single_entities.extend(unhandled)
+
+    return single_entities
+
+
 async def _handle_entity_call(
     hass: HomeAssistantType,
     entity: Entity,
@@ -29,7 +29,7 @@ The following cases will never be passed to your function:
 from __future__ import annotations
 
 from types import MappingProxyType
-from typing import Any, Callable, Dict, Optional, Tuple, Union
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
 
 from homeassistant.const import STATE_UNAVAILABLE, STATE_UNKNOWN
 from homeassistant.core import HomeAssistant, State, callback
@@ -140,13 +140,48 @@ class SignificantlyChangedChecker:
 
         Extra kwargs are passed to the extra significant checker.
         """
+        return self._async_check(self._async_functions(), new_state, extra_arg)
+
+    @callback
+    def async_check_significant_changes(
+        self, changes: Iterable[Tuple[State, Any]]
+    ) -> List[bool]:
+        """Return for every state and extra arg if it was a significant change.
+
+        The changes are checked in order, as if each was passed to
+        async_is_significant_change.
+        """
+        functions = self._async_functions()
+        return [
+            self._async_check(functions, new_state, extra_arg)
+            for new_state, extra_arg in changes
+        ]
+
+    @callback
+    def _async_functions(self) -> Dict[str, CheckTypeFunc]:
+        """Return the check functions of the integrations."""
+        functions: Optional[Dict[str, CheckTypeFunc]] = self.hass.data.get(
+            DATA_FUNCTIONS
+        )
+
+        if functions is None:
+            raise RuntimeError("Significant Change not initialized")
+
+        return functions
+
+    @callback
+    def _async_check(
+        self, functions: Dict[str, CheckTypeFunc], new_state: State, extra_arg: Any
+    ) -> bool:
+        """Return if this was a significant change."""
+        entity_id = new_state.entity_id
         old_data: Optional[Tuple[State, Any]] = self.last_approved_entities.get(
-            new_state.entity_id
+            entity_id
         )
 
         # First state change is always ok to report
         if old_data is None:
-            self.last_approved_entities[new_state.entity_id] = (new_state, extra_arg)
+            self.last_approved_entities[entity_id] = (new_state, extra_arg)
             return True
 
         old_state, old_extra_arg = old_data
@@ -156,21 +191,14 @@ class SignificantlyChangedChecker:
             if new_state.state == old_state.state:
                 return False
 
-            self.last_approved_entities[new_state.entity_id] = (new_state, extra_arg)
+            self.last_approved_entities[entity_id] = (new_state, extra_arg)
             return True
 
         # If last state was unknown/unavailable, also significant.
         if old_state.state in (STATE_UNKNOWN, STATE_UNAVAILABLE):
-            self.last_approved_entities[new_state.entity_id] = (new_state, extra_arg)
+            self.last_approved_entities[entity_id] = (new_state, extra_arg)
             return True
 
-        functions: Optional[Dict[str, CheckTypeFunc]] = self.hass.data.get(
-            DATA_FUNCTIONS
-        )
-
-        if functions is None:
-            raise RuntimeError("Significant Change not initialized")
-
         check_significantly_changed = functions.get(new_state.domain)
 
         if check_significantly_changed is not None:
@@ -201,8 +229,5 @@ class SignificantlyChangedChecker:
 
         # Result is either True or None.
         # None means the function doesn't know. For now assume it's True
-        self.last_approved_entities[new_state.entity_id] = (
-            new_state,
-            extra_arg,
-        )
+        self.last_approved_entities[entity_id] = (new_state, extra_arg)
         return True
@@ -1,22 +1,104 @@
 """Helper to help store data."""
 import asyncio
+import json
 from json import JSONEncoder
 import logging
+import marshal
 import os
-from typing import Any, Callable, Dict, List, Optional, Type, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, Union
 
 from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE
 from homeassistant.core import CALLBACK_TYPE, CoreState, HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.event import async_call_later
 from homeassistant.loader import bind_hass
 from homeassistant.util import json as json_util
+from homeassistant.util.file import write_file_atomic
 
 # mypy: allow-untyped-calls, allow-untyped-defs, no-warn-return-any
 # mypy: no-check-untyped-defs
 
 STORAGE_DIR = ".storage"
+STORAGE_FORMAT_JSON = "json"
+STORAGE_FORMAT_COMPACT_JSON = "compact_json"
+STORAGE_FORMAT_MARSHAL = "marshal"
+JOURNAL_SUFFIX = ".journal"
+# Compact the journal once it outgrows both this and the snapshot
+JOURNAL_COMPACT_MIN_SIZE = 65536
 _LOGGER = logging.getLogger(__name__)
 
+JournalRecords = Dict[Tuple[str, str], str]
+
+
+class StorageFormat:
+    """Serialize the data of a store to its file."""
+
+    # Appended to the path of the store, formats sharing a suffix must be
+    # able to read each other's files
+    suffix = ""
+
+    def dumps(self, data: Dict, encoder: Optional[Type[JSONEncoder]]) -> bytes:
+        """Serialize the data, raise TypeError if it is not serializable."""
+        raise NotImplementedError
+
+    def loads(self, raw: bytes) -> Dict:
+        """Deserialize the data, raise ValueError if it is invalid."""
+        raise NotImplementedError
+
+
+class JSONStorageFormat(StorageFormat):
+    """Store the data as JSON."""
+
+    def __init__(self, compact: bool) -> None:
+        """Initialize the format."""
+        self.compact = compact
+
+    def dumps(self, data: Dict, encoder: Optional[Type[JSONEncoder]]) -> bytes:
+        """Serialize the data."""
+        return json_util.dumps(data, encoder=encoder, compact=self.compact).encode(
+            "utf-8"
+        )
+
+    def loads(self, raw: bytes) -> Dict:
+        """Deserialize the data."""
+        return json.loads(raw)
+
+
+class MarshalStorageFormat(StorageFormat):
+    """Store the data in the marshal format, which loads a lot faster than JSON.
+
+    The data is converted to what JSON would have loaded before it is
+    marshalled. Marshal data is specific to Python, so the file is only
+    trusted as long as it can be loaded, otherwise the JSON file is used.
+    """
+
+    suffix = ".marshal"
+
+    def dumps(self, data: Dict, encoder: Optional[Type[JSONEncoder]]) -> bytes:
+        """Serialize the data."""
+        return marshal.dumps(
+            json.loads(json.dumps(data, cls=encoder, separators=(",", ":")))
+        )
+
+    def loads(self, raw: bytes) -> Dict:
+        """Deserialize the data."""
+        try:
+            data = marshal.loads(raw)
+        except (EOFError, TypeError) as err:
+            raise ValueError(err) from err
+
+        if not isinstance(data, dict):
+            raise ValueError(f"Unexpected data of type {type(data).__name__}")
+
+        return data
+
+
+STORAGE_FORMATS: Dict[str, StorageFormat] = {
+    STORAGE_FORMAT_JSON: JSONStorageFormat(compact=False),
+    STORAGE_FORMAT_COMPACT_JSON: JSONStorageFormat(compact=True),
+    STORAGE_FORMAT_MARSHAL: MarshalStorageFormat(),
+}
+
 
 @bind_hass
 async def async_migrator(
@@ -72,8 +154,20 @@ class Store:
         private: bool = False,
         *,
         encoder: Optional[Type[JSONEncoder]] = None,
+        journal_record_id: Optional[Callable[[Dict], str]] = None,
+        storage_format: str = STORAGE_FORMAT_JSON,
     ):
-        """Initialize storage class."""
+        """Initialize storage class.
+
+        The storage_format is used to write the data. Data written in another
+        format is loaded as well and replaced on the next write, and if the
+        file of the format can't be read the other formats are tried.
+
+        Passing journal_record_id enables the journal. Each list in the data
+        is then treated as a collection of records identified by calling
+        journal_record_id on them, and saves append only the records that
+        changed to a journal that is compacted into the file from time to time.
+        """
         self.version = version
         self.key = key
         self.hass = hass
@@ -84,12 +178,28 @@ class Store:
         self._write_lock = asyncio.Lock()
         self._load_task: Optional[asyncio.Future] = None
         self._encoder = encoder
+        self._journal_record_id = journal_record_id
+        self._format = STORAGE_FORMATS[storage_format]
+        self._other_formats_removed = False
+        # Encoded records and other data as they are on disk
+        self._journal_records: Optional[JournalRecords] = None
+        self._journal_meta: Optional[str] = None
+        self._journal_generation = 0
+        self._journal_size = 0
+        self._snapshot_size = 0
+        # Total bytes written, to measure the write amplification
+        self.bytes_written = 0
 
     @property
     def path(self):
         """Return the config path."""
         return self.hass.config.path(STORAGE_DIR, self.key)
 
+    @property
+    def journal_path(self):
+        """Return the journal path."""
+        return self.path + JOURNAL_SUFFIX
+
     async def async_load(self) -> Union[Dict, List, None]:
         """Load data.
 
@@ -121,9 +231,7 @@ class Store:
             if "data_func" in data:
                 data["data"] = data.pop("data_func")()
         else:
-            data = await self.hass.async_add_executor_job(
-                json_util.load_json, self.path
-            )
+            data = await self.hass.async_add_executor_job(self._load_data)
 
             if data == {}:
                 return None
@@ -224,13 +332,268 @@ class Store:
             except (json_util.SerializationError, json_util.WriteError) as err:
                 _LOGGER.error("Error writing config for %s: %s", self.key, err)
 
+    def _load_data(self) -> Dict:
+        """Load the data and replay the journal."""
+        data = self._read_data()
+
+        if self._journal_record_id is not None and data:
+            self._journal_generation = data.get("journal", 0)
+            self._replay_journal(data)
+
+        return data
+
+    def _read_data(self) -> Dict:
+        """Read the data file, falling back to the files of other formats."""
+        formats = {self._format.suffix: self._format}
+        for storage_format in STORAGE_FORMATS.values():
+            formats.setdefault(storage_format.suffix, storage_format)
+
+        error: Optional[Exception] = None
+
+        for storage_format in formats.values():
+            path = self.path + storage_format.suffix
+            try:
+                with open(path, "rb") as fdesc:
+                    data = storage_format.loads(fdesc.read())
+            except FileNotFoundError:
+                continue
+            except (OSError, ValueError) as err:
+                _LOGGER.error("Error reading %s: %s", path, err)
+                error = err
+                continue
+
+            if storage_format.suffix != self._format.suffix:
+                _LOGGER.info("Loaded %s from %s", self.key, path)
+
+            return data
+
+        if error is not None:
+            raise HomeAssistantError(error) from error
+
+        _LOGGER.debug("Storage file not found: %s", self.path)
+        return {}
+
+    def _write_file(self, path: str, data: Dict) -> int:
+        """Write the data file in the format of the store and return its size."""
+        try:
+            raw = self._format.dumps(data, self._encoder)
+        except TypeError as error:
+            msg = f"Failed to serialize to JSON: {path}. Bad data at {json_util.format_unserializable_data(json_util.find_paths_unserializable_data(data))}"
+            _LOGGER.error(msg)
+            raise json_util.SerializationError(msg) from error
+
+        path += self._format.suffix
+        _LOGGER.debug("Writing data for %s to %s", self.key, path)
+        write_file_atomic(path, raw, self._private)
+
+        if not self._other_formats_removed:
+            # Files of other formats have been migrated now
+            for suffix in {fmt.suffix for fmt in STORAGE_FORMATS.values()}:
+                if suffix == self._format.suffix:
+                    continue
+                try:
+                    os.unlink(self.path + suffix)
+                except FileNotFoundError:
+                    pass
+                except OSError as err:
+                    _LOGGER.warning("Unable to remove %s: %s", self.path + suffix, err)
+            self._other_formats_removed = True
+
+        return len(raw)
+
+    def _replay_journal(self, data: Dict) -> None:
+        """Apply the journal entries written after the data file."""
+        try:
+            with open(self.journal_path, encoding="utf-8") as fdesc:
+                lines = fdesc.read().splitlines()
+        except FileNotFoundError:
+            return
+        except OSError as err:
+            _LOGGER.error("Error reading journal for %s: %s", self.key, err)
+            return
+
+        entries = []
+        for line in lines:
+            try:
+                entries.append(json.loads(line))
+            except ValueError:
+                # The last entry was not fully written
+                _LOGGER.warning("Ignoring incomplete journal entry for %s", self.key)
+                break
+
+        # A journal of an older generation was already compacted into the file
+        if not entries or entries[0] != {"generation": self._journal_generation}:
+            return
+
+        _LOGGER.debug("Replaying %d journal entries for %s", len(entries), self.key)
+        record_id = self._journal_record_id
+        assert record_id is not None
+        collections = _journal_collections(data["data"])
+        indexes: Dict[str, Dict[str, int]] = {}
+
+        for entry in entries[1:]:
+            action, name, entry_id = entry[:3]
+            if name not in collections:
+                collections[name] = data["data"][name] = []
+            records = collections[name]
+            index = indexes.get(name)
+            if index is None:
+                index = indexes[name] = {
+                    record_id(record): position
+                    for position, record in enumerate(records)
+                }
+
+            position = index.pop(entry_id, None)
+            if action == "del":
+                if position is not None:
+                    records[position] = None
+            elif position is None:
+                index[entry_id] = len(records)
+                records.append(entry[3])
+            else:
+                index[entry_id] = position
+                records[position] = entry[3]
+
+        for name, records in collections.items():
+            if None in records:
+                records[:] = [record for record in records if record is not None]
+
     def _write_data(self, path: str, data: Dict) -> None:
         """Write the data."""
         if not os.path.isdir(os.path.dirname(path)):
             os.makedirs(os.path.dirname(path))
 
-        _LOGGER.debug("Writing data for %s to %s", self.key, path)
-        json_util.save_json(path, data, self._private, encoder=self._encoder)
+        if self._journal_record_id is not None:
+            self._write_journaled_data(path, data)
+            return
+
+        self.bytes_written += self._write_file(path, data)
+
+    def _write_journaled_data(self, path: str, data: Dict) -> None:
+        """Write the changed records to the journal, or compact it."""
+        meta, records = self._encode_journal_records(data)
+
+        if (
+            records is not None
+            and self._journal_records is not None
+            and meta == self._journal_meta
+            and self._journal_size < max(JOURNAL_COMPACT_MIN_SIZE, self._snapshot_size)
+        ):
+            self._append_journal(records)
+            return
+
+        self._journal_generation += 1
+        data["journal"] = self._journal_generation
+
+        self._snapshot_size = self._write_file(path, data)
+
+        try:
+            os.unlink(self.journal_path)
+        except FileNotFoundError:
+            pass
+        except OSError as err:
+            # The journal is ignored anyway since its generation is outdated
+            _LOGGER.warning("Unable to remove journal for %s: %s", self.key, err)
+
+        self.bytes_written += self._snapshot_size
+        self._journal_size = 0
+        self._journal_records = records
+        self._journal_meta = meta
+
+    def _append_journal(self, records: JournalRecords) -> None:
+        """Append the records that changed since the last write."""
+        assert self._journal_records is not None
+        old_records = self._journal_records
+        lines = [
+            f'["set",{json.dumps(name)},{json.dumps(record_id)},{encoded}]\n'
+            for (name, record_id), encoded in records.items()
+            if old_records.get((name, record_id)) != encoded
+        ]
+        lines.extend(
+            f'["del",{json.dumps(name)},{json.dumps(record_id)}]\n'
+            for name, record_id in old_records.keys() - records.keys()
+        )
+
+        if not lines:
+            return
+
+        if not self._journal_size:
+            lines.insert(0, json.dumps({"generation": self._journal_generation}) + "\n")
+
+        journal = "".join(lines).encode("utf-8")
+        _LOGGER.debug(
+            "Writing %d journal entries for %s to %s",
+            len(lines),
+            self.key,
+            self.journal_path,
+        )
+
+        try:
+            fdesc = os.open(
+                self.journal_path,
+                os.O_WRONLY | os.O_APPEND | os.O_CREAT,
+                0o600 if self._private else 0o644,
+            )
+            try:
+                os.write(fdesc, journal)
+            finally:
+                os.close(fdesc)
+        except OSError as error:
+            # Compact on the next write since the journal is in an unknown state
+            self._journal_records = None
+            _LOGGER.exception("Writing journal failed: %s", self.journal_path)
+            raise json_util.WriteError(error) from error
+
+        self._journal_size += len(journal)
+        self.bytes_written += len(journal)
+        self._journal_records = records
+
+    def _encode_journal_records(
+        self, data: Dict
+    ) -> Tuple[str, Optional[JournalRecords]]:
+        """Encode the records of each collection and the other data."""
+        collections = _journal_collections(data["data"])
+        other = {
+            "version": data["version"],
+            "data": {
+                key: value
+                for key, value in data["data"].items()
+                if key not in collections
+            }
+            if isinstance(data["data"], dict)
+            else None,
+        }
+        records: JournalRecords = {}
+        record_id = self._journal_record_id
+        assert record_id is not None
+
+        try:
+            meta = json.dumps(other, cls=self._encoder, sort_keys=True)
+            encoded = {
+                name: [
+                    json.dumps(record, cls=self._encoder, separators=(",", ":"))
+                    for record in collection
+                ]
+                for name, collection in collections.items()
+            }
+        except TypeError as error:
+            msg = f"Failed to serialize to JSON: {self.path}. Bad data at {json_util.format_unserializable_data(json_util.find_paths_unserializable_data(data))}"
+            _LOGGER.error(msg)
+            raise json_util.SerializationError(msg) from error
+
+        try:
+            for name, collection in collections.items():
+                for record, encoded_record in zip(collection, encoded[name]):
+                    records[(name, record_id(record))] = encoded_record
+        except (KeyError, TypeError) as err:
+            _LOGGER.debug("Not journaling %s, record without id: %s", self.key, err)
+            return meta, None
+
+        if len(records) != sum(len(collection) for collection in collections.values()):
+            _LOGGER.debug("Not journaling %s: duplicate record ids", self.key)
+            return meta, None
+
+        return meta, records
 
     async def _async_migrate_func(self, old_version, old_data):
         """Migrate to the new version."""
@@ -240,8 +603,20 @@ class Store:
         """Remove all data."""
         self._async_cleanup_delay_listener()
         self._async_cleanup_final_write_listener()
+        self._journal_records = None
 
-        try:
-            await self.hass.async_add_executor_job(os.unlink, self.path)
-        except FileNotFoundError:
-            pass
+        paths = {self.path + fmt.suffix for fmt in STORAGE_FORMATS.values()}
+        paths.add(self.journal_path)
+
+        for path in paths:
+            try:
+                await self.hass.async_add_executor_job(os.unlink, path)
+            except FileNotFoundError:
+                pass
+
+
+def _journal_collections(data: Union[Dict, List]) -> Dict[str, List]:
+    """Return the lists of records in the data, keyed by name."""
+    if isinstance(data, list):
+        return {"": data}
+    return {key: value for key, value in data.items() if isinstance(value, list)}
@@ -1,9 +1,21 @@
 """Helpers to help coordinate updates."""
 import asyncio
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 import logging
 from time import monotonic
-from typing import Any, Awaitable, Callable, Generic, List, Optional, TypeVar
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Generic,
+    Hashable,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
 import urllib.error
 
 import aiohttp
@@ -12,6 +24,7 @@ import requests
 from homeassistant.const import EVENT_HOMEASSISTANT_STOP
 from homeassistant.core import CALLBACK_TYPE, Event, HassJob, HomeAssistant, callback
 from homeassistant.helpers import entity, event
+from homeassistant.helpers.singleton import singleton
 from homeassistant.util.dt import utcnow
 
 from .debounce import Debouncer
@@ -19,6 +32,11 @@ from .debounce import Debouncer
 REQUEST_REFRESH_DEFAULT_COOLDOWN = 10
 REQUEST_REFRESH_DEFAULT_IMMEDIATE = True
 
+DATA_SHARED_REQUESTS = "update_coordinator_shared_requests"
+# Seconds to skip requests after the first failure, doubled on every failure
+SHARED_REQUEST_BACKOFF_MIN = 10
+SHARED_REQUEST_BACKOFF_MAX = 600
+
 T = TypeVar("T")
 
 # mypy: disallow-any-generics
@@ -28,6 +46,97 @@ class UpdateFailed(Exception):
     """Raised when an update has failed."""
 
 
+@dataclass
+class SharedRequestStats:
+    """Statistics of the requests made for a key."""
+
+    requests: int = 0
+    # Refreshes that waited for a request already in progress
+    coalesced: int = 0
+    # Refreshes answered with a cached response
+    cached: int = 0
+    # Refreshes that failed without a request while backing off
+    backoff: int = 0
+
+    @property
+    def saved(self) -> int:
+        """Return the number of requests saved."""
+        return self.coalesced + self.cached + self.backoff
+
+
+@callback
+@singleton(DATA_SHARED_REQUESTS)
+def async_get_shared_requests(hass: HomeAssistant) -> "SharedRequests":
+    """Return the registry of requests shared between coordinators."""
+    return SharedRequests(hass)
+
+
+class SharedRequests:
+    """Share the requests of coordinators that fetch the same data.
+
+    Coordinators passing the same request key share a single request in
+    progress, responses younger than their cache TTL and a backoff after
+    failed requests.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the shared requests."""
+        self.hass = hass
+        self.stats: Dict[Hashable, SharedRequestStats] = {}
+        self._requests: Dict[Hashable, asyncio.Task] = {}
+        self._responses: Dict[Hashable, Tuple[Any, float]] = {}
+        self._failures: Dict[Hashable, Tuple[int, float]] = {}
+
+    async def async_fetch(
+        self,
+        key: Hashable,
+        fetch: Callable[[], Awaitable[T]],
+        cache_ttl: Optional[timedelta] = None,
+    ) -> T:
+        """Fetch the data for a key, sharing the request with other callers."""
+        stats = self.stats.setdefault(key, SharedRequestStats())
+        now = self.hass.loop.time()
+
+        response = self._responses.get(key)
+        if response is not None:
+            if cache_ttl is not None and now - response[1] < cache_ttl.total_seconds():
+                stats.cached += 1
+                return response[0]  # type: ignore[no-any-return]
+            # Expired, the next response replaces it if it is cached
+            del self._responses[key]
+
+        failures, retry_at = self._failures.get(key, (0, now))
+        if now < retry_at:
+            stats.backoff += 1
+            raise UpdateFailed(
+                f"Skipping request for {retry_at - now:.0f} seconds after "
+                f"{failures} failed requests"
+            )
+
+        request = self._requests.get(key)
+        if request is not None:
+            stats.coalesced += 1
+            return await asyncio.shield(request)  # type: ignore[no-any-return]
+
+        stats.requests += 1
+        request = self._requests[key] = self.hass.async_create_task(fetch())
+        try:
+            data = await asyncio.shield(request)
+        except Exception:
+            backoff = min(
+                SHARED_REQUEST_BACKOFF_MIN * 2 ** failures, SHARED_REQUEST_BACKOFF_MAX
+            )
+            self._failures[key] = (failures + 1, self.hass.loop.time() + backoff)
+            raise
+        finally:
+            del self._requests[key]
+
+        self._failures.pop(key, None)
+        if cache_ttl is not None:
+            self._responses[key] = (data, self.hass.loop.time())
+        return data
+
+
 class DataUpdateCoordinator(Generic[T]):
     """Class to manage fetching data from single endpoint."""
 
@@ -40,13 +149,21 @@ class DataUpdateCoordinator(Generic[T]):
         update_interval: Optional[timedelta] = None,
         update_method: Optional[Callable[[], Awaitable[T]]] = None,
         request_refresh_debouncer: Optional[Debouncer] = None,
+        request_key: Optional[Hashable] = None,
+        cache_ttl: Optional[timedelta] = None,
     ):
-        """Initialize global data updater."""
+        """Initialize global data updater.
+
+        Coordinators fetching the same data, for example from the same
+        account, pass the same request_key to share their requests.
+        """
         self.hass = hass
         self.logger = logger
         self.name = name
         self.update_method = update_method
         self.update_interval = update_interval
+        self.request_key = request_key
+        self.cache_ttl = cache_ttl
 
         self.data: Optional[T] = None
 
@@ -148,7 +265,12 @@ class DataUpdateCoordinator(Generic[T]):
         start = monotonic()
 
         try:
-            self.data = await self._async_update_data()
+            if self.request_key is None:
+                self.data = await self._async_update_data()
+            else:
+                self.data = await async_get_shared_requests(self.hass).async_fetch(
+                    self.request_key, self._async_update_data, self.cache_ttl
+                )
 
         except (asyncio.TimeoutError, requests.exceptions.Timeout):
             if self.last_update_success:
@@ -3,7 +3,7 @@ import argparse
 import asyncio
 import collections
 from contextlib import suppress
-from datetime import datetime
+from datetime import datetime, timedelta
 import json
 import logging
 from timeit import default_timer as timer
@@ -366,6 +366,57 @@ async def filtering_entity_id(hass):
     return timer() - start
 
 
+@benchmark
+async def filtering_many_entity_ids(hass):
+    """Run 1M state changes of 10k entities through entity filter."""
+    config = {
+        "include": {
+            "domains": ["automation", "script", "light", "climate"],
+            "entity_globs": [
+                "binary_sensor.*_contact",
+                "binary_sensor.*_occupancy",
+                "sensor.*_temperature",
+                "sensor.*_humidity",
+                "switch.*_light",
+                "device_tracker.*_phone",
+            ],
+            "entities": [f"sensor.power_{idx}" for idx in range(50)],
+        },
+        "exclude": {
+            "domains": ["sun"],
+            "entity_globs": ["light.*_group", "sensor.*_last_*", "sensor.*_rssi"],
+            "entities": [f"light.bulb_{idx}" for idx in range(20)],
+        },
+    }
+
+    domains = ["automation", "binary_sensor", "light", "sensor", "switch"]
+    suffixes = ["contact", "occupancy", "temperature", "rssi", "light", "group"]
+    entity_ids = [
+        f"{domains[idx % 5]}.device_{idx}_{suffixes[idx % 6]}" for idx in range(10 ** 4)
+    ]
+
+    entities_filter = convert_include_exclude_filter(config)
+    size = len(entity_ids)
+
+    start = timer()
+    for i in range(10 ** 6):
+        entities_filter._decide(  # pylint: disable=protected-access
+            entity_ids[i % size]
+        )
+    uncached_time = timer() - start
+
+    start = timer()
+    for i in range(10 ** 6):
+        entities_filter(entity_ids[i % size])
+    runtime = timer() - start
+
+    print(
+        f"uncached {uncached_time:.2f}s, cached {runtime:.2f}s, "
+        f"hit rate {entities_filter.hit_rate:.3f}"
+    )
+    return runtime
+
+
 @benchmark
 async def valid_entity_id(hass):
     """Run valid entity ID a million times."""
@@ -388,6 +439,577 @@ async def json_serialize_states(hass):
     return timer() - start
 
 
+@benchmark
+async def recorder_contention_default(hass):
+    """Write 10k states while history readers query with the default profile."""
+    return await hass.async_add_executor_job(_recorder_contention, False)
+
+
+@benchmark
+async def recorder_contention_tuned(hass):
+    """Write 10k states while history readers query with the tuned profile."""
+    return await hass.async_add_executor_job(_recorder_contention, True)
+
+
+def _recorder_contention(tuned):
+    # pylint: disable=import-outside-toplevel
+    import tempfile
+    import threading
+
+    from sqlalchemy import create_engine, event as sqlalchemy_event
+    from sqlalchemy.orm import sessionmaker
+    from sqlalchemy.pool import QueuePool
+
+    from homeassistant.components.recorder import SQLITE_READ_POOL_SIZE
+    from homeassistant.components.recorder.models import Base, States
+    from homeassistant.components.recorder.util import (
+        execute_on_connection,
+        setup_connection_for_dialect,
+    )
+
+    readers = 4
+    batches = 200
+    batch_size = 50
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_url = f"sqlite:///{tmpdir}/benchmark.db"
+        first_connection = True
+
+        def setup_connection(dbapi_connection, connection_record):
+            nonlocal first_connection
+            if tuned:
+                setup_connection_for_dialect(
+                    "sqlite", dbapi_connection, first_connection
+                )
+            elif first_connection:
+                execute_on_connection(dbapi_connection, "PRAGMA journal_mode=WAL")
+            first_connection = False
+
+        engine = create_engine(db_url)
+        sqlalchemy_event.listen(engine, "connect", setup_connection)
+        Base.metadata.create_all(engine)
+
+        read_engine = engine
+        if tuned:
+            read_engine = create_engine(
+                db_url,
+                connect_args={"check_same_thread": False},
+                poolclass=QueuePool,
+                pool_size=SQLITE_READ_POOL_SIZE,
+                max_overflow=SQLITE_READ_POOL_SIZE,
+            )
+            sqlalchemy_event.listen(
+                read_engine,
+                "connect",
+                lambda dbapi_connection, _: setup_connection_for_dialect(
+                    "sqlite", dbapi_connection, False, read_only=True
+                ),
+            )
+
+        read_session_factory = sessionmaker(bind=read_engine)
+        done = threading.Event()
+        reads = []
+
+        def reader(idx):
+            while not done.is_set():
+                session = read_session_factory()
+                session.query(States).filter(
+                    States.entity_id == f"sensor.power_{idx}"
+                ).order_by(States.last_updated.desc()).limit(100).all()
+                session.close()
+                reads.append(idx)
+
+        threads = [
+            threading.Thread(target=reader, args=(idx,)) for idx in range(readers)
+        ]
+        for thread in threads:
+            thread.start()
+
+        session = sessionmaker(bind=engine)()
+        session.expire_on_commit = False
+
+        start = timer()
+
+        for batch in range(batches):
+            for idx in range(batch_size):
+                session.add(
+                    States(
+                        domain="sensor",
+                        entity_id=f"sensor.power_{idx}",
+                        state=str(batch),
+                        attributes="{}",
+                    )
+                )
+            session.commit()
+
+        runtime = timer() - start
+
+        done.set()
+        for thread in threads:
+            thread.join()
+        session.close()
+        read_engine.dispose()
+        engine.dispose()
+
+    print(f"Completed {len(reads)} history reads while writing")
+    return runtime
+
+
+@benchmark
+async def prometheus_handle_event(hass):
+    """Run 100k state changes of 1000 sensors through the Prometheus exporter."""
+    metrics, _ = _prometheus_metrics()
+    events = [
+        core.Event(
+            EVENT_STATE_CHANGED,
+            {
+                "new_state": core.State(
+                    f"sensor.power_{idx}",
+                    str(idx),
+                    {
+                        "unit_of_measurement": "W",
+                        "device_class": "power",
+                        "friendly_name": f"Power {idx}",
+                    },
+                )
+            },
+        )
+        for idx in range(1000)
+    ]
+
+    start = timer()
+
+    for _ in range(100):
+        for event in events:
+            metrics.handle_event(event)
+
+    return timer() - start
+
+
+@benchmark
+async def prometheus_scrape(hass):
+    """Scrape 5000 sensors ten times and report the longest event loop stall."""
+    # pylint: disable=import-outside-toplevel
+    from types import SimpleNamespace
+
+    from homeassistant.components import prometheus
+
+    metrics, prometheus_cli = _prometheus_metrics()
+    for idx in range(5000):
+        metrics.handle_event(
+            core.Event(
+                EVENT_STATE_CHANGED,
+                {
+                    "new_state": core.State(
+                        f"sensor.power_{idx}",
+                        str(idx),
+                        {"unit_of_measurement": "W", "friendly_name": f"Power {idx}"},
+                    )
+                },
+            )
+        )
+
+    view = prometheus.PrometheusView(prometheus_cli)
+    request = SimpleNamespace(app={"hass": hass})
+    longest_stall = 0
+    running = True
+
+    async def heartbeat():
+        nonlocal longest_stall
+        last = timer()
+        while running:
+            await asyncio.sleep(0.001)
+            now = timer()
+            longest_stall = max(longest_stall, now - last)
+            last = now
+
+    heartbeat_task = hass.async_create_task(heartbeat())
+    await asyncio.sleep(0)
+
+    start = timer()
+
+    for _ in range(10):
+        await view.get(request)
+
+    runtime = timer() - start
+    running = False
+    await heartbeat_task
+
+    print(f"Longest event loop stall while scraping: {longest_stall:.4f}s")
+    return runtime
+
+
+@benchmark
+async def storage_write_amplification(hass):
+    """Save a 5000 entity registry after 200 single field updates."""
+    return await hass.async_add_executor_job(_storage_write_amplification, hass)
+
+
+def _storage_write_amplification(hass):
+    # pylint: disable=import-outside-toplevel
+    from operator import itemgetter
+    import tempfile
+
+    from homeassistant.helpers.storage import Store
+
+    entities = [
+        {
+            "entity_id": f"sensor.benchmark_{idx}",
+            "unique_id": f"unique_{idx}",
+            "platform": "benchmark",
+            "name": None,
+            "disabled_by": None,
+            "device_id": f"device_{idx // 4}",
+        }
+        for idx in range(5000)
+    ]
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        hass.config.config_dir = tmpdir
+        runtime = 0.0
+
+        for journal_record_id in (None, itemgetter("entity_id")):
+            store = Store(
+                hass, 1, "benchmark.registry", journal_record_id=journal_record_id
+            )
+            start = timer()
+
+            for idx in range(200):
+                entities[idx * 7]["name"] = f"Benchmark {idx}"
+                data = {
+                    "version": 1,
+                    "key": store.key,
+                    "data": {"entities": [dict(entity) for entity in entities]},
+                }
+                store._write_data(store.path, data)  # pylint: disable=protected-access
+
+            runtime = timer() - start
+            print(
+                f"{'Journaled' if journal_record_id else 'Full'} writes: "
+                f"{store.bytes_written / 1024 ** 2:.2f} MiB in {runtime:.4f}s"
+            )
+
+    return runtime
+
+
+@benchmark
+async def storage_formats(hass):
+    """Save and load a 10k entity registry in each storage format."""
+    return await hass.async_add_executor_job(_storage_formats, hass)
+
+
+def _storage_formats(hass):
+    # pylint: disable=import-outside-toplevel
+    import tempfile
+
+    from homeassistant.helpers.storage import STORAGE_FORMATS, Store
+
+    data = {
+        "version": 1,
+        "key": "benchmark.registry",
+        "data": {
+            "entities": [
+                {
+                    "config_entry_id": f"config_entry_{idx // 20}",
+                    "device_id": f"device_{idx // 4}",
+                    "area_id": None,
+                    "unique_id": f"unique_{idx}",
+                    "entity_id": f"sensor.benchmark_{idx}",
+                    "platform": "benchmark",
+                    "name": None,
+                    "icon": None,
+                    "disabled_by": None,
+                    "capabilities": {"state_class": "measurement"},
+                    "supported_features": 0,
+                    "device_class": "temperature",
+                    "unit_of_measurement": "°C",
+                    "original_name": f"Benchmark {idx}",
+                    "original_icon": None,
+                }
+                for idx in range(10000)
+            ]
+        },
+    }
+    runtime = 0.0
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        hass.config.config_dir = tmpdir
+
+        for storage_format in STORAGE_FORMATS:
+            store = Store(hass, 1, "benchmark.registry", storage_format=storage_format)
+            # pylint: disable=protected-access
+            start = timer()
+            for _ in range(10):
+                store._write_data(store.path, data)
+            save_time = (timer() - start) / 10
+
+            start = timer()
+            for _ in range(10):
+                assert store._load_data() == data
+            load_time = (timer() - start) / 10
+            runtime += save_time + load_time
+
+            print(
+                f"{storage_format}: {store.bytes_written / 10 / 1024:.0f} KiB, "
+                f"save {save_time:.4f}s, load {load_time:.4f}s"
+            )
+
+    return runtime
+
+
+@benchmark
+async def service_call_area(hass):
+    """Call a light service 1000 times on an area with 8 of 4800 lights."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.helpers import area_registry, device_registry, entity_registry
+    from homeassistant.helpers.entity import Entity
+    from homeassistant.helpers.entity_component import EntityComponent
+
+    class BenchmarkLight(Entity):
+        """Light that turns off instantly."""
+
+        def __init__(self, entity_id):
+            """Initialize the light."""
+            self.entity_id = entity_id
+            self._state = "on"
+
+        @property
+        def should_poll(self):
+            """Return False, the light is not polled."""
+            return False
+
+        @property
+        def state(self):
+            """Return the state."""
+            return self._state
+
+        async def async_turn_off(self):
+            """Turn the light off."""
+            self._state = "off"
+            self.async_write_ha_state()
+
+    area_reg = area_registry.AreaRegistry(hass)
+    dev_reg = device_registry.DeviceRegistry(hass)
+    ent_reg = entity_registry.EntityRegistry(hass)
+    dev_reg.devices = {}
+    dev_reg.deleted_devices = {}
+    ent_reg.entities = collections.OrderedDict()
+    hass.data[area_registry.DATA_REGISTRY] = area_reg
+    hass.data[device_registry.DATA_REGISTRY] = dev_reg
+    hass.data[entity_registry.DATA_REGISTRY] = ent_reg
+
+    for area in range(600):
+        area_id = f"area_{area}"
+        area_reg.areas[area_id] = area_registry.AreaEntry(area_id, area_id, area_id)
+
+    component = EntityComponent(logging.getLogger(__name__), "light", hass)
+    component.async_register_entity_service("turn_off", {}, "async_turn_off")
+    await component.async_add_entities(
+        [BenchmarkLight(f"light.benchmark_{idx}") for idx in range(4800)]
+    )
+
+    for idx in range(4800):
+        entity_id = f"light.benchmark_{idx}"
+        area_id = f"area_{idx // 8}"
+        device_id = None
+        if idx % 2:
+            # Half of the lights are in the area through their device
+            device_id = f"device_{idx // 4}"
+            dev_reg.devices[device_id] = device_registry.DeviceEntry(
+                id=device_id, area_id=area_id
+            )
+            area_id = None
+        ent_reg.entities[entity_id] = entity_registry.RegistryEntry(
+            entity_id=entity_id,
+            unique_id=str(idx),
+            platform="benchmark",
+            device_id=device_id,
+            area_id=area_id,
+        )
+
+    start = timer()
+
+    for _ in range(1000):
+        await hass.services.async_call(
+            "light", "turn_off", {"area_id": "area_1"}, blocking=True
+        )
+
+    return timer() - start
+
+
+def _prometheus_metrics():
+    """Create Prometheus metrics backed by a private registry."""
+    # pylint: disable=import-outside-toplevel
+    from functools import partial
+    from types import SimpleNamespace
+
+    import prometheus_client
+
+    from homeassistant.components import prometheus
+    from homeassistant.helpers.entity_values import EntityValues
+
+    registry = prometheus_client.CollectorRegistry()
+    prometheus_cli = SimpleNamespace(
+        Counter=partial(prometheus_client.Counter, registry=registry),
+        Gauge=partial(prometheus_client.Gauge, registry=registry),
+        generate_latest=partial(prometheus_client.generate_latest, registry),
+    )
+    metrics = prometheus.PrometheusMetrics(
+        prometheus_cli,
+        lambda entity_id: True,
+        None,
+        "°C",
+        EntityValues(),
+        None,
+        None,
+    )
+    return metrics, prometheus_cli
+
+
+@benchmark
+async def history_preload(hass):
+    """Load the history of 500 sensors at startup, one by one and batched."""
+    return await hass.async_add_executor_job(_history_preload)
+
+
+def _history_preload():
+    # pylint: disable=import-outside-toplevel
+    import tempfile
+
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+
+    from homeassistant.components.recorder.models import Base, States
+    from homeassistant.components.recorder.preload import HistoryRequest, load_requests
+
+    sensors = 500
+    now = dt_util.utcnow()
+    requests = []
+    for idx in range(sensors):
+        entity_id = f"sensor.benchmark_{idx}"
+        # Requests of the filter, statistics and history_stats sensors
+        requests.append(
+            HistoryRequest(entity_id, number_of_states=20, changes_only=True)
+        )
+        requests.append(
+            HistoryRequest(
+                entity_id, start_time=now - timedelta(hours=1), number_of_states=100
+            )
+        )
+        requests.append(
+            HistoryRequest(
+                entity_id,
+                start_time=now - timedelta(hours=2),
+                end_time=now,
+                changes_only=True,
+                include_start_state=True,
+            )
+        )
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        engine = create_engine(f"sqlite:///{tmpdir}/benchmark.db")
+        Base.metadata.create_all(engine)
+        session_factory = sessionmaker(bind=engine)
+
+        session = session_factory()
+        for minute in range(200):
+            time = now - timedelta(minutes=minute)
+            session.add_all(
+                States(
+                    entity_id=f"sensor.benchmark_{idx}",
+                    domain="sensor",
+                    state=str(minute),
+                    attributes="{}",
+                    last_changed=time,
+                    last_updated=time,
+                )
+                for idx in range(sensors)
+            )
+        session.commit()
+        session.close()
+
+        # Each sensor querying its own history with a session of its own
+        start = timer()
+        for request in requests:
+            session = session_factory()
+            query = session.query(States).filter(States.entity_id == request.entity_id)
+            if request.changes_only:
+                query = query.filter(States.last_changed == States.last_updated)
+            if request.start_time is not None:
+                query = query.filter(States.last_updated >= request.start_time)
+            if request.end_time is not None:
+                query = query.filter(States.last_updated < request.end_time)
+            if request.number_of_states is not None:
+                query = query.order_by(States.last_updated.desc()).limit(
+                    request.number_of_states
+                )
+            for row in query:
+                row.to_native(validate_entity_id=False)
+            if request.include_start_state:
+                session.query(States).filter(
+                    States.entity_id == request.entity_id,
+                    States.last_updated < request.start_time,
+                ).order_by(States.last_updated.desc()).limit(1).all()
+            session.close()
+        single_time = timer() - start
+
+        start = timer()
+        session = session_factory()
+        _, queries = load_requests(session, requests)
+        session.close()
+        runtime = timer() - start
+
+    print(
+        f"{len(requests)} requests: one by one {single_time:.2f}s, "
+        f"batched in {queries} queries {runtime:.2f}s"
+    )
+    return runtime
+
+
+@benchmark
+async def statistics_window(hass):
+    """Add 10k samples to a 1000 sample window, recomputed and incrementally."""
+    # pylint: disable=import-outside-toplevel
+    import random
+    import statistics
+
+    from homeassistant.components.statistics.window import StatisticsWindow
+
+    rand = random.Random(42)
+    values = [rand.uniform(-50, 50) for _ in range(10000)]
+    now = dt_util.utcnow()
+
+    samples = collections.deque(maxlen=1000)
+    start = timer()
+    for value in values:
+        samples.append(value)
+        statistics.mean(samples)
+        statistics.median(samples)
+        if len(samples) > 1:
+            statistics.stdev(samples)
+            statistics.variance(samples)
+        sum(samples)
+        min(samples)
+        max(samples)
+    recompute_time = timer() - start
+
+    window = StatisticsWindow(1000)
+    start = timer()
+    for value in values:
+        window.append(value, now)
+        window.mean  # pylint: disable=pointless-statement
+        window.median  # pylint: disable=pointless-statement
+        window.stdev  # pylint: disable=pointless-statement
+        window.variance  # pylint: disable=pointless-statement
+        window.total  # pylint: disable=pointless-statement
+        window.min  # pylint: disable=pointless-statement
+        window.max  # pylint: disable=pointless-statement
+    runtime = timer() - start
+
+    print(f"recompute {recompute_time:.2f}s, incremental {runtime:.2f}s")
+    return runtime
+
+
 def _create_state_changed_event_from_old_new(
     entity_id, event_time_fired, old_state, new_state
 ):
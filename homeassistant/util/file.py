@@ -0,0 +1,47 @@
+"""File utility functions."""
+import logging
+import os
+import tempfile
+from typing import Union
+
+from homeassistant.exceptions import HomeAssistantError
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class WriteError(HomeAssistantError):
+    """Error writing the data."""
+
+
+def write_file_atomic(
+    filename: str, data: Union[str, bytes], private: bool = False
+) -> None:
+    """Write a file atomically by replacing it with a complete temporary file.
+
+    Text is written as UTF-8.
+    """
+    tmp_filename = ""
+    tmp_path = os.path.split(filename)[0]
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    try:
+        # Modern versions of Python tempfile create this file with mode 0o600
+        with tempfile.NamedTemporaryFile(
+            mode="wb", dir=tmp_path, delete=False
+        ) as fdesc:
+            fdesc.write(data)
+            tmp_filename = fdesc.name
+        if not private:
+            os.chmod(tmp_filename, 0o644)
+        os.replace(tmp_filename, filename)
+    except OSError as error:
+        _LOGGER.exception("Saving file failed: %s", filename)
+        raise WriteError(error) from error
+    finally:
+        if os.path.exists(tmp_filename):
+            try:
+                os.remove(tmp_filename)
+            except OSError as err:
+                # If we are cleaning up then something else went wrong, so
+                # we should suppress likely follow-on errors in the cleanup
+                _LOGGER.error("File replacement cleanup failed: %s", err)
@@ -2,12 +2,11 @@
 from collections import deque
 import json
 import logging
-import os
-import tempfile
 from typing import Any, Callable, Dict, List, Optional, Type, Union
 
 from homeassistant.core import Event, State
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.util.file import WriteError, write_file_atomic  # noqa: F401
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -16,10 +15,6 @@ class SerializationError(HomeAssistantError):
     """Error serializing the data to JSON."""
 
 
-class WriteError(HomeAssistantError):
-    """Error writing the data."""
-
-
 def load_json(
     filename: str, default: Union[List, Dict, None] = None
 ) -> Union[List, Dict]:
@@ -48,41 +43,32 @@ def save_json(
     private: bool = False,
     *,
     encoder: Optional[Type[json.JSONEncoder]] = None,
+    compact: bool = False,
 ) -> None:
     """Save JSON data to a file.
 
-    Returns True on success.
+    Pass compact to leave out the indentation and whitespace.
     """
     try:
-        json_data = json.dumps(data, indent=4, cls=encoder)
+        json_data = dumps(data, encoder=encoder, compact=compact)
     except TypeError as error:
         msg = f"Failed to serialize to JSON: {filename}. Bad data at {format_unserializable_data(find_paths_unserializable_data(data))}"
         _LOGGER.error(msg)
         raise SerializationError(msg) from error
 
-    tmp_filename = ""
-    tmp_path = os.path.split(filename)[0]
-    try:
-        # Modern versions of Python tempfile create this file with mode 0o600
-        with tempfile.NamedTemporaryFile(
-            mode="w", encoding="utf-8", dir=tmp_path, delete=False
-        ) as fdesc:
-            fdesc.write(json_data)
-            tmp_filename = fdesc.name
-        if not private:
-            os.chmod(tmp_filename, 0o644)
-        os.replace(tmp_filename, filename)
-    except OSError as error:
-        _LOGGER.exception("Saving JSON file failed: %s", filename)
-        raise WriteError(error) from error
-    finally:
-        if os.path.exists(tmp_filename):
-            try:
-                os.remove(tmp_filename)
-            except OSError as err:
-                # If we are cleaning up then something else went wrong, so
-                # we should suppress likely follow-on errors in the cleanup
-                _LOGGER.error("JSON replacement cleanup failed: %s", err)
+    write_file_atomic(filename, json_data, private)
+
+
+def dumps(
+    data: Any,
+    *,
+    encoder: Optional[Type[json.JSONEncoder]] = None,
+    compact: bool = False,
+) -> str:
+    """Serialize data to JSON, indented unless compact."""
+    if compact:
+        return json.dumps(data, cls=encoder, separators=(",", ":"))
+    return json.dumps(data, indent=4, cls=encoder)
 
 
 def format_unserializable_data(data: Dict[str, Any]) -> str:
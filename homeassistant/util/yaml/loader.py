@@ -1,10 +1,24 @@
 """Custom loader."""
 from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
 import fnmatch
+import hashlib
 import logging
 import os
 import sys
-from typing import Dict, Iterator, List, TextIO, TypeVar, Union, overload
+from typing import (
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    TextIO,
+    Tuple,
+    TypeVar,
+    Union,
+    overload,
+)
 
 import yaml
 
@@ -22,6 +36,125 @@ _LOGGER = logging.getLogger(__name__)
 __SECRET_CACHE: Dict[str, JSON_TYPE] = {}
 
 
+class Dependencies:
+    """Files, directories and environment variables a YAML file depends on."""
+
+    def __init__(self) -> None:
+        """Initialize the dependencies."""
+        # Modification time and size of files, None if missing
+        self.files: Dict[str, Optional[Tuple[int, int]]] = {}
+        # Files found in included directories
+        self.directories: Dict[Tuple[str, str], List[str]] = {}
+        # Hash of environment variables, None if not set
+        self.env: Dict[str, Optional[str]] = {}
+        # Loaded values that come from secrets or environment variables
+        self.references: Dict[int, Tuple[Any, List[str]]] = {}
+        # False if a file was read that can't be checked for changes
+        self.trackable = True
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "Dependencies":
+        """Create dependencies from their dictionary representation."""
+        dependencies = cls()
+        dependencies.files = {
+            fname: None if signature is None else (signature[0], signature[1])
+            for fname, signature in data["files"]
+        }
+        dependencies.directories = {
+            (directory, pattern): files
+            for directory, pattern, files in data["directories"]
+        }
+        dependencies.env = dict(data["env"])
+        return dependencies
+
+    def as_dict(self) -> Dict:
+        """Return a JSON serializable representation of the dependencies."""
+        return {
+            "files": [
+                [fname, None if signature is None else list(signature)]
+                for fname, signature in self.files.items()
+            ],
+            "directories": [
+                [directory, pattern, files]
+                for (directory, pattern), files in self.directories.items()
+            ],
+            "env": self.env,
+        }
+
+    def add_file(self, fname: str) -> None:
+        """Add a file, which may be missing."""
+        self.files[fname] = _file_signature(fname)
+
+    def add_stream(self, stream: TextIO) -> None:
+        """Add a file that was opened."""
+        try:
+            stat = os.fstat(stream.fileno())
+        except (OSError, ValueError):
+            self.trackable = False
+            return
+        self.files[stream.name] = (stat.st_mtime_ns, stat.st_size)
+
+    def add_env(self, name: str, value: Optional[str]) -> None:
+        """Add an environment variable and its value, None if not set."""
+        self.env[name] = _env_signature(value)
+        if value is not None:
+            self.add_reference(value, ["env", name])
+
+    def add_reference(self, value: Any, reference: List[str]) -> None:
+        """Add a loaded value that should not be stored with the YAML."""
+        self.references[id(value)] = (value, reference)
+
+    def is_current(self) -> bool:
+        """Return if none of the dependencies changed."""
+        return (
+            self.trackable
+            and all(
+                _file_signature(fname) == signature
+                for fname, signature in self.files.items()
+            )
+            and all(
+                list(_walk_files(directory, pattern)) == files
+                for (directory, pattern), files in self.directories.items()
+            )
+            and all(
+                _env_signature(os.environ.get(name)) == signature
+                for name, signature in self.env.items()
+            )
+        )
+
+
+_DEPENDENCIES: ContextVar[Optional[Dependencies]] = ContextVar(
+    "yaml_dependencies", default=None
+)
+
+
+@contextmanager
+def track_dependencies() -> Iterator[Dependencies]:
+    """Track the dependencies of the YAML files loaded in the context."""
+    dependencies = Dependencies()
+    token = _DEPENDENCIES.set(dependencies)
+    try:
+        yield dependencies
+    finally:
+        _DEPENDENCIES.reset(token)
+
+
+def _file_signature(fname: str) -> Optional[Tuple[int, int]]:
+    """Return the modification time and size of a file."""
+    try:
+        stat = os.stat(fname)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def _env_signature(value: Optional[str]) -> Optional[str]:
+    """Return a hash of the value of an environment variable."""
+    if value is None:
+        return None
+    return hashlib.sha256(value.encode("utf-8")).hexdigest()
+
+
 def clear_secret_cache() -> None:
     """Clear the secret cache.
 
@@ -45,6 +178,9 @@ def load_yaml(fname: str) -> JSON_TYPE:
     """Load a YAML file."""
     try:
         with open(fname, encoding="utf-8") as conf_file:
+            dependencies = _DEPENDENCIES.get()
+            if dependencies is not None:
+                dependencies.add_stream(conf_file)
             return parse_yaml(conf_file)
     except UnicodeDecodeError as exc:
         _LOGGER.error("Unable to read file %s: %s", fname, exc)
@@ -115,8 +251,17 @@ def _is_file_valid(name: str) -> bool:
     return not name.startswith(".")
 
 
-def _find_files(directory: str, pattern: str) -> Iterator[str]:
+def _find_files(directory: str, pattern: str) -> List[str]:
     """Recursively load files in a directory."""
+    files = list(_walk_files(directory, pattern))
+    dependencies = _DEPENDENCIES.get()
+    if dependencies is not None:
+        dependencies.directories[(directory, pattern)] = files
+    return files
+
+
+def _walk_files(directory: str, pattern: str) -> Iterator[str]:
+    """Recursively find files in a directory."""
     for root, dirs, files in os.walk(directory, topdown=True):
         dirs[:] = [d for d in dirs if _is_file_valid(d)]
         for basename in sorted(files):
@@ -222,12 +367,16 @@ def _construct_seq(loader: SafeLineLoader, node: yaml.nodes.Node) -> JSON_TYPE:
 def _env_var_yaml(loader: SafeLineLoader, node: yaml.nodes.Node) -> str:
     """Load environment variables and embed it into the configuration YAML."""
     args = node.value.split()
+    value = os.environ.get(args[0])
+    dependencies = _DEPENDENCIES.get()
+    if dependencies is not None:
+        dependencies.add_env(args[0], value)
 
+    if value is not None:
+        return value
     # Check for a default value
     if len(args) > 1:
-        return os.getenv(args[0], " ".join(args[1:]))
-    if args[0] in os.environ:
-        return os.environ[args[0]]
+        return " ".join(args[1:])
     _LOGGER.error("Environment variable %s not defined", node.value)
     raise HomeAssistantError(node.value)
 
@@ -235,6 +384,9 @@ def _env_var_yaml(loader: SafeLineLoader, node: yaml.nodes.Node) -> str:
 def _load_secret_yaml(secret_path: str) -> JSON_TYPE:
     """Load the secrets yaml from path."""
     secret_path = os.path.join(secret_path, SECRET_YAML)
+    dependencies = _DEPENDENCIES.get()
+    if dependencies is not None and secret_path not in dependencies.files:
+        dependencies.add_file(secret_path)
     if secret_path in __SECRET_CACHE:
         return __SECRET_CACHE[secret_path]
 
@@ -276,6 +428,11 @@ def secret_yaml(loader: SafeLineLoader, node: yaml.nodes.Node) -> JSON_TYPE:
                 node.value,
                 secret_path,
             )
+            dependencies = _DEPENDENCIES.get()
+            if dependencies is not None:
+                dependencies.add_reference(
+                    secrets[node.value], ["secret", secret_path, node.value]
+                )
             return secrets[node.value]
 
         if secret_path == os.path.dirname(sys.path[0]):
@@ -288,6 +445,14 @@ def secret_yaml(loader: SafeLineLoader, node: yaml.nodes.Node) -> JSON_TYPE:
     raise HomeAssistantError(f"Secret {node.value} not defined")
 
 
+def load_secret(secret_path: str, name: str) -> Any:
+    """Return a secret from the secrets.yaml in a folder."""
+    secrets = _load_secret_yaml(secret_path)
+    if name not in secrets:
+        raise HomeAssistantError(f"Secret {name} not defined")
+    return secrets[name]
+
+
 yaml.SafeLoader.add_constructor("!include", _include_yaml)
 yaml.SafeLoader.add_constructor(
     yaml.resolver.BaseResolver.DEFAULT_MAPPING_TAG, _ordered_dict
@@ -0,0 +1,109 @@
+"""Store loaded YAML as JSON."""
+from collections import OrderedDict
+from datetime import date, datetime
+import os
+from typing import Any, Dict, List, Optional
+
+from .loader import Dependencies, load_secret
+from .objects import Input, NodeListClass, NodeStrClass
+
+
+def dump_snapshot(content: Any, dependencies: Dependencies) -> Dict:
+    """Return a JSON serializable snapshot of loaded YAML.
+
+    Secrets and environment variables are stored as references and are
+    looked up again when the snapshot is loaded.
+
+    Raises TypeError if the YAML contains values that can't be stored.
+    """
+    return {
+        "dependencies": dependencies.as_dict(),
+        "content": _dump(content, dependencies),
+    }
+
+
+def load_snapshot(snapshot: Dict) -> Optional[Any]:
+    """Return the YAML of a snapshot, None if its dependencies changed.
+
+    Raises HomeAssistantError if a secret is no longer defined.
+    """
+    if not Dependencies.from_dict(snapshot["dependencies"]).is_current():
+        return None
+    return _load(snapshot["content"])
+
+
+def _dump(obj: Any, dependencies: Dependencies) -> Any:
+    """Convert a loaded value to JSON."""
+    reference = dependencies.references.get(id(obj))
+    if reference is not None and reference[0] is obj:
+        return reference[1]
+    if obj is None or type(obj) in (bool, int, float, str):
+        return obj
+    # Other values are stored as lists tagged with their type
+    if isinstance(obj, NodeStrClass):
+        return ["str", str(obj), *_node_reference(obj)]
+    if type(obj) in (dict, OrderedDict):
+        return [
+            "dict" if type(obj) is dict else "odict",
+            [
+                [_dump(key, dependencies), _dump(value, dependencies)]
+                for key, value in obj.items()
+            ],
+            *_node_reference(obj),
+        ]
+    if type(obj) in (list, NodeListClass):
+        return [
+            "list" if type(obj) is list else "nodelist",
+            [_dump(item, dependencies) for item in obj],
+            *_node_reference(obj),
+        ]
+    if isinstance(obj, Input):
+        return ["input", obj.name]
+    if isinstance(obj, datetime):
+        return ["datetime", obj.isoformat()]
+    if isinstance(obj, date):
+        return ["date", obj.isoformat()]
+    raise TypeError(f"Unable to store {type(obj).__name__} in a snapshot")
+
+
+def _node_reference(obj: Any) -> List:
+    """Return the file and line a value was loaded from."""
+    return [getattr(obj, "__config_file__", None), getattr(obj, "__line__", None)]
+
+
+def _load(data: Any) -> Any:
+    """Convert JSON back to a loaded value."""
+    if not isinstance(data, list):
+        return data
+    tag = data[0]
+    if tag == "secret":
+        return load_secret(data[1], data[2])
+    if tag == "env":
+        return os.environ[data[1]]
+    if tag == "input":
+        return Input(data[1])
+    if tag == "datetime":
+        return datetime.fromisoformat(data[1])
+    if tag == "date":
+        return date.fromisoformat(data[1])
+
+    obj: Any
+    if tag == "str":
+        obj = NodeStrClass(data[1])
+    elif tag in ("dict", "odict"):
+        obj = (dict if tag == "dict" else OrderedDict)(
+            (_load(key), _load(value)) for key, value in data[1]
+        )
+    elif tag in ("list", "nodelist"):
+        obj = (list if tag == "list" else NodeListClass)(
+            _load(item) for item in data[1]
+        )
+    else:
+        raise ValueError(f"Unknown snapshot value {tag}")
+
+    config_file, line = data[2], data[3]
+    if config_file is not None:
+        setattr(obj, "__config_file__", config_file)
+    if line is not None:
+        setattr(obj, "__line__", line)
+    return obj
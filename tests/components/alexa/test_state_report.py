@@ -1,11 +1,15 @@
 """Test report state."""
+from datetime import timedelta
 from unittest.mock import patch
 
 from homeassistant import core
 from homeassistant.components.alexa import state_report
+from homeassistant.util.dt import utcnow
 
 from . import DEFAULT_CONFIG, TEST_URL
 
+from tests.common import async_fire_time_changed
+
 
 async def test_report_state(hass, aioclient_mock):
     """Test proactive state reports."""
@@ -27,6 +31,7 @@ async def test_report_state(hass, aioclient_mock):
 
     # To trigger event listener
     await hass.async_block_till_done()
+    await _async_report_window_passed(hass)
 
     assert len(aioclient_mock.mock_calls) == 1
     call = aioclient_mock.mock_calls
@@ -73,6 +78,7 @@ async def test_report_state_instance(hass, aioclient_mock):
 
     # To trigger event listener
     await hass.async_block_till_done()
+    await _async_report_window_passed(hass)
 
     assert len(aioclient_mock.mock_calls) == 1
     call = aioclient_mock.mock_calls
@@ -188,6 +194,7 @@ async def test_proactive_mode_filter_states(hass, aioclient_mock):
         {"friendly_name": "Test Contact Sensor", "device_class": "door"},
     )
     await hass.async_block_till_done()
+    await _async_report_window_passed(hass)
     assert len(aioclient_mock.mock_calls) == 1
 
     aioclient_mock.clear_requests()
@@ -260,4 +267,40 @@ async def test_proactive_mode_filter_states(hass, aioclient_mock):
         )
 
         await hass.async_block_till_done()
+        await _async_report_window_passed(hass)
     assert len(aioclient_mock.mock_calls) == 1
+
+
+async def test_report_state_batched(hass, aioclient_mock):
+    """Test changes within the report window are reported once per entity."""
+    aioclient_mock.post(TEST_URL, text="", status=202)
+    unsub = await state_report.async_enable_proactive_mode(hass, DEFAULT_CONFIG)
+
+    for state in ("on", "off", "on"):
+        for idx in range(3):
+            hass.states.async_set(
+                f"binary_sensor.test_contact_{idx}",
+                state,
+                {"friendly_name": "Test Contact Sensor", "device_class": "door"},
+            )
+    await hass.async_block_till_done()
+    assert len(aioclient_mock.mock_calls) == 0
+
+    await _async_report_window_passed(hass)
+    assert len(aioclient_mock.mock_calls) == 3
+    assert sorted(
+        call[2]["event"]["endpoint"]["endpointId"] for call in aioclient_mock.mock_calls
+    ) == [f"binary_sensor#test_contact_{idx}" for idx in range(3)]
+    for call in aioclient_mock.mock_calls:
+        properties = call[2]["event"]["payload"]["change"]["properties"]
+        assert properties[0]["value"] == "DETECTED"
+
+    unsub()
+
+
+async def _async_report_window_passed(hass):
+    """Let the report window pass."""
+    async_fire_time_changed(
+        hass, utcnow() + timedelta(seconds=state_report.REPORT_STATE_WINDOW)
+    )
+    await hass.async_block_till_done()
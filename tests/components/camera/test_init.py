@@ -4,10 +4,16 @@ import base64
 import io
 from unittest.mock import Mock, PropertyMock, mock_open, patch
 
+from aiohttp.streams import StreamReader
 import pytest
 
 from homeassistant.components import camera
-from homeassistant.components.camera.const import DOMAIN, PREF_PRELOAD_STREAM
+from homeassistant.components.camera.broadcast import async_get_broadcaster
+from homeassistant.components.camera.const import (
+    DATA_CAMERA_PREFS,
+    DOMAIN,
+    PREF_PRELOAD_STREAM,
+)
 from homeassistant.components.camera.prefs import CameraEntityPreferences
 from homeassistant.components.websocket_api.const import TYPE_RESULT
 from homeassistant.config import async_process_ha_core_config
@@ -110,6 +116,79 @@ async def test_get_image_fails(hass, image_mock_url):
         await camera.async_get_image(hass, "camera.demo_camera")
 
 
+async def test_get_image_shared(hass, image_mock_url):
+    """Test concurrent image requests share a fetch and honor the TTL."""
+    release = asyncio.Event()
+
+    async def slow_image():
+        await release.wait()
+        return b"Test"
+
+    with patch(
+        "homeassistant.components.demo.camera.DemoCamera.async_camera_image",
+        side_effect=slow_image,
+    ) as mock_image:
+        tasks = [
+            hass.async_create_task(camera.async_get_image(hass, "camera.demo_camera"))
+            for _ in range(3)
+        ]
+        await asyncio.sleep(0)
+        release.set()
+        images = await asyncio.gather(*tasks)
+        assert [image.content for image in images] == [b"Test"] * 3
+        assert mock_image.call_count == 1
+
+        # Without a TTL every new request fetches a new image
+        await camera.async_get_image(hass, "camera.demo_camera")
+        assert mock_image.call_count == 2
+
+        await hass.data[DATA_CAMERA_PREFS].async_update(
+            "camera.demo_camera", still_image_ttl=10
+        )
+        await camera.async_get_image(hass, "camera.demo_camera")
+        assert mock_image.call_count == 2
+
+    entity = hass.data[DOMAIN].get_entity("camera.demo_camera")
+    broadcaster = async_get_broadcaster(hass, entity)
+    assert broadcaster.still_requests == 5
+    assert broadcaster.still_fetches == 2
+
+
+async def test_mjpeg_stream_shared_upstream(hass, hass_client, mock_camera):
+    """Test viewers of an MJPEG stream share one upstream connection."""
+    stream = StreamReader(Mock(_reading_paused=False), limit=2 ** 16)
+    upstream = Mock(
+        headers={"Content-Type": "multipart/x-mixed-replace;boundary=--frame"},
+        content=stream,
+    )
+    client = await hass_client()
+
+    with patch(
+        "homeassistant.components.demo.camera.DemoCamera.async_open_mjpeg_stream",
+        return_value=upstream,
+    ) as mock_open_stream:
+        resp_1 = await client.get("/api/camera_proxy_stream/camera.demo_camera")
+        resp_2 = await client.get("/api/camera_proxy_stream/camera.demo_camera")
+
+    assert mock_open_stream.call_count == 1
+    entity = hass.data[DOMAIN].get_entity("camera.demo_camera")
+    broadcaster = async_get_broadcaster(hass, entity)
+    assert broadcaster.viewers == 2
+
+    stream.feed_data(b"--frame\r\nFrame1\r\n--frame\r\nFrame2\r\n")
+    stream.feed_eof()
+
+    for resp in (resp_1, resp_2):
+        assert resp.status == 200
+        assert resp.headers["Content-Type"].startswith("multipart/x-mixed-replace")
+        assert await resp.read() == b"--frame\r\nFrame1\r\n--frame\r\nFrame2\r\n"
+
+    assert upstream.close.call_count == 1
+    assert broadcaster.upstream_sessions == 1
+    assert broadcaster.downstream_sessions == 2
+    assert broadcaster.viewers == 0
+
+
 async def test_snapshot_service(hass, mock_camera):
     """Test snapshot service."""
     mopen = mock_open()
@@ -236,6 +315,20 @@ async def test_websocket_update_prefs(
         == setup_camera_prefs[PREF_PRELOAD_STREAM]
     )
 
+    await client.send_json(
+        {
+            "id": 9,
+            "type": "camera/update_prefs",
+            "entity_id": "camera.demo_camera",
+            "still_image_ttl": 5,
+        }
+    )
+    response = await client.receive_json()
+
+    assert response["success"]
+    assert response["result"]["still_image_ttl"] == 5
+    assert hass.data[DATA_CAMERA_PREFS].get("camera.demo_camera").still_image_ttl == 5
+
 
 async def test_play_stream_service_no_source(hass, mock_camera, mock_stream):
     """Test camera play_stream service."""
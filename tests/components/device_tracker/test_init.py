@@ -27,6 +27,7 @@ from homeassistant.helpers import discovery
 from homeassistant.helpers.json import JSONEncoder
 from homeassistant.setup import async_setup_component
 import homeassistant.util.dt as dt_util
+from homeassistant.util.yaml import dump
 
 from tests.common import (
     assert_setup_component,
@@ -107,9 +108,20 @@ async def test_reading_yaml_config(hass, yaml_devices):
         picture="http://test.picture",
         icon="mdi:kettle",
     )
-    await hass.async_add_executor_job(
-        legacy.update_config, yaml_devices, dev_id, device
-    )
+    with open(yaml_devices, "w") as out:
+        out.write(
+            dump(
+                {
+                    dev_id: {
+                        "name": device.name,
+                        "mac": device.mac,
+                        "icon": device.icon,
+                        "picture": device.config_picture,
+                        "track": device.track,
+                    }
+                }
+            )
+        )
     assert await async_setup_component(hass, device_tracker.DOMAIN, TEST_PLATFORM)
     config = (await legacy.async_load_config(yaml_devices, hass, device.consider_home))[
         0
@@ -415,8 +427,9 @@ async def test_see_state(hass, yaml_devices):
     common.async_see(hass, **params)
     await hass.async_block_till_done()
 
-    config = await legacy.async_load_config(yaml_devices, hass, timedelta(seconds=0))
-    assert len(config) == 1
+    known_devices = await legacy.async_get_known_devices(hass)
+    assert list(known_devices.devices) == ["example_com"]
+    assert not os.path.isfile(yaml_devices)
 
     state = hass.states.get("device_tracker.example_com")
     attrs = state.attributes
@@ -433,6 +446,77 @@ async def test_see_state(hass, yaml_devices):
     assert attrs["number"] == 1
 
 
+async def test_known_devices_store(hass, hass_storage, yaml_devices):
+    """Test found devices are stored and untracked ones expire."""
+    now = dt_util.utcnow()
+    hass_storage[legacy.STORAGE_KEY] = {
+        "version": legacy.STORAGE_VERSION,
+        "key": legacy.STORAGE_KEY,
+        "data": {
+            "devices": [
+                {
+                    "dev_id": dev_id,
+                    "name": dev_id,
+                    "mac": mac,
+                    "icon": None,
+                    "picture": None,
+                    "track": track,
+                    "last_seen": last_seen.isoformat(),
+                }
+                for dev_id, mac, track, last_seen in (
+                    ("phone", "AA:BB:CC:DD:EE:01", True, now - timedelta(days=90)),
+                    ("guest", "AA:BB:CC:DD:EE:02", False, now),
+                    ("old_guest", "AA:BB:CC:DD:EE:03", False, now - timedelta(days=31)),
+                    ("laptop", "AA:BB:CC:DD:EE:04", True, now),
+                )
+            ]
+        },
+    }
+    with open(yaml_devices, "w") as out:
+        out.write("my_laptop:\n  name: Laptop\n  mac: AA:BB:CC:DD:EE:04\n")
+
+    tracker = await legacy.get_tracker(hass, {})
+    assert sorted(tracker.devices) == ["guest", "my_laptop", "phone"]
+    assert tracker.mac_to_dev["AA:BB:CC:DD:EE:01"].track
+    assert not tracker.mac_to_dev["AA:BB:CC:DD:EE:04"].track
+
+    await tracker.async_see(mac="AA:BB:CC:DD:EE:05", host_name="visitor")
+    await hass.async_block_till_done()
+
+    known_devices = await legacy.async_get_known_devices(hass)
+    assert sorted(known_devices.devices) == ["guest", "laptop", "phone", "visitor"]
+    assert known_devices.devices["visitor"]["mac"] == "AA:BB:CC:DD:EE:05"
+
+    async_fire_time_changed(hass, now + timedelta(seconds=legacy.SAVE_DELAY + 1))
+    await hass.async_block_till_done()
+    stored = hass_storage[legacy.STORAGE_KEY]["data"]["devices"]
+    assert [device["dev_id"] for device in stored] == [
+        "phone",
+        "guest",
+        "laptop",
+        "visitor",
+    ]
+
+
+async def test_known_devices_untracked_notification(hass, hass_storage, yaml_devices):
+    """Test found devices that are not tracked are listed in a notification."""
+    assert await async_setup_component(hass, "persistent_notification", {})
+    tracker = await legacy.get_tracker(
+        hass, {device_tracker.DOMAIN: [{const.CONF_TRACK_NEW: False}]}
+    )
+
+    await tracker.async_see(mac="AA:BB:CC:DD:EE:05", host_name="visitor")
+    await tracker.async_see(dev_id="guest")
+    await hass.async_block_till_done()
+
+    notification = hass.states.get(
+        f"persistent_notification.{legacy.NOTIFICATION_ID_UNTRACKED}"
+    )
+    assert notification is not None
+    message = notification.attributes["message"]
+    assert "- `guest` (MAC: unknown)\n- `visitor` (MAC: AA:BB:CC:DD:EE:05)" in message
+
+
 async def test_see_passive_zone_state(hass, mock_device_tracker_conf):
     """Test that the device tracker sets gps for passive trackers."""
     now = dt_util.utcnow()
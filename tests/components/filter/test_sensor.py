@@ -114,26 +114,22 @@ async def test_chain_history(hass, values, missing=False):
         }
 
     with patch(
-        "homeassistant.components.history.state_changes_during_period",
-        return_value=fake_states,
+        "homeassistant.components.recorder.preload.async_load_history",
+        return_value=fake_states.get("sensor.test_monitored", []),
     ):
-        with patch(
-            "homeassistant.components.history.get_last_state_changes",
-            return_value=fake_states,
-        ):
-            with assert_setup_component(1, "sensor"):
-                assert await async_setup_component(hass, "sensor", config)
-                await hass.async_block_till_done()
+        with assert_setup_component(1, "sensor"):
+            assert await async_setup_component(hass, "sensor", config)
+            await hass.async_block_till_done()
 
-            for value in values:
-                hass.states.async_set(config["sensor"]["entity_id"], value.state)
-                await hass.async_block_till_done()
+        for value in values:
+            hass.states.async_set(config["sensor"]["entity_id"], value.state)
+            await hass.async_block_till_done()
 
-            state = hass.states.get("sensor.test")
-            if missing:
-                assert "18.05" == state.state
-            else:
-                assert "17.05" == state.state
+        state = hass.states.get("sensor.test")
+        if missing:
+            assert "18.05" == state.state
+        else:
+            assert "17.05" == state.state
 
 
 async def test_source_state_none(hass, values):
@@ -232,20 +228,21 @@ async def test_history_time(hass):
         ]
     }
     with patch(
-        "homeassistant.components.history.state_changes_during_period",
-        return_value=fake_states,
-    ):
-        with patch(
-            "homeassistant.components.history.get_last_state_changes",
-            return_value=fake_states,
-        ):
-            with assert_setup_component(1, "sensor"):
-                assert await async_setup_component(hass, "sensor", config)
-                await hass.async_block_till_done()
-
+        "homeassistant.components.recorder.preload.async_load_history",
+        return_value=fake_states.get("sensor.test_monitored", []),
+    ) as load_history:
+        with assert_setup_component(1, "sensor"):
+            assert await async_setup_component(hass, "sensor", config)
             await hass.async_block_till_done()
-            state = hass.states.get("sensor.test")
-            assert "18.0" == state.state
+
+        await hass.async_block_till_done()
+        state = hass.states.get("sensor.test")
+        assert "18.0" == state.state
+
+    # The state at the start of the window is loaded, as it was when the
+    # filter used history.state_changes_during_period.
+    assert load_history.call_count == 1
+    assert load_history.call_args[1]["include_start_state"] is True
 
 
 async def test_setup(hass):
@@ -252,3 +252,32 @@ def test_supported_features_string(caplog):
     )
     assert entity.is_supported() is False
     assert "Entity test.entity_id contains invalid supported_features value invalid"
+
+
+async def test_google_entity_serialize_cache(hass):
+    """Test serialized data is reused until the state changes."""
+    config = MockConfig(hass=hass)
+    await config.async_initialize()
+    hass.states.async_set("light.ceiling", "on", {"brightness": 255})
+
+    entity = helpers.GoogleEntity(hass, config, hass.states.get("light.ceiling"))
+    with patch.object(
+        helpers.trait.OnOffTrait, "query_attributes", return_value={"on": True}
+    ) as mock_query:
+        assert entity.query_serialize() == {"online": True, "on": True}
+        entity = helpers.GoogleEntity(hass, config, hass.states.get("light.ceiling"))
+        assert entity.query_serialize() == {"online": True, "on": True}
+        assert len(mock_query.mock_calls) == 1
+
+        hass.states.async_set("light.ceiling", "off")
+        entity = helpers.GoogleEntity(hass, config, hass.states.get("light.ceiling"))
+        entity.query_serialize()
+        assert len(mock_query.mock_calls) == 2
+
+        config._entity_config = {"light.ceiling": {"room": "Living Room"}}
+        entity.query_serialize()
+        assert len(mock_query.mock_calls) == 3
+
+    hass.states.async_remove("light.ceiling")
+    await hass.async_block_till_done()
+    assert "light.ceiling" not in config._serialize_cache
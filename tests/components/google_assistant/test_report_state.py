@@ -1,4 +1,5 @@
 """Test Google report state."""
+from datetime import timedelta
 from unittest.mock import AsyncMock, patch
 
 from homeassistant.components.google_assistant import error, report_state
@@ -40,6 +41,7 @@ async def test_report_state(hass, caplog, legacy_patchable_time):
     ) as mock_report:
         hass.states.async_set("light.kitchen", "on")
         await hass.async_block_till_done()
+        await _async_report_window_passed(hass)
 
     assert len(mock_report.mock_calls) == 1
     assert mock_report.mock_calls[0][1][0] == {
@@ -58,6 +60,7 @@ async def test_report_state(hass, caplog, legacy_patchable_time):
         # Changed, but serialize is same, so filtered out by extra check
         hass.states.async_set("light.double_report", "off")
         await hass.async_block_till_done()
+        await _async_report_window_passed(hass)
 
         assert len(mock_report.mock_calls) == 1
         assert mock_report.mock_calls[0][1][0] == {
@@ -70,6 +73,7 @@ async def test_report_state(hass, caplog, legacy_patchable_time):
     ) as mock_report:
         hass.states.async_set("switch.ac", "on", {"something": "else"})
         await hass.async_block_till_done()
+        await _async_report_window_passed(hass)
 
     assert len(mock_report.mock_calls) == 0
 
@@ -82,6 +86,7 @@ async def test_report_state(hass, caplog, legacy_patchable_time):
     ):
         hass.states.async_set("light.kitchen", "off")
         await hass.async_block_till_done()
+        await _async_report_window_passed(hass)
 
     assert "Not reporting state for light.kitchen: mock-error"
     assert len(mock_report.mock_calls) == 0
@@ -93,5 +98,42 @@ async def test_report_state(hass, caplog, legacy_patchable_time):
     ) as mock_report:
         hass.states.async_set("light.kitchen", "on")
         await hass.async_block_till_done()
+        await _async_report_window_passed(hass)
 
     assert len(mock_report.mock_calls) == 0
+
+
+async def test_report_state_batched(hass, legacy_patchable_time):
+    """Test states changing together are reported in one request."""
+    hass.states.async_set("light.ceiling", "off")
+
+    with patch.object(
+        BASIC_CONFIG, "async_report_state_all", AsyncMock()
+    ) as mock_report, patch.object(report_state, "INITIAL_REPORT_DELAY", 0):
+        unsub = report_state.async_enable_report_state(hass, BASIC_CONFIG)
+        async_fire_time_changed(hass, utcnow())
+        await hass.async_block_till_done()
+        mock_report.reset_mock()
+
+        for idx in range(30):
+            hass.states.async_set(f"light.scene_{idx}", "on")
+        hass.states.async_set("light.ceiling", "on")
+        hass.states.async_set("light.ceiling", "off")
+        await hass.async_block_till_done()
+        assert len(mock_report.mock_calls) == 0
+
+        await _async_report_window_passed(hass)
+
+    assert len(mock_report.mock_calls) == 1
+    states = mock_report.mock_calls[0][1][0]["devices"]["states"]
+    assert len(states) == 31
+    assert states["light.ceiling"] == {"on": False, "online": True}
+    unsub()
+
+
+async def _async_report_window_passed(hass):
+    """Let the report window pass."""
+    async_fire_time_changed(
+        hass, utcnow() + timedelta(seconds=report_state.REPORT_STATE_WINDOW)
+    )
+    await hass.async_block_till_done()
@@ -1,5 +1,6 @@
 """The test for the History Statistics sensor platform."""
 # pylint: disable=protected-access
+import asyncio
 from datetime import datetime, timedelta
 from os import path
 import unittest
@@ -10,7 +11,10 @@ import pytz
 
 from homeassistant import config as hass_config
 from homeassistant.components.history_stats import DOMAIN
-from homeassistant.components.history_stats.sensor import HistoryStatsSensor
+from homeassistant.components.history_stats.sensor import (
+    HistoryStatsChanges,
+    HistoryStatsSensor,
+)
 from homeassistant.const import SERVICE_RELOAD, STATE_UNKNOWN
 import homeassistant.core as ha
 from homeassistant.helpers.template import Template
@@ -28,6 +32,10 @@ class TestHistoryStatsSensor(unittest.TestCase):
         self.hass = get_test_home_assistant()
         self.addCleanup(self.hass.stop)
 
+    def _update(self, sensor):
+        """Update a sensor in the event loop."""
+        asyncio.run_coroutine_threadsafe(sensor.async_update(), self.hass.loop).result()
+
     def test_setup(self):
         """Test the history statistics sensor setup."""
         self.init_recorder()
@@ -160,14 +168,15 @@ class TestHistoryStatsSensor(unittest.TestCase):
         assert sensor4._type == "ratio"
 
         with patch(
-            "homeassistant.components.history.state_changes_during_period",
-            return_value=fake_states,
+            "homeassistant.components.recorder.preload.async_load_history",
+            side_effect=lambda hass, entity_id, **kwargs: fake_states.get(
+                entity_id, []
+            ),
         ):
-            with patch("homeassistant.components.history.get_state", return_value=None):
-                sensor1.update()
-                sensor2.update()
-                sensor3.update()
-                sensor4.update()
+            self._update(sensor1)
+            self._update(sensor2)
+            self._update(sensor3)
+            self._update(sensor4)
 
         assert sensor1.state == 0.5
         assert sensor2.state is None
@@ -244,20 +253,88 @@ class TestHistoryStatsSensor(unittest.TestCase):
         assert sensor4._type == "ratio"
 
         with patch(
-            "homeassistant.components.history.state_changes_during_period",
-            return_value=fake_states,
+            "homeassistant.components.recorder.preload.async_load_history",
+            side_effect=lambda hass, entity_id, **kwargs: fake_states.get(
+                entity_id, []
+            ),
         ):
-            with patch("homeassistant.components.history.get_state", return_value=None):
-                sensor1.update()
-                sensor2.update()
-                sensor3.update()
-                sensor4.update()
+            self._update(sensor1)
+            self._update(sensor2)
+            self._update(sensor3)
+            self._update(sensor4)
 
         assert sensor1.state == 0.5
         assert sensor2.state is None
         assert sensor3.state == 2
         assert sensor4.state == 50
 
+    def test_measure_incremental(self):
+        """Test the history is loaded once and updated with live changes."""
+        t0 = dt_util.utcnow() - timedelta(minutes=40)
+        t1 = t0 + timedelta(minutes=20)
+
+        # Start     t0        t1        t2        End
+        # |--20min--|--20min--|--10min--|--10min--|
+        # |---off---|---on----|---off---|---on----|
+
+        fake_states = {
+            "binary_sensor.test_id": [
+                ha.State("binary_sensor.test_id", "on", last_changed=t0),
+                ha.State("binary_sensor.test_id", "off", last_changed=t1),
+            ]
+        }
+
+        start = Template("{{ as_timestamp(now()) - 3600 }}", self.hass)
+        end = Template("{{ now() }}", self.hass)
+
+        sensor = HistoryStatsSensor(
+            self.hass, "binary_sensor.test_id", "on", start, end, None, "time", "Test"
+        )
+
+        with patch(
+            "homeassistant.components.recorder.preload.async_load_history",
+            return_value=fake_states["binary_sensor.test_id"],
+        ) as mock_load:
+            self._update(sensor)
+            assert sensor.state == round(20 / 60, 2)
+
+            sensor._live_changes.append(
+                ((dt_util.utcnow() - timedelta(minutes=10)).timestamp(), True)
+            )
+            # Updates within the same second as the last one are skipped
+            sensor._period = (
+                sensor._period[0] - timedelta(seconds=1),
+                sensor._period[1],
+            )
+            self._update(sensor)
+
+        assert mock_load.call_count == 1
+        assert sensor.state == 0.5
+        assert sensor._changes.count == 2
+
+    def test_trim_matches_reload(self):
+        """Test moving the start of the period gives the same as reloading it."""
+        history = [(-50, True), (100, False), (200, True), (250, False)]
+
+        for start in (10, 100, 150, 200, 220, 260):
+            trimmed = HistoryStatsChanges()
+            trimmed.load(0, history)
+            trimmed.trim(start)
+
+            # The recorder returns the state at the start and the later changes
+            start_state = [
+                (change_time, matches)
+                for change_time, matches in history
+                if change_time <= start
+            ][-1:]
+            reloaded = HistoryStatsChanges()
+            reloaded.load(
+                start, start_state + [change for change in history if change[0] > start]
+            )
+
+            assert trimmed.measure(300) == reloaded.measure(300), start
+            assert trimmed.last_matches == reloaded.last_matches, start
+
     def test_wrong_date(self):
         """Test when start or end value is not a timestamp or a date."""
         good = Template("{{ now() }}", self.hass)
@@ -2,6 +2,9 @@
 
 This includes tests for all mock object types.
 """
+import asyncio
+import json
+import threading
 from unittest.mock import Mock, patch
 
 import pytest
@@ -634,3 +637,49 @@ def test_home_driver():
 
     mock_unpair.assert_called_with("client_uuid")
     mock_show_msg.assert_called_with("hass", "entry_id", "title (any)", pin, "X-HM://0")
+
+
+async def test_home_driver_batches_events(hass):
+    """Test events of a loop iteration are sent in one message per controller."""
+    with patch("pyhap.accessory_driver.AccessoryDriver.__init__"):
+        driver = HomeDriver(hass, "entry_id", "name", "title")
+
+    controller_1 = ("192.168.1.2", 1234)
+    controller_2 = ("192.168.1.3", 1234)
+    driver.tid = threading.current_thread()
+    driver.loop = hass.loop
+    driver.aio_stop_event = asyncio.Event()
+    driver.topics = {"2.9": {controller_1, controller_2}, "3.9": {controller_1}}
+    driver.http_server = Mock()
+    driver.http_server.push_event = Mock(side_effect=lambda data, addr: True)
+    driver.async_subscribe_client_topic = Mock()
+
+    driver.publish({"aid": 2, "iid": 9, "value": 1})
+    driver.publish({"aid": 3, "iid": 9, "value": 0})
+    driver.publish({"aid": 4, "iid": 9, "value": 0})
+    driver.publish({"aid": 2, "iid": 9, "value": 0}, controller_2)
+    assert not driver.http_server.push_event.called
+
+    await hass.async_block_till_done()
+
+    sent = {
+        call[1][1]: json.loads(call[1][0])
+        for call in driver.http_server.push_event.mock_calls
+    }
+    assert sent == {
+        controller_1: {
+            "characteristics": [
+                {"aid": 2, "iid": 9, "value": 1},
+                {"aid": 3, "iid": 9, "value": 0},
+                {"aid": 2, "iid": 9, "value": 0},
+            ]
+        },
+        controller_2: {"characteristics": [{"aid": 2, "iid": 9, "value": 1}]},
+    }
+
+    driver.http_server.push_event.side_effect = lambda data, addr: False
+    driver.publish({"aid": 3, "iid": 9, "value": 1})
+    await hass.async_block_till_done()
+    driver.async_subscribe_client_topic.assert_called_once_with(
+        controller_1, "3.9", False
+    )
@@ -225,6 +225,63 @@ async def test_setup_creates_entries_for_accessory_mode_devices(hass):
     assert len(mock_setup_entry.mock_calls) == 5
 
 
+async def test_setup_shards_domains_over_bridges(hass):
+    """Test domains with too many entities for one bridge are split over bridges."""
+    for idx in range(200):
+        hass.states.async_set(f"light.light_{idx}", "on")
+    for idx in range(100):
+        hass.states.async_set(f"switch.switch_{idx}", "on")
+    for idx in range(20):
+        hass.states.async_set(f"fan.fan_{idx}", "on")
+
+    await setup.async_setup_component(hass, "persistent_notification", {})
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": config_entries.SOURCE_USER}
+    )
+    result2 = await hass.config_entries.flow.async_configure(
+        result["flow_id"],
+        {"include_domains": ["fan", "light", "switch"]},
+    )
+    assert result2["step_id"] == "pairing"
+
+    with patch(
+        "homeassistant.components.homekit.config_flow.async_find_next_available_port",
+        side_effect=lambda hass, port: port,
+    ), patch("homeassistant.components.homekit.async_setup", return_value=True), patch(
+        "homeassistant.components.homekit.async_setup_entry",
+        return_value=True,
+    ) as mock_setup_entry:
+        result3 = await hass.config_entries.flow.async_configure(
+            result2["flow_id"],
+            {},
+        )
+        await hass.async_block_till_done()
+
+    assert result3["type"] == data_entry_flow.RESULT_TYPE_CREATE_ENTRY
+    bridge_name = (result3["title"].split(":"))[0]
+    assert result3["data"]["filter"]["include_domains"] == ["light"]
+    assert result3["data"]["port"] == 51828
+    assert len(mock_setup_entry.mock_calls) == 2
+
+    shard = next(
+        entry
+        for entry in hass.config_entries.async_entries(DOMAIN)
+        if entry.data["port"] == 51829
+    )
+    assert shard.data == {
+        "filter": {
+            "exclude_domains": [],
+            "exclude_entities": [],
+            "include_domains": ["switch", "fan"],
+            "include_entities": [],
+        },
+        "exclude_accessory_mode": True,
+        "mode": "bridge",
+        "name": f"{bridge_name} 2",
+        "port": 51829,
+    }
+
+
 async def test_import(hass):
     """Test we can import instance."""
     await setup.async_setup_component(hass, "persistent_notification", {})
@@ -1,6 +1,6 @@
 """Philips Hue lights platform tests."""
 import asyncio
-from unittest.mock import Mock
+from unittest.mock import AsyncMock, Mock
 
 import aiohue
 
@@ -653,6 +653,76 @@ async def test_light_turn_off_service(hass, mock_bridge):
     assert light.state == "off"
 
 
+async def test_lights_turn_off_service_group(hass, mock_bridge):
+    """Test turning off all lights of a group with a group command."""
+    mock_bridge.mock_light_responses.append(LIGHT_RESPONSE)
+    mock_bridge.mock_group_responses.append(GROUP_RESPONSE)
+
+    await setup_bridge(hass, mock_bridge)
+    assert len(mock_bridge.mock_requests) == 2
+
+    updated_light_response = dict(LIGHT_RESPONSE)
+    updated_light_response["1"] = LIGHT_1_OFF
+    mock_bridge.mock_light_responses.append(updated_light_response)
+
+    await hass.services.async_call(
+        "light",
+        "turn_off",
+        {"entity_id": ["light.hue_lamp_1", "light.hue_lamp_2"], "transition": 1},
+        blocking=True,
+    )
+
+    # 1 group request and 1 light update instead of 2 light requests
+    assert len(mock_bridge.mock_requests) == 4
+    assert mock_bridge.mock_requests[2]["path"] == "groups/1/action"
+    assert mock_bridge.mock_requests[2]["json"] == {
+        "on": False,
+        "transitiontime": 10,
+        "alert": "none",
+    }
+
+    light = hass.states.get("light.hue_lamp_1")
+    assert light.state == "off"
+
+
+async def test_lights_turn_off_refreshes_coordinators(hass):
+    """Test the lights and targeted groups are refreshed after a group command."""
+
+    def _light(light_id, coordinator, is_group):
+        return hue_light.HueLight(
+            light=Mock(
+                id=light_id,
+                state={"reachable": True},
+                raw=LIGHT_RAW,
+                colorgamuttype=LIGHT_GAMUT_TYPE,
+                colorgamut=LIGHT_GAMUT,
+            ),
+            coordinator=coordinator,
+            bridge=Mock(),
+            is_group=is_group,
+            supported_features=hue_light.SUPPORT_HUE_EXTENDED,
+            rooms={},
+        )
+
+    light_coordinator = Mock(async_request_refresh=AsyncMock())
+    group_coordinator = Mock(async_request_refresh=AsyncMock())
+    group_entity = _light("1", group_coordinator, True)
+    lights = [_light(light_id, light_coordinator, False) for light_id in ("1", "2")]
+    bridge = Mock(
+        api=Mock(groups={"1": Mock(lights=["1", "2"])}),
+        async_request_call=AsyncMock(),
+    )
+
+    remaining = await hue_light.async_turn_off_lights(
+        bridge, [group_entity, *lights], Mock(data={})
+    )
+
+    assert remaining == [group_entity]
+    assert bridge.async_request_call.call_count == 1
+    light_coordinator.async_request_refresh.assert_called_once()
+    group_coordinator.async_request_refresh.assert_called_once()
+
+
 def test_available():
     """Test available property."""
     light = hue_light.HueLight(
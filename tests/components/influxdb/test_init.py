@@ -3,6 +3,7 @@ from dataclasses import dataclass
 import datetime
 from unittest.mock import MagicMock, Mock, call, patch
 
+from influxdb.line_protocol import make_lines
 import pytest
 
 import homeassistant.components.influxdb as influxdb
@@ -61,18 +62,34 @@ def mock_client_fixture(request):
 def get_mock_call_fixture(request):
     """Get version specific lambda to make write API call mock."""
 
+    def to_lines(body, precision):
+        lines = []
+        for point in body:
+            # Numeric fields are always sent as floats
+            fields = {
+                key: float(value) if type(value) is int else value
+                for key, value in point["fields"].items()
+            }
+            point = {**point, "fields": fields}
+            lines.append(make_lines({"points": [point]}, precision).rstrip("\n"))
+        return lines
+
     def v2_call(body, precision):
-        data = {"bucket": DEFAULT_BUCKET, "record": body}
+        data = {"bucket": DEFAULT_BUCKET, "record": to_lines(body, precision)}
 
         if precision is not None:
             data["write_precision"] = precision
 
         return call(**data)
 
+    def v1_call(body, precision):
+        return call(
+            to_lines(body, precision), time_precision=precision, protocol="line"
+        )
+
     if request.param == influxdb.API_VERSION_2:
         return lambda body, precision=None: v2_call(body, precision)
-    # pylint: disable=unnecessary-lambda
-    return lambda body, precision=None: call(body, time_precision=precision)
+    return lambda body, precision=None: v1_call(body, precision)
 
 
 def _get_write_api_mock_v1(mock_influx_client):
@@ -1521,6 +1538,163 @@ async def test_event_listener_backlog_full(
         assert get_write_api(mock_client).call_count == 0
 
 
+@pytest.mark.parametrize(
+    "mock_client, config_ext, get_write_api, get_mock_call",
+    [
+        (
+            influxdb.DEFAULT_API_VERSION,
+            BASE_V1_CONFIG,
+            _get_write_api_mock_v1,
+            influxdb.DEFAULT_API_VERSION,
+        ),
+        (
+            influxdb.API_VERSION_2,
+            BASE_V2_CONFIG,
+            _get_write_api_mock_v2,
+            influxdb.API_VERSION_2,
+        ),
+    ],
+    indirect=["mock_client", "get_mock_call"],
+)
+async def test_event_listener_spool(
+    hass, caplog, tmp_path, mock_client, config_ext, get_write_api, get_mock_call
+):
+    """Test failed writes are spooled to disk and replayed."""
+    config = {"spool": True, "write_workers": 2}
+    config.update(config_ext)
+    spool_file = str(tmp_path / "influxdb.spool")
+    with patch(f"{INFLUX_PATH}.SPOOL_FILE", spool_file):
+        handler_method = await _setup(hass, mock_client, config, get_write_api)
+
+    state = MagicMock(
+        state=1,
+        domain="fake",
+        entity_id="fake.entity",
+        object_id="entity",
+        attributes={},
+    )
+    event = MagicMock(data={"new_state": state}, time_fired=12345)
+    body = [
+        {
+            "measurement": "fake.entity",
+            "tags": {"domain": "fake", "entity_id": "entity"},
+            "time": 12345,
+            "fields": {"value": 1},
+        }
+    ]
+    instance = hass.data[influxdb.DOMAIN]
+    write_api = get_write_api(mock_client)
+    write_api.side_effect = IOError("foo")
+
+    handler_method(event)
+    instance.block_till_done()
+
+    assert write_api.call_count == 1
+    assert len(instance.spool) == 1
+    assert instance.spooled == 1
+    assert instance.write_errors == 0
+
+    # The live event is written, the replay fails and is spooled again
+    write_api.side_effect = [None, IOError("foo")]
+    handler_method(event)
+    instance.block_till_done()
+
+    assert write_api.call_count == 3
+    assert len(instance.spool) == 1
+    assert instance.spooled == 0
+    assert instance.write_errors == 0
+    assert "Resumed, replaying 1 events spooled while unreachable" in caplog.text
+
+    # The live event is written first, then the spool is replayed
+    write_api.side_effect = None
+    handler_method(event)
+    instance.block_till_done()
+
+    assert write_api.call_count == 5
+    assert write_api.call_args_list[3] == get_mock_call(body)
+    assert write_api.call_args_list[4] == get_mock_call(body)
+    assert len(instance.spool) == 0
+    assert instance.spooled == 0
+    assert instance.write_errors == 0
+    assert "lost" not in caplog.text
+
+
+@pytest.mark.parametrize(
+    "mock_client, config_ext, get_write_api, get_mock_call",
+    [
+        (
+            influxdb.DEFAULT_API_VERSION,
+            BASE_V1_CONFIG,
+            _get_write_api_mock_v1,
+            influxdb.DEFAULT_API_VERSION,
+        ),
+        (
+            influxdb.API_VERSION_2,
+            BASE_V2_CONFIG,
+            _get_write_api_mock_v2,
+            influxdb.API_VERSION_2,
+        ),
+    ],
+    indirect=["mock_client", "get_mock_call"],
+)
+async def test_event_listener_backlog_spooled(
+    hass, tmp_path, mock_client, config_ext, get_write_api, get_mock_call
+):
+    """Test old events are spooled instead of dropped when the spool is enabled."""
+    config = {"spool": True}
+    config.update(config_ext)
+    spool_file = str(tmp_path / "influxdb.spool")
+    with patch(f"{INFLUX_PATH}.SPOOL_FILE", spool_file):
+        handler_method = await _setup(hass, mock_client, config, get_write_api)
+
+    state = MagicMock(
+        state=1,
+        domain="fake",
+        entity_id="entity.id",
+        object_id="entity",
+        attributes={},
+    )
+    event = MagicMock(data={"new_state": state}, time_fired=12345)
+
+    monotonic_time = 0
+
+    def fast_monotonic():
+        """Monotonic time that ticks fast enough to cause a timeout."""
+        nonlocal monotonic_time
+        monotonic_time += 60
+        return monotonic_time
+
+    with patch("homeassistant.components.influxdb.time.monotonic", new=fast_monotonic):
+        handler_method(event)
+        hass.data[influxdb.DOMAIN].block_till_done()
+
+    assert get_write_api(mock_client).call_count == 0
+    assert len(hass.data[influxdb.DOMAIN].spool) == 1
+    assert hass.data[influxdb.DOMAIN].write_errors == 0
+
+
+def test_spool_recovers_interrupted_replay(tmp_path):
+    """Test the spool keeps unwritten lines across restarts and stays bounded."""
+    path = str(tmp_path / "influxdb.spool")
+
+    spool = influxdb.InfluxSpool(path, 3)
+    assert spool.put(["a value=1.0 1", "b value=2.0 1"]) == 2
+    assert spool.take() == ["a value=1.0 1", "b value=2.0 1"]
+    assert spool.take() == []
+    assert len(spool) == 0
+
+    # Restart before the replay finished
+    spool = influxdb.InfluxSpool(path, 3)
+    assert len(spool) == 2
+    assert spool.put(["c value=3.0 1", "d value=4.0 1"]) == 1
+
+    assert spool.take() == ["a value=1.0 1", "b value=2.0 1", "c value=3.0 1"]
+    spool.replay_done()
+
+    spool = influxdb.InfluxSpool(path, 3)
+    assert len(spool) == 0
+
+
 @pytest.mark.parametrize(
     "mock_client, config_ext, get_write_api, get_mock_call",
     [
@@ -1789,3 +1963,55 @@ async def test_precision(
     assert write_api.call_count == 1
     assert write_api.call_args == get_mock_call(body, precision)
     write_api.reset_mock()
+
+
+@pytest.mark.parametrize(
+    "mock_client, config_ext, get_write_api, get_mock_call",
+    [
+        (
+            influxdb.DEFAULT_API_VERSION,
+            BASE_V1_CONFIG,
+            _get_write_api_mock_v1,
+            influxdb.DEFAULT_API_VERSION,
+        ),
+        (
+            influxdb.API_VERSION_2,
+            BASE_V2_CONFIG,
+            _get_write_api_mock_v2,
+            influxdb.API_VERSION_2,
+        ),
+    ],
+    indirect=["mock_client", "get_mock_call"],
+)
+async def test_precision_encodes_timestamp(
+    hass, caplog, mock_client, config_ext, get_write_api, get_mock_call
+):
+    """Test timestamps are encoded in the precision and bad events are skipped."""
+    config = {"precision": "ns"}
+    config.update(config_ext)
+    handler_method = await _setup(hass, mock_client, config, get_write_api)
+
+    state = MagicMock(
+        state=1,
+        domain="fake",
+        entity_id="fake.entity",
+        object_id="entity",
+        attributes={},
+    )
+    time_fired = datetime.datetime(2021, 4, 1, tzinfo=datetime.timezone.utc)
+    handler_method(MagicMock(data={"new_state": state}, time_fired="not a time"))
+    handler_method(MagicMock(data={"new_state": state}, time_fired=time_fired))
+    hass.data[influxdb.DOMAIN].block_till_done()
+
+    body = [
+        {
+            "measurement": "fake.entity",
+            "tags": {"domain": "fake", "entity_id": "entity"},
+            "time": int(time_fired.timestamp()) * 10 ** 9,
+            "fields": {"value": 1},
+        }
+    ]
+    write_api = get_write_api(mock_client)
+    assert write_api.call_count == 1
+    assert write_api.call_args == get_mock_call(body, "ns")
+    assert "Could not encode" in caplog.text
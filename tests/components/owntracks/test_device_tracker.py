@@ -1390,7 +1390,7 @@ def config_context(hass, setup_comp):
     patch_load.start()
 
     patch_save = patch(
-        "homeassistant.components.device_tracker.DeviceTracker.async_update_config"
+        "homeassistant.components.device_tracker.DeviceTracker.async_store_device"
     )
     patch_save.start()
 
@@ -16,7 +16,7 @@ from homeassistant.const import (
     ENERGY_KILO_WATT_HOUR,
     EVENT_STATE_CHANGED,
 )
-from homeassistant.core import split_entity_id
+from homeassistant.core import State, split_entity_id
 from homeassistant.setup import async_setup_component
 from homeassistant.util import dt as dt_util
 
@@ -364,3 +364,89 @@ async def test_filtered_denylist(hass, mock_client):
         was_called = mock_client.labels.call_count == 1
         assert test.should_pass == was_called
         mock_client.labels.reset_mock()
+
+
+def test_memoized_labels_and_sensor_metrics():
+    """Test per entity labels and sensor metrics follow attribute changes."""
+    prometheus_cli = mock.MagicMock()
+    metrics = prometheus.PrometheusMetrics(
+        prometheus_cli,
+        lambda entity_id: True,
+        None,
+        "°C",
+        prometheus.EntityValues({}, {}, {}),
+        None,
+        None,
+    )
+
+    def handle(state, attributes):
+        metrics.handle_event(
+            mock.MagicMock(data={"new_state": State("sensor.power", state, attributes)})
+        )
+
+    handle("10", {"unit_of_measurement": "W", "friendly_name": "Power"})
+    handle("20", {"unit_of_measurement": "W", "friendly_name": "Power"})
+    handle("30", {"unit_of_measurement": "kW", "friendly_name": "Power"})
+    handle("40", {"unit_of_measurement": "kW", "friendly_name": "Plug"})
+
+    gauge_names = [call[0][0] for call in prometheus_cli.Gauge.call_args_list]
+    assert "sensor_unit_w" in gauge_names
+    assert "sensor_unit_kw" in gauge_names
+
+    label_calls = [
+        call[1]["friendly_name"]
+        for call in prometheus_cli.Gauge.return_value.labels.call_args_list
+    ]
+    assert label_calls.count("Plug") == 3
+    # pylint: disable=protected-access
+    assert metrics._labels(State("sensor.power", "1", {"friendly_name": "Plug"})) == {
+        "entity": "sensor.power",
+        "domain": "sensor",
+        "friendly_name": "Plug",
+    }
+
+
+def test_forget_removed_entities():
+    """Test the per entity data is dropped for removed and renamed entities."""
+    metrics = prometheus.PrometheusMetrics(
+        mock.MagicMock(),
+        lambda entity_id: True,
+        None,
+        "°C",
+        prometheus.EntityValues({}, {}, {}),
+        None,
+        None,
+    )
+
+    def handle(entity_id):
+        metrics.handle_event(
+            mock.MagicMock(
+                data={"new_state": State(entity_id, "10", {"unit_of_measurement": "W"})}
+            )
+        )
+
+    handle("sensor.removed")
+    handle("sensor.deleted")
+    handle("sensor.renamed")
+    # pylint: disable=protected-access
+    assert len(metrics._entity_labels) == 3
+    assert len(metrics._entity_sensor_metric) == 3
+
+    metrics.handle_event(
+        mock.MagicMock(data={"entity_id": "sensor.removed", "new_state": None})
+    )
+    metrics.handle_entity_registry_updated(
+        mock.MagicMock(data={"action": "remove", "entity_id": "sensor.deleted"})
+    )
+    metrics.handle_entity_registry_updated(
+        mock.MagicMock(
+            data={
+                "action": "update",
+                "entity_id": "sensor.new_name",
+                "old_entity_id": "sensor.renamed",
+            }
+        )
+    )
+
+    assert metrics._entity_labels == {}
+    assert metrics._entity_sensor_metric == {}
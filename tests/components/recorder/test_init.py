@@ -3,6 +3,7 @@
 from datetime import datetime, timedelta
 from unittest.mock import patch
 
+import pytest
 from sqlalchemy.exc import OperationalError
 
 from homeassistant.components.recorder import (
@@ -13,6 +14,7 @@ from homeassistant.components.recorder import (
     SERVICE_DISABLE,
     SERVICE_ENABLE,
     SERVICE_PURGE,
+    SQLITE_MAINTENANCE_TIME,
     SQLITE_URL_PREFIX,
     Recorder,
     run_information,
@@ -722,3 +724,52 @@ async def test_database_corruption_while_running(hass, tmpdir, caplog):
     hass.bus.async_fire(EVENT_HOMEASSISTANT_STOP)
     await hass.async_block_till_done()
     hass.stop()
+
+
+def test_read_only_session_with_sqlite_file(tmpdir):
+    """Test readers use a separate query only pool for sqlite files."""
+    test_db_file = tmpdir.mkdir("sqlite").join("test_read_only.db")
+    dburl = f"{SQLITE_URL_PREFIX}//{test_db_file}"
+
+    hass = get_test_home_assistant()
+    setup_component(hass, DOMAIN, {DOMAIN: {CONF_DB_URL: dburl}})
+    hass.start()
+    hass.states.set("test.read", "on", {})
+    wait_recording_done(hass)
+
+    instance = hass.data[DATA_INSTANCE]
+    assert instance.read_engine is not None
+    assert instance.read_engine is not instance.engine
+
+    with session_scope(hass=hass, read_only=True) as session:
+        db_states = list(session.query(States))
+        assert len(db_states) == 1
+        assert db_states[0].entity_id == "test.read"
+
+        with pytest.raises(OperationalError):
+            session.execute("DELETE FROM states")
+
+    with session_scope(hass=hass) as session:
+        assert session.execute("PRAGMA query_only").scalar() == 0
+
+    with patch(
+        "homeassistant.components.recorder.run_sqlite_maintenance"
+    ) as maintenance_mock:
+        for _ in range(SQLITE_MAINTENANCE_TIME):
+            fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=1))
+        wait_recording_done(hass)
+
+    assert maintenance_mock.call_count == 1
+
+    hass.stop()
+    assert instance.read_engine is None
+
+
+async def test_in_memory_read_session_shares_engine(hass):
+    """Test in memory databases share the writer session for reads."""
+    await async_init_recorder_component(hass)
+    await hass.async_block_till_done()
+
+    instance = hass.data[DATA_INSTANCE]
+    assert instance.read_engine is None
+    assert instance.get_read_session is instance.get_session
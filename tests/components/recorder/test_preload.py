@@ -0,0 +1,88 @@
+"""The tests for loading the recorded history in batches."""
+import asyncio
+from datetime import timedelta
+from unittest.mock import patch
+
+from homeassistant.components.recorder import preload
+import homeassistant.util.dt as dt_util
+
+from .common import async_wait_recording_done
+
+from tests.common import async_init_recorder_component
+
+
+async def _record_states(hass, start):
+    """Record ten states of two sensors one minute apart."""
+    for minute in range(10):
+        with patch(
+            "homeassistant.core.dt_util.utcnow",
+            return_value=start + timedelta(minutes=minute),
+        ):
+            hass.states.async_set("sensor.one", minute)
+            hass.states.async_set("sensor.two", minute, {"minute": minute})
+            await hass.async_block_till_done()
+        with patch(
+            "homeassistant.core.dt_util.utcnow",
+            return_value=start + timedelta(minutes=minute, seconds=30),
+        ):
+            # Attribute only update
+            hass.states.async_set("sensor.two", minute, {"minute": minute + 0.5})
+            await hass.async_block_till_done()
+
+    await async_wait_recording_done(hass)
+
+
+async def test_load_history(hass):
+    """Test concurrent requests are loaded together."""
+    await async_init_recorder_component(hass)
+    start = dt_util.utcnow() - timedelta(hours=1)
+    await _record_states(hass, start)
+
+    last_three, period, last_changes, missing = await asyncio.gather(
+        preload.async_load_history(hass, "sensor.one", number_of_states=3),
+        preload.async_load_history(
+            hass,
+            "sensor.one",
+            start_time=start + timedelta(minutes=4, seconds=30),
+            end_time=start + timedelta(minutes=7),
+            include_start_state=True,
+        ),
+        preload.async_load_history(
+            hass, "sensor.two", number_of_states=2, changes_only=True
+        ),
+        preload.async_load_history(hass, "sensor.missing", number_of_states=3),
+    )
+
+    assert [state.state for state in last_three] == ["7", "8", "9"]
+    assert [state.state for state in period] == ["4", "5", "6"]
+    assert period[0].last_changed == start + timedelta(minutes=4, seconds=30)
+    assert [state.attributes["minute"] for state in last_changes] == [8, 9]
+    assert missing == []
+
+    preloader = preload.async_get_history_preloader(hass)
+    assert preloader.requests == 4
+    assert preloader.queries == 1
+
+
+async def test_load_history_same_request(hass):
+    """Test identical requests are loaded once."""
+    await async_init_recorder_component(hass)
+    start = dt_util.utcnow() - timedelta(hours=1)
+    await _record_states(hass, start)
+
+    first, second = await asyncio.gather(
+        preload.async_load_history(hass, "sensor.two", number_of_states=4),
+        preload.async_load_history(hass, "sensor.two", number_of_states=4),
+    )
+
+    assert [state.attributes["minute"] for state in first] == [8, 8.5, 9, 9.5]
+    assert first == second
+    assert preload.async_get_history_preloader(hass).requests == 1
+
+
+async def test_load_history_without_recorder(hass):
+    """Test nothing is loaded when the recorder is not set up."""
+    assert (
+        await preload.async_load_history(hass, "sensor.one", number_of_states=3) == []
+    )
+    assert preload.async_get_history_preloader(hass).requests == 0
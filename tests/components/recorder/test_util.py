@@ -259,3 +259,52 @@ def test_combined_checks(hass_recorder, caplog):
     caplog.clear()
     with pytest.raises(sqlite3.DatabaseError):
         util.run_checks_on_open_db("fake_db_path", cursor, True)
+
+
+def test_setup_connection_for_dialect_sqlite(tmpdir):
+    """Test sqlite3 connections get the tuned profile."""
+    test_db_file = tmpdir.mkdir("sqlite").join("test_profile.db")
+    conn = sqlite3.connect(str(test_db_file))
+
+    util.setup_connection_for_dialect("sqlite", conn, True)
+
+    cursor = conn.cursor()
+    assert cursor.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    # NORMAL
+    assert cursor.execute("PRAGMA synchronous").fetchone()[0] == 1
+    assert cursor.execute("PRAGMA cache_size").fetchone()[0] == util.SQLITE_CACHE_SIZE
+    # MEMORY
+    assert cursor.execute("PRAGMA temp_store").fetchone()[0] == 2
+    assert cursor.execute("PRAGMA query_only").fetchone()[0] == 0
+    conn.close()
+
+    conn = sqlite3.connect(str(test_db_file))
+    util.setup_connection_for_dialect("sqlite", conn, False, read_only=True)
+    cursor = conn.cursor()
+    assert cursor.execute("PRAGMA query_only").fetchone()[0] == 1
+    with pytest.raises(sqlite3.OperationalError):
+        cursor.execute("CREATE TABLE hello (id int)")
+    conn.close()
+
+
+def test_setup_connection_for_dialect_mysql():
+    """Test mysql connections get the session timeout."""
+    execute_mock = MagicMock()
+    dbapi_connection = MagicMock(cursor=MagicMock(return_value=execute_mock))
+
+    util.setup_connection_for_dialect("mysql", dbapi_connection, True)
+
+    execute_mock.execute.assert_called_once_with("SET session wait_timeout=28800")
+
+
+def test_run_sqlite_maintenance(hass_recorder):
+    """Test the periodic sqlite3 maintenance."""
+    hass = hass_recorder()
+    engine = hass.data[DATA_INSTANCE].engine
+
+    util.run_sqlite_maintenance(engine)
+
+    engine = MagicMock()
+    engine.dialect.name = "mysql"
+    util.run_sqlite_maintenance(engine)
+    assert engine.connect.call_count == 0
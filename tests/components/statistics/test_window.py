@@ -0,0 +1,71 @@
+"""The test for the statistics sample window."""
+from datetime import datetime, timedelta
+import random
+import statistics
+
+import pytest
+
+from homeassistant.components.statistics.window import StatisticsWindow
+
+
+def _assert_matches(window):
+    """Assert the window statistics match a full recomputation."""
+    values = list(window.values)
+    assert window.total == pytest.approx(sum(values))
+    assert window.mean == pytest.approx(statistics.mean(values))
+    assert window.median == statistics.median(values)
+    assert window.min == min(values)
+    assert window.max == max(values)
+    if len(values) > 1:
+        assert window.variance == pytest.approx(statistics.variance(values))
+        assert window.stdev == pytest.approx(statistics.stdev(values))
+    else:
+        assert window.variance is None
+        assert window.stdev is None
+
+
+def test_sliding_window():
+    """Test statistics stay exact while samples are added and evicted."""
+    rand = random.Random(42)
+    start = datetime(2021, 1, 1)
+    window = StatisticsWindow(20)
+
+    for idx in range(500):
+        window.append(round(rand.uniform(-50, 1000), 1), start + timedelta(idx))
+        _assert_matches(window)
+        if idx % 7 == 0:
+            window.popleft()
+            if window.values:
+                _assert_matches(window)
+
+    assert len(window) == 20
+
+
+def test_empty_window():
+    """Test an emptied window has no statistics."""
+    window = StatisticsWindow(5)
+    window.append(3.0, datetime(2021, 1, 1))
+    window.append(5.0, datetime(2021, 1, 2))
+    window.popleft()
+    window.popleft()
+
+    assert len(window) == 0
+    assert window.mean is None
+    assert window.median is None
+    assert window.total is None
+    assert window.min is None
+    assert window.max is None
+
+    window.append(7.0, datetime(2021, 1, 3))
+    assert window.mean == 7.0
+    assert window.variance is None
+
+
+def test_non_numeric_window():
+    """Test a non-numeric window only keeps the samples."""
+    window = StatisticsWindow(2, numeric=False)
+    for idx, value in enumerate(("on", "off", "on")):
+        window.append(value, datetime(2021, 1, 1 + idx))
+
+    assert list(window.values) == ["off", "on"]
+    assert window.mean is None
@@ -1,4 +1,5 @@
 """The tests for hls streams."""
+import asyncio
 from datetime import timedelta
 import io
 from unittest.mock import patch
@@ -9,7 +10,7 @@ import pytest
 
 from homeassistant.components.stream import create_stream
 from homeassistant.components.stream.const import MAX_SEGMENTS, NUM_PLAYLIST_SEGMENTS
-from homeassistant.components.stream.core import Segment
+from homeassistant.components.stream.core import Part, Segment
 from homeassistant.const import HTTP_NOT_FOUND
 from homeassistant.setup import async_setup_component
 import homeassistant.util.dt as dt_util
@@ -410,3 +411,113 @@ async def test_hls_max_segments_discontinuity(hass, hls_stream, stream_worker_sy
 
     stream_worker_sync.resume()
     stream.stop()
+
+
+async def test_ll_hls_stream(hass, hls_stream, stream_worker_sync):
+    """Test a low latency hls stream produces partial segments."""
+    await async_setup_component(
+        hass, "stream", {"stream": {"ll_hls": True, "part_duration": 0.5}}
+    )
+
+    stream_worker_sync.pause()
+
+    # Setup demo HLS track
+    source = generate_h264_video()
+    stream = create_stream(hass, source)
+
+    # Request stream
+    stream.add_provider("hls")
+    stream.start()
+
+    hls_client = await hls_stream(stream)
+
+    # Fetch playlist
+    playlist_response = await hls_client.get("/playlist.m3u8")
+    assert playlist_response.status == 200
+    playlist = await playlist_response.text()
+    assert "#EXT-X-PART-INF:PART-TARGET=0.500" in playlist
+    assert "#EXT-X-SERVER-CONTROL:CAN-BLOCK-RELOAD=YES" in playlist
+    assert "#EXT-X-PRELOAD-HINT:TYPE=PART" in playlist
+
+    parts = [line for line in playlist.splitlines() if line.startswith("#EXT-X-PART:")]
+    assert len(parts) > 1
+    assert parts[0].endswith(",INDEPENDENT=YES")
+    # Parts are cut at whole frames without running past the part target
+    for part in parts:
+        assert 0 < float(part.split("DURATION=")[1].split(",")[0]) <= 0.5
+
+    # Fetch the first part, a fragment on its own
+    part_url = "/" + parts[0].split('URI="./')[1].split('"')[0]
+    part_response = await hls_client.get(part_url)
+    assert part_response.status == 200
+    assert (await part_response.read())[4:8] == b"moof"
+
+    stream_worker_sync.resume()
+
+    # Stop stream, if it hasn't quit already
+    stream.stop()
+
+
+async def test_ll_hls_playlist_view(hass, hls_stream, stream_worker_sync):
+    """Test rendering parts and blocking reload of the ll hls playlist."""
+    await async_setup_component(
+        hass, "stream", {"stream": {"ll_hls": True, "part_duration": 0.5}}
+    )
+
+    stream = create_stream(hass, STREAM_SOURCE)
+    stream_worker_sync.pause()
+    hls = stream.add_provider("hls")
+
+    part = Part(duration=0.5, has_keyframe=True, data=b"part-0")
+    hls.put(Segment(1, SEQUENCE_BYTES, DURATION, parts=[part]))
+    hls.put_part(2, 0, part)
+    await hass.async_block_till_done()
+
+    hls_client = await hls_stream(stream)
+
+    resp = await hls_client.get("/playlist.m3u8")
+    assert resp.status == 200
+    assert await resp.text() == "\n".join(
+        [
+            "#EXTM3U",
+            "#EXT-X-VERSION:7",
+            "#EXT-X-TARGETDURATION:10",
+            '#EXT-X-MAP:URI="init.mp4"',
+            "#EXT-X-PART-INF:PART-TARGET=0.500",
+            "#EXT-X-SERVER-CONTROL:CAN-BLOCK-RELOAD=YES,PART-HOLD-BACK=1.500",
+            "#EXT-X-MEDIA-SEQUENCE:1",
+            "#EXT-X-DISCONTINUITY-SEQUENCE:0",
+            '#EXT-X-PART:DURATION=0.500,URI="./segment/1.0.m4s",INDEPENDENT=YES',
+            "#EXTINF:10.0000,",
+            "./segment/1.m4s",
+            '#EXT-X-PART:DURATION=0.500,URI="./segment/2.0.m4s",INDEPENDENT=YES',
+            '#EXT-X-PRELOAD-HINT:TYPE=PART,URI="./segment/2.1.m4s"',
+            "",
+        ]
+    )
+
+    # Blocking reload and the preload hinted part wait for the next part
+    playlist_task = hass.async_create_task(
+        hls_client.get("/playlist.m3u8?_HLS_msn=2&_HLS_part=1")
+    )
+    part_task = hass.async_create_task(hls_client.get("/segment/2.1.m4s"))
+    await asyncio.sleep(0.1)
+    assert not playlist_task.done()
+    assert not part_task.done()
+
+    hls.put_part(2, 0, Part(duration=0.5, has_keyframe=False, data=b"part-1"))
+
+    resp = await playlist_task
+    assert resp.status == 200
+    assert '#EXT-X-PRELOAD-HINT:TYPE=PART,URI="./segment/2.2.m4s"' in await resp.text()
+    resp = await part_task
+    assert resp.status == 200
+    assert await resp.read() == b"part-1"
+
+    resp = await hls_client.get("/playlist.m3u8?_HLS_msn=5")
+    assert resp.status == 400
+    resp = await hls_client.get("/segment/1.1.m4s")
+    assert resp.status == 404
+
+    stream_worker_sync.resume()
+    stream.stop()
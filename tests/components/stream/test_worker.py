@@ -20,6 +20,7 @@ import threading
 from unittest.mock import patch
 
 import av
+import pytest
 
 from homeassistant.components.stream import Stream
 from homeassistant.components.stream.const import (
@@ -27,6 +28,7 @@ from homeassistant.components.stream.const import (
     MIN_SEGMENT_DURATION,
     PACKETS_TO_WAIT_FOR_AUDIO,
 )
+from homeassistant.components.stream.core import StreamSettings
 from homeassistant.components.stream.worker import SegmentBuffer, stream_worker
 
 STREAM_SOURCE = "some-stream-source"
@@ -185,7 +187,47 @@ class MockPyAv:
         return self.container
 
 
-async def async_decode_stream(hass, packets, py_av=None):
+class FakeFragmentingBuffer(FakePyAvBuffer):
+    """Write an init section, then a fragment per packet like frag_every_frame."""
+
+    def __init__(self):
+        """Initialize the FakeFragmentingBuffer."""
+        super().__init__()
+        self.memory_file = None
+        self._packet_buffered = False
+
+    def mux(self, packet):
+        """Write the fragment of the previous packet."""
+        super().mux(packet)
+        if not self.memory_file.tell():
+            self.memory_file.write(b"init")
+        elif self._packet_buffered:
+            self.memory_file.write(b"fragment")
+        self._packet_buffered = True
+
+    def close(self):
+        """Write the last fragment, without an mfra box."""
+        if self._packet_buffered:
+            self.memory_file.write(b"fragment")
+        self._packet_buffered = False
+
+
+class MockFragmentingPyAv(MockPyAv):
+    """Mocks out av.open with a muxer writing fragments."""
+
+    def __init__(self):
+        """Initialize the MockFragmentingPyAv."""
+        super().__init__()
+        self.capture_buffer = FakeFragmentingBuffer()
+
+    def open(self, stream_source, *args, **kwargs):
+        """Return a stream or a fragmenting buffer writing to the source."""
+        if isinstance(stream_source, io.BytesIO):
+            self.capture_buffer.memory_file = stream_source
+        return super().open(stream_source, *args, **kwargs)
+
+
+async def async_decode_stream(hass, packets, py_av=None, settings=None):
     """Start a stream worker that decodes incoming stream packets into output segments."""
     stream = Stream(hass, STREAM_SOURCE)
     stream.add_provider(STREAM_OUTPUT_FORMAT)
@@ -198,7 +240,7 @@ async def async_decode_stream(hass, packets, py_av=None):
         "homeassistant.components.stream.core.StreamOutput.put",
         side_effect=py_av.capture_buffer.capture_output_segment,
     ):
-        segment_buffer = SegmentBuffer(stream.outputs)
+        segment_buffer = SegmentBuffer(stream.outputs, settings)
         stream_worker(STREAM_SOURCE, {}, segment_buffer, threading.Event())
         await hass.async_block_till_done()
 
@@ -547,3 +589,33 @@ async def test_update_stream_source(hass):
 
         # Ccleanup
         stream.stop()
+
+
+async def test_ll_hls_parts(hass):
+    """Test parts are cut at whole frames within the part target duration."""
+    part_duration = 0.3
+    py_av = MockFragmentingPyAv()
+    decoded_stream = await async_decode_stream(
+        hass,
+        PacketSequence(TEST_SEQUENCE_LENGTH),
+        py_av=py_av,
+        settings=StreamSettings(ll_hls=True, part_target_duration=part_duration),
+    )
+    segments = decoded_stream.segments
+    assert len(segments) == int((TEST_SEQUENCE_LENGTH - 1) * SEGMENTS_PER_PACKET)
+
+    frames_per_part = math.floor(part_duration / PACKET_DURATION)
+    for segment in segments:
+        assert segment.parts
+        for part in segment.parts:
+            assert part.duration <= part_duration
+            assert part.has_keyframe
+        assert sum(part.duration for part in segment.parts) == pytest.approx(
+            float(segment.duration)
+        )
+        assert segment.parts[0].data == b"fragment" * frames_per_part
+        # Without an mfra box, the last part runs to the end of the segment
+        assert (
+            b"init" + b"".join(part.data for part in segment.parts)
+            == segment.segment.getvalue()
+        )
@@ -0,0 +1,117 @@
+"""Test ZHA device initialization scheduler."""
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+import homeassistant.components.zha.core.init_scheduler as init_scheduler
+
+
+def _device(ieee, order, delay=0, fail=False):
+    """Return a device that records the order in which it is initialized."""
+
+    async def _initialize(from_cache):
+        assert from_cache is False
+        order.append(ieee)
+        await asyncio.sleep(delay)
+        if fail:
+            raise asyncio.TimeoutError
+
+    device = MagicMock(ieee=ieee)
+    device.name = f"device {ieee}"
+    device.async_initialize = _initialize
+    return device
+
+
+async def test_initialize_by_priority():
+    """Test devices are initialized most important first."""
+    order = []
+    scheduler = init_scheduler.InitScheduler()
+    scheduler.concurrency = 1
+
+    await scheduler.async_initialize(
+        [
+            (_device("other", order), init_scheduler.PRIORITY_OTHER),
+            (_device("entity", order), init_scheduler.PRIORITY_ENTITY),
+            (_device("automation", order), init_scheduler.PRIORITY_AUTOMATION),
+        ]
+    )
+
+    assert order == ["automation", "entity", "other"]
+    progress = scheduler.progress
+    assert progress["total"] == 3
+    assert progress["initialized"] == 3
+    assert progress["queued"] == 0
+    assert [dev["status"] for dev in progress["devices"]] == ["initialized"] * 3
+
+
+async def test_concurrency_adapts_to_latency():
+    """Test concurrency grows with a steady latency and backs off."""
+    order = []
+    scheduler = init_scheduler.InitScheduler()
+
+    await scheduler.async_initialize(
+        [
+            (_device(str(idx), order, 0.01), init_scheduler.PRIORITY_OTHER)
+            for idx in range(20)
+        ]
+    )
+
+    assert scheduler.concurrency > init_scheduler.INITIAL_CONCURRENCY
+
+    await scheduler.async_initialize(
+        [
+            (_device(f"slow {idx}", order, 0.2), init_scheduler.PRIORITY_OTHER)
+            for idx in range(4)
+        ]
+    )
+
+    assert scheduler.concurrency < init_scheduler.MAX_CONCURRENCY
+
+
+async def test_failed_device():
+    """Test a failing device is reported and halves the concurrency."""
+    order = []
+    scheduler = init_scheduler.InitScheduler()
+    scheduler.concurrency = 4
+
+    await scheduler.async_initialize(
+        [
+            (_device("failed", order, fail=True), init_scheduler.PRIORITY_ENTITY),
+            (_device("ok", order), init_scheduler.PRIORITY_OTHER),
+        ]
+    )
+
+    assert scheduler.devices["failed"].status == init_scheduler.STATUS_FAILED
+    assert scheduler.devices["ok"].status == init_scheduler.STATUS_INITIALIZED
+    assert scheduler.progress["failed"] == 1
+
+
+async def test_cancel_stops_initializing_devices():
+    """Test cancelling the scheduler cancels the devices being initialized."""
+    cancelled = []
+
+    async def _initialize(from_cache):
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+
+    device = MagicMock(ieee="slow")
+    device.name = "slow device"
+    device.async_initialize = _initialize
+    scheduler = init_scheduler.InitScheduler()
+
+    task = asyncio.create_task(
+        scheduler.async_initialize([(device, init_scheduler.PRIORITY_OTHER)])
+    )
+    await asyncio.sleep(0.01)
+    assert scheduler.progress["initializing"] == 1
+
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    await asyncio.sleep(0)
+
+    assert cancelled == [True]
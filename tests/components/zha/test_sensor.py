@@ -371,3 +371,34 @@ async def test_electrical_measurement_init(
     assert channel.divisor == 10
     assert channel.multiplier == 20
     assert hass.states.get(entity_id).state == "60.0"
+
+
+async def test_attribute_reports_coalesced(
+    hass,
+    zigpy_device_mock,
+    zha_device_joined_restored,
+):
+    """Test attribute reports of one frame cause a single state write."""
+
+    zigpy_device = zigpy_device_mock(
+        {
+            1: {
+                "in_clusters": [measurement.TemperatureMeasurement.cluster_id],
+                "out_clusters": [],
+                "device_type": zigpy.profiles.zha.DeviceType.ON_OFF_SWITCH,
+            }
+        }
+    )
+    cluster = zigpy_device.endpoints[1].temperature
+    zha_device = await zha_device_joined_restored(zigpy_device)
+    entity_id = await find_entity_id(DOMAIN, zha_device, hass)
+    await async_enable_traffic(hass, [zha_device])
+
+    with mock.patch.object(
+        hass.states, "async_set", wraps=hass.states.async_set
+    ) as async_set:
+        await send_attributes_report(hass, cluster, {1: 1, 0: 2900, 2: 100})
+
+    assert_state(hass, entity_id, "29.0", TEMP_CELSIUS)
+    assert async_set.call_count == 1
+    assert zha_device.state_writes_coalesced == 2
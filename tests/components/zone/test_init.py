@@ -1,4 +1,5 @@
 """Test zone component."""
+import random
 from unittest.mock import patch
 
 import pytest
@@ -16,6 +17,7 @@ from homeassistant.const import (
 from homeassistant.core import Context
 from homeassistant.exceptions import Unauthorized
 from homeassistant.helpers import entity_registry
+from homeassistant.util.location import distance
 
 from tests.common import MockConfigEntry
 
@@ -503,3 +505,85 @@ async def test_unavailable_zone(hass):
     assert zone.async_active_zone(hass, 0.0, 0.01) is None
 
     assert zone.in_zone(hass.states.get("zone.bla"), 0, 0) is False
+
+
+async def test_active_zone_index(hass):
+    """Test zones found through the index match comparing every zone."""
+    assert await setup.async_setup_component(hass, DOMAIN, {"zone": {}})
+    rand = random.Random(42)
+
+    for idx in range(200):
+        hass.states.async_set(
+            f"zone.zone_{idx}",
+            "zoning",
+            {
+                "latitude": 52 + rand.uniform(-0.5, 0.5),
+                "longitude": 5 + rand.uniform(-0.5, 0.5),
+                "radius": rand.choice((50, 500, 5000, 50000)),
+            },
+        )
+
+    locations = [
+        (
+            52 + rand.uniform(-0.6, 0.6),
+            5 + rand.uniform(-0.6, 0.6),
+            rand.choice((0, 80)),
+        )
+        for _ in range(500)
+    ]
+
+    expected = []
+    for latitude, longitude, radius in locations:
+        zones = [
+            state
+            for state in (
+                hass.states.get(entity_id)
+                for entity_id in sorted(hass.states.async_entity_ids(DOMAIN))
+            )
+            if zone.in_zone(state, latitude, longitude, radius)
+        ]
+        if zones:
+            closest = min(
+                zones,
+                key=lambda state: (
+                    distance(
+                        latitude,
+                        longitude,
+                        state.attributes["latitude"],
+                        state.attributes["longitude"],
+                    ),
+                    state.attributes["radius"],
+                ),
+            )
+            expected.append(closest.entity_id)
+        else:
+            expected.append(None)
+
+    await hass.async_block_till_done()
+    assert [
+        None if state is None else state.entity_id
+        for state in (zone.async_active_zone(hass, *loc) for loc in locations)
+    ] == expected
+
+
+async def test_active_zone_index_updated(hass):
+    """Test zone changes are seen by lookups once processed."""
+    assert await setup.async_setup_component(hass, DOMAIN, {"zone": {}})
+    assert zone.async_active_zone(hass, 10, 10) is None
+
+    hass.states.async_set(
+        "zone.new", "zoning", {"latitude": 10, "longitude": 10, "radius": 100}
+    )
+    await hass.async_block_till_done()
+    assert zone.async_active_zone(hass, 10, 10).entity_id == "zone.new"
+
+    hass.states.async_set(
+        "zone.new", "zoning", {"latitude": 20, "longitude": 20, "radius": 100}
+    )
+    await hass.async_block_till_done()
+    assert zone.async_active_zone(hass, 10, 10) is None
+    assert zone.async_active_zone(hass, 20, 20).entity_id == "zone.new"
+
+    hass.states.async_remove("zone.new")
+    await hass.async_block_till_done()
+    assert zone.async_active_zone(hass, 20, 20) is None
@@ -212,13 +212,13 @@ def mock_device_tracker_conf():
     """Prevent device tracker from reading/writing data."""
     devices = []
 
-    async def mock_update_config(path, id, entity):
+    async def mock_store_device(entity):
         devices.append(entity)
 
     with patch(
         "homeassistant.components.device_tracker.legacy"
-        ".DeviceTracker.async_update_config",
-        side_effect=mock_update_config,
+        ".DeviceTracker.async_store_device",
+        side_effect=mock_store_device,
     ), patch(
         "homeassistant.components.device_tracker.legacy.async_load_config",
         side_effect=lambda *args: devices,
@@ -135,7 +135,7 @@ async def test_update_state_adds_entities_with_update_before_add_false(hass):
     assert not ent.update.called
 
 
-@patch("homeassistant.helpers.entity_platform.async_track_time_interval")
+@patch("homeassistant.helpers.poll_scheduler.PollScheduler.async_add_platform")
 async def test_set_scan_interval_via_platform(mock_track, hass):
     """Test the setting of the scan interval via platform."""
 
@@ -154,7 +154,7 @@ async def test_set_scan_interval_via_platform(mock_track, hass):
 
     await hass.async_block_till_done()
     assert mock_track.called
-    assert timedelta(seconds=30) == mock_track.call_args[0][2]
+    assert timedelta(seconds=30) == mock_track.call_args[0][0].scan_interval
 
 
 async def test_adding_entities_with_generator_and_thread_callback(hass):
@@ -931,6 +931,62 @@ async def test_platforms_sharing_services(hass):
     assert entity2 in entities
 
 
+async def test_batch_service_handler(hass):
+    """Test services are called through the batch handler of a platform."""
+    entities = [MockEntity(entity_id=f"{DOMAIN}.batch_{idx}") for idx in range(3)]
+    other = MockEntity(entity_id=f"{DOMAIN}.other")
+
+    async def handle_batch(batch, call):
+        batches.append(([entity.entity_id for entity in batch], call.data["some"]))
+        return batch[2:]
+
+    async def async_setup_platform(hass, config, async_add_entities, discovery_info):
+        """Set up a platform that can call services in batches."""
+        async_add_entities(entities)
+        platform = entity_platform.current_platform.get()
+        platform.async_register_batch_service_handler("hello", handle_batch)
+
+    mock_entity_platform(
+        hass, f"{DOMAIN}.batch", MockPlatform(async_setup_platform=async_setup_platform)
+    )
+    component = EntityComponent(_LOGGER, DOMAIN, hass)
+    await component.async_setup({DOMAIN: {"platform": "batch"}})
+    await hass.async_block_till_done()
+    await component.async_add_entities([other])
+
+    calls = []
+    batches = []
+
+    for entity in (*entities, other):
+        entity.async_called_by_service = Mock(
+            side_effect=lambda entity_id=entity.entity_id, **kwargs: calls.append(
+                entity_id
+            )
+        )
+
+    component.async_register_entity_service(
+        "hello", {"some": str}, "async_called_by_service"
+    )
+
+    await hass.services.async_call(
+        DOMAIN, "hello", {"entity_id": "all", "some": "data"}, blocking=True
+    )
+
+    assert len(batches) == 1
+    assert sorted(batches[0][0]) == [entity.entity_id for entity in entities]
+    assert batches[0][1] == "data"
+    assert sorted(calls) == sorted([batches[0][0][2], other.entity_id])
+
+    # A single entity is called directly
+    batches.clear()
+    calls.clear()
+    await hass.services.async_call(
+        DOMAIN, "hello", {"entity_id": entities[0].entity_id}, blocking=True
+    )
+    assert not batches
+    assert calls == [entities[0].entity_id]
+
+
 async def test_invalid_entity_id(hass):
     """Test specifying an invalid entity id."""
     platform = MockEntityPlatform(hass)
@@ -1,4 +1,7 @@
 """The tests for the EntityFilter component."""
+from unittest.mock import patch
+
+from homeassistant.helpers import entityfilter
 from homeassistant.helpers.entityfilter import (
     FILTER_SCHEMA,
     INCLUDE_EXCLUDE_FILTER_SCHEMA,
@@ -248,3 +251,30 @@ def test_filter_schema_include_exclude():
     }
     filt = INCLUDE_EXCLUDE_FILTER_SCHEMA(conf)
     assert filt.config == conf
+
+
+def test_filter_caches_decisions():
+    """Test decisions are cached and the cache is bounded."""
+    testfilter = generate_filter(
+        ["light"], [], [], ["light.excluded"], ["sensor.*_temp", "switch.*_?"]
+    )
+    assert testfilter.hit_rate is None
+
+    assert testfilter("light.kitchen")
+    assert testfilter("sensor.outside_temp")
+    assert testfilter("switch.fan_1")
+    assert not testfilter("switch.fan_10")
+    assert not testfilter("light.excluded")
+    assert testfilter.misses == 5
+    assert testfilter.hits == 0
+
+    assert testfilter("light.kitchen")
+    assert not testfilter("switch.fan_10")
+    assert testfilter.hits == 2
+    assert testfilter.hit_rate == 2 / 7
+
+    with patch.object(entityfilter, "MAX_CACHED_DECISIONS", 5):
+        assert testfilter("sensor.inside_temp")
+    assert len(testfilter._decisions) == 5
+    assert "light.kitchen" not in testfilter._decisions
+    assert testfilter("light.kitchen")
@@ -0,0 +1,97 @@
+"""Tests for the poll scheduler helper."""
+import asyncio
+from datetime import timedelta
+import logging
+
+from homeassistant.helpers import poll_scheduler
+from homeassistant.helpers.entity_component import EntityComponent
+import homeassistant.util.dt as dt_util
+
+from tests.common import MockEntity, async_fire_time_changed
+
+_LOGGER = logging.getLogger(__name__)
+DOMAIN = "test_domain"
+
+
+async def test_polls_spread_over_interval(hass):
+    """Test entities sharing an interval are polled at different times."""
+    component = EntityComponent(_LOGGER, DOMAIN, hass, timedelta(seconds=20))
+    updates = []
+
+    def _entity(name):
+        entity = MockEntity(name=name, should_poll=True)
+        entity.update = lambda: updates.append(name)
+        return entity
+
+    await component.async_add_entities([_entity(str(idx)) for idx in range(4)])
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=15))
+    await hass.async_block_till_done()
+    assert updates == []
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=17.5))
+    await hass.async_block_till_done()
+    assert 0 < len(updates) < 4
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=20))
+    await hass.async_block_till_done()
+    assert sorted(set(updates)) == ["0", "1", "2", "3"]
+
+    stats = component._platforms[DOMAIN].poll_stats
+    assert stats.updates == len(updates)
+    assert stats.overruns == 0
+    assert stats.average_latency is not None
+
+
+async def test_skip_entity_still_updating(hass, caplog):
+    """Test an entity is skipped while its previous update runs."""
+    component = EntityComponent(_LOGGER, DOMAIN, hass, timedelta(seconds=20))
+    block = asyncio.Event()
+    updates = []
+
+    async def _slow_update():
+        updates.append("slow")
+        await block.wait()
+
+    async def _fast_update():
+        updates.append("fast")
+
+    slow = MockEntity(name="slow", should_poll=True)
+    slow.async_update = _slow_update
+    fast = MockEntity(name="fast", should_poll=True)
+    fast.async_update = _fast_update
+
+    await component.async_add_entities([slow, fast])
+    updates.clear()
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=20))
+    # Let the fast entity finish its update
+    for _ in range(10):
+        await asyncio.sleep(0)
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=40))
+    await asyncio.sleep(0)
+    block.set()
+    await hass.async_block_till_done()
+
+    assert updates.count("slow") == 1
+    assert updates.count("fast") == 2
+    assert component._platforms[DOMAIN].poll_stats.overruns == 1
+    assert "Updating test_domain.slow took longer" in caplog.text
+    assert "Updating test_domain.fast took longer" not in caplog.text
+
+
+async def test_stop_polling_removed_entity(hass):
+    """Test removed entities are no longer polled."""
+    component = EntityComponent(_LOGGER, DOMAIN, hass, timedelta(seconds=20))
+    entity = MockEntity(name="poll", should_poll=True)
+    entity.update = lambda: updates.append(None)
+    updates = []
+
+    await component.async_add_entities([entity])
+    await component._platforms[DOMAIN].async_remove_entity(entity.entity_id)
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=20))
+    await hass.async_block_till_done()
+
+    assert updates == []
+    assert not poll_scheduler.async_get_poll_scheduler(hass)._due
@@ -0,0 +1,76 @@
+"""Tests for the report queue helper."""
+from datetime import timedelta
+import logging
+
+from homeassistant.helpers import report_queue
+from homeassistant.util.dt import utcnow
+
+from tests.common import async_fire_time_changed
+
+_LOGGER = logging.getLogger(__name__)
+
+
+async def _async_window_passed(hass):
+    """Let the report window pass."""
+    async_fire_time_changed(hass, utcnow() + timedelta(seconds=1))
+    await hass.async_block_till_done()
+
+
+async def test_report_queue(hass):
+    """Test changes within the window are reported together."""
+    reports = []
+
+    async def report(pending):
+        reports.append(pending)
+
+    queue = report_queue.ReportQueue(hass, _LOGGER, window=1, function=report)
+    queue.async_queue("light.one", "on")
+    queue.async_queue("light.two", "on")
+    queue.async_queue("light.one", "off")
+    assert reports == []
+
+    await _async_window_passed(hass)
+    assert reports == [{"light.one": "off", "light.two": "on"}]
+    assert queue.pending == {}
+    assert queue.reports == 1
+    assert queue.last_latency is not None
+    assert queue.max_latency >= queue.last_latency
+
+    await _async_window_passed(hass)
+    assert len(reports) == 1
+
+
+async def test_report_queue_queued_while_reporting(hass):
+    """Test changes queued while a report is sent are reported next."""
+    reports = []
+
+    async def report(pending):
+        reports.append(pending)
+        if len(reports) == 1:
+            queue.async_queue("light.one", "off")
+
+    queue = report_queue.ReportQueue(hass, _LOGGER, window=1, function=report)
+    queue.async_queue("light.one", "on")
+    await _async_window_passed(hass)
+    assert reports == [{"light.one": "on"}]
+    assert queue.pending == {"light.one": "off"}
+
+    await _async_window_passed(hass)
+    assert reports == [{"light.one": "on"}, {"light.one": "off"}]
+    assert queue.pending == {}
+
+
+async def test_report_queue_cancel(hass):
+    """Test cancelling drops the queued changes."""
+    reports = []
+
+    async def report(pending):
+        reports.append(pending)
+
+    queue = report_queue.ReportQueue(hass, _LOGGER, window=1, function=report)
+    queue.async_queue("light.one", "on")
+    queue.async_cancel()
+    assert queue.pending == {}
+
+    await _async_window_passed(hass)
+    assert reports == []
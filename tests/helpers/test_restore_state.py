@@ -1,5 +1,5 @@
 """The tests for the Restore component."""
-from datetime import datetime
+from datetime import datetime, timedelta
 from unittest.mock import patch
 
 from homeassistant.const import EVENT_HOMEASSISTANT_START
@@ -118,6 +118,7 @@ async def test_dump_data(hass):
     await entity.async_internal_added_to_hass()
 
     data = await RestoreStateData.async_get_instance(hass)
+    await hass.async_block_till_done()
     now = dt_util.utcnow()
     data.last_states = {
         "input_boolean.b0": StoredState(State("input_boolean.b0", "off"), now),
@@ -172,6 +173,43 @@ async def test_dump_data(hass):
     assert written_states[1]["state"]["state"] == "off"
 
 
+async def test_dump_changed_states(hass):
+    """Test that only changed states are converted again."""
+    for entity_id in ("input_boolean.b0", "input_boolean.b1"):
+        entity = RestoreEntity()
+        entity.hass = hass
+        entity.entity_id = entity_id
+        await entity.async_internal_added_to_hass()
+        hass.states.async_set(entity_id, "on")
+
+    data = await RestoreStateData.async_get_instance(hass)
+    await hass.async_block_till_done()
+
+    with patch(
+        "homeassistant.helpers.restore_state.Store.async_save"
+    ) as mock_write_data:
+        await data.async_dump_states()
+        hass.states.async_set("input_boolean.b1", "off")
+        await data.async_dump_states()
+
+    first, second = (call[1][0] for call in mock_write_data.mock_calls)
+    assert second[0] is first[0]
+    assert second[1] is not first[1]
+    assert second[1]["state"]["state"] == "off"
+
+    # Unchanged states are converted again to refresh their last seen time
+    with patch(
+        "homeassistant.helpers.restore_state.Store.async_save"
+    ) as mock_write_data, patch(
+        "homeassistant.helpers.restore_state.STATE_LAST_SEEN_REFRESH", timedelta(0)
+    ):
+        await data.async_dump_states()
+
+    third = mock_write_data.mock_calls[0][1][0]
+    assert third[0] is not second[0]
+    assert third[0]["last_seen"] > second[0]["last_seen"]
+
+
 async def test_dump_error(hass):
     """Test that we cache data."""
     states = [
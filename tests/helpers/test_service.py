@@ -375,6 +375,33 @@ async def test_extract_entity_ids_from_area(hass, area_mock):
     )
 
 
+async def test_extract_entity_ids_from_area_registry_updated(hass, area_mock):
+    """Test areas are expanded again after the registries are updated."""
+    call = ha.ServiceCall("light", "turn_on", {"area_id": "own-area"})
+    assert {"light.in_own_area"} == await service.async_extract_entity_ids(hass, call)
+
+    device_registry = await dev_reg.async_get_registry(hass)
+    device_registry.async_update_device("device-no-area-id", area_id="own-area")
+    await hass.async_block_till_done()
+
+    assert {
+        "light.in_own_area",
+        "light.no_area",
+    } == await service.async_extract_entity_ids(hass, call)
+
+    entity_registry = await ent_reg.async_get_registry(hass)
+    entity_registry.async_update_entity("light.no_area", area_id="diff-area")
+    await hass.async_block_till_done()
+
+    assert {"light.in_own_area"} == await service.async_extract_entity_ids(hass, call)
+    assert {
+        "light.diff_area",
+        "light.no_area",
+    } == await service.async_extract_entity_ids(
+        hass, ha.ServiceCall("light", "turn_on", {"area_id": "diff-area"})
+    )
+
+
 async def test_async_get_all_descriptions(hass):
     """Test async_get_all_descriptions."""
     group = hass.components.group
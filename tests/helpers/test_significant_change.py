@@ -72,3 +72,26 @@ async def test_significant_change_extra(hass, checker):
         State(ent_id, "200", attrs), extra_arg=1
     )
     assert checker.async_is_significant_change(State(ent_id, "200", attrs), extra_arg=2)
+
+
+async def test_check_significant_changes(hass, checker):
+    """Test checking a batch of changes."""
+    ent_id = "test_domain.test_entity"
+    other_id = "test_domain.other_entity"
+
+    assert (
+        checker.async_check_significant_changes(
+            [
+                (State(ent_id, "100"), None),
+                (State(other_id, "50"), None),
+                (State(ent_id, "97"), None),
+                (State(ent_id, "95"), None),
+                (State(other_id, STATE_UNAVAILABLE), None),
+                (State(ent_id, "93"), None),
+            ]
+        )
+        == [True, True, False, True, True, False]
+    )
+
+    assert checker.last_approved_entities[ent_id][0].state == "95"
+    assert checker.last_approved_entities[other_id][0].state == STATE_UNAVAILABLE
@@ -2,6 +2,8 @@
 import asyncio
 from datetime import timedelta
 import json
+from operator import itemgetter
+import os
 from unittest.mock import Mock, patch
 
 import pytest
@@ -11,6 +13,7 @@ from homeassistant.const import (
     EVENT_HOMEASSISTANT_STOP,
 )
 from homeassistant.core import CoreState
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import storage
 from homeassistant.util import dt
 
@@ -279,3 +282,156 @@ async def test_migrator_transforming_config(hass, store, hass_storage):
         "version": MOCK_VERSION,
         "data": data,
     }
+
+
+def _journal_data(items, other=1):
+    """Return store data for the journal tests."""
+    return {
+        "version": MOCK_VERSION,
+        "key": MOCK_KEY,
+        "data": {"items": items, "other": other},
+    }
+
+
+async def test_journal(hass, tmp_path):
+    """Test only changed records are written to the journal and replayed."""
+    hass.config.config_dir = str(tmp_path)
+    (tmp_path / storage.STORAGE_DIR).mkdir()
+    store = storage.Store(
+        hass, MOCK_VERSION, MOCK_KEY, journal_record_id=itemgetter("id")
+    )
+    items = [{"id": "a", "value": 1}, {"id": "b", "value": 1}]
+
+    await hass.async_add_executor_job(
+        store._write_journaled_data, store.path, _journal_data(items)
+    )
+    assert not os.path.exists(store.journal_path)
+    snapshot_size = store.bytes_written
+    assert snapshot_size == os.path.getsize(store.path)
+
+    items = [{"id": "b", "value": 2}, {"id": "c", "value": 1}]
+    await hass.async_add_executor_job(
+        store._write_journaled_data, store.path, _journal_data(items)
+    )
+    with open(store.journal_path) as fdesc:
+        journal = fdesc.read().splitlines()
+    assert journal[0] == '{"generation": 1}'
+    assert sorted(journal[1:]) == [
+        '["del","items","a"]',
+        '["set","items","b",{"id":"b","value":2}]',
+        '["set","items","c",{"id":"c","value":1}]',
+    ]
+    assert store.bytes_written - snapshot_size == os.path.getsize(store.journal_path)
+
+    # Unchanged data is not written at all
+    await hass.async_add_executor_job(
+        store._write_journaled_data, store.path, _journal_data(items)
+    )
+    assert len(journal) == 4
+
+    # An incomplete entry from a crash is ignored
+    with open(store.journal_path, "a") as fdesc:
+        fdesc.write('["set","items","d",{"id"')
+
+    new_store = storage.Store(
+        hass, MOCK_VERSION, MOCK_KEY, journal_record_id=itemgetter("id")
+    )
+    data = await hass.async_add_executor_job(new_store._load_data)
+    assert data["data"] == {"items": items, "other": 1}
+
+
+async def test_journal_compaction(hass, tmp_path):
+    """Test the journal is compacted into the data file."""
+    hass.config.config_dir = str(tmp_path)
+    (tmp_path / storage.STORAGE_DIR).mkdir()
+    store = storage.Store(
+        hass, MOCK_VERSION, MOCK_KEY, journal_record_id=itemgetter("id")
+    )
+
+    await hass.async_add_executor_job(
+        store._write_journaled_data, store.path, _journal_data([{"id": "a"}])
+    )
+    await hass.async_add_executor_job(
+        store._write_journaled_data, store.path, _journal_data([{"id": "b"}])
+    )
+    assert os.path.exists(store.journal_path)
+
+    # Changes outside of the records are written to the data file
+    await hass.async_add_executor_job(
+        store._write_journaled_data, store.path, _journal_data([{"id": "b"}], 2)
+    )
+    assert not os.path.exists(store.journal_path)
+    with open(store.path) as fdesc:
+        assert json.load(fdesc)["journal"] == 2
+
+    # The journal is compacted once it is larger than the data file
+    value = 0
+    with patch("homeassistant.helpers.storage.JOURNAL_COMPACT_MIN_SIZE", 0):
+        while value == 0 or os.path.exists(store.journal_path):
+            value += 1
+            await hass.async_add_executor_job(
+                store._write_journaled_data,
+                store.path,
+                _journal_data([{"id": "b", "value": value}], 2),
+            )
+    assert 2 < value < 10
+
+    # A journal that was already compacted into the data file is ignored
+    with open(store.journal_path, "w") as fdesc:
+        fdesc.write('{"generation": 2}\n["del","items","b"]\n')
+
+    new_store = storage.Store(
+        hass, MOCK_VERSION, MOCK_KEY, journal_record_id=itemgetter("id")
+    )
+    data = await hass.async_add_executor_job(new_store._load_data)
+    assert data["data"] == {"items": [{"id": "b", "value": value}], "other": 2}
+
+
+async def test_storage_formats(hass, tmp_path):
+    """Test migrating between storage formats and falling back."""
+    hass.config.config_dir = str(tmp_path)
+    (tmp_path / storage.STORAGE_DIR).mkdir()
+    data = {"version": MOCK_VERSION, "key": MOCK_KEY, "data": MOCK_DATA}
+
+    store = storage.Store(hass, MOCK_VERSION, MOCK_KEY)
+    await hass.async_add_executor_job(store._write_file, store.path, data)
+    with open(store.path) as fdesc:
+        assert "\n    " in fdesc.read()
+
+    # The JSON file is migrated on the first write
+    store = storage.Store(
+        hass, MOCK_VERSION, MOCK_KEY, storage_format=storage.STORAGE_FORMAT_MARSHAL
+    )
+    assert await hass.async_add_executor_job(store._load_data) == data
+    await hass.async_add_executor_job(store._write_file, store.path, data)
+    assert not os.path.exists(store.path)
+    assert os.path.exists(store.path + ".marshal")
+    assert await hass.async_add_executor_job(store._load_data) == data
+
+    # Compact JSON files share the path with indented JSON
+    store = storage.Store(
+        hass,
+        MOCK_VERSION,
+        MOCK_KEY,
+        storage_format=storage.STORAGE_FORMAT_COMPACT_JSON,
+    )
+    assert await hass.async_add_executor_job(store._load_data) == data
+    await hass.async_add_executor_job(store._write_file, store.path, data)
+    assert not os.path.exists(store.path + ".marshal")
+    with open(store.path) as fdesc:
+        assert (
+            fdesc.read()
+            == '{"version":1,"key":"storage-test","data":{"hello":"world"}}'
+        )
+
+    # Files of other formats are used if the file can't be read
+    with open(store.path + ".marshal", "wb") as fdesc:
+        fdesc.write(b"\xff")
+    store = storage.Store(
+        hass, MOCK_VERSION, MOCK_KEY, storage_format=storage.STORAGE_FORMAT_MARSHAL
+    )
+    assert await hass.async_add_executor_job(store._load_data) == data
+
+    os.unlink(store.path)
+    with pytest.raises(HomeAssistantError):
+        await hass.async_add_executor_job(store._load_data)
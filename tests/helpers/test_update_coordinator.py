@@ -310,3 +310,107 @@ async def test_stop_refresh_on_ha_stop(hass, crd):
     async_fire_time_changed(hass, utcnow() + update_interval)
     await hass.async_block_till_done()
     assert crd.data == 1
+
+
+def get_shared_crds(hass, count, cache_ttl=None):
+    """Make coordinators sharing the requests of one update method."""
+    calls = 0
+    release = asyncio.Event()
+    release.set()
+
+    async def refresh() -> int:
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return calls
+
+    crds = [
+        update_coordinator.DataUpdateCoordinator[int](
+            hass,
+            _LOGGER,
+            name=f"test {idx}",
+            update_method=refresh,
+            request_key="account",
+            cache_ttl=cache_ttl,
+        )
+        for idx in range(count)
+    ]
+    return crds, release
+
+
+async def test_shared_request_coalesced(hass):
+    """Test concurrent refreshes of a request key share a single request."""
+    crds, release = get_shared_crds(hass, 3)
+    release.clear()
+
+    refreshes = [hass.async_create_task(crd.async_refresh()) for crd in crds]
+    await asyncio.sleep(0)
+    release.set()
+    await asyncio.gather(*refreshes)
+
+    assert [crd.data for crd in crds] == [1, 1, 1]
+    stats = update_coordinator.async_get_shared_requests(hass).stats["account"]
+    assert stats.requests == 1
+    assert stats.coalesced == 2
+    assert stats.saved == 2
+
+    await crds[0].async_refresh()
+    assert crds[0].data == 2
+    # Responses are only kept for a cache TTL
+    assert not update_coordinator.async_get_shared_requests(hass)._responses
+
+
+async def test_shared_request_cached(hass):
+    """Test responses are reused while younger than the cache TTL."""
+    crds, _ = get_shared_crds(hass, 2, cache_ttl=timedelta(seconds=30))
+
+    await crds[0].async_refresh()
+    await crds[1].async_refresh()
+    assert crds[1].data == 1
+
+    with patch.object(hass.loop, "time", return_value=hass.loop.time() + 31):
+        await crds[1].async_refresh()
+    assert crds[1].data == 2
+
+    shared = update_coordinator.async_get_shared_requests(hass)
+    assert shared.stats["account"].requests == 2
+    assert shared.stats["account"].cached == 1
+
+    crds[0].update_method = AsyncMock(side_effect=update_coordinator.UpdateFailed)
+    with patch.object(hass.loop, "time", return_value=hass.loop.time() + 62):
+        await crds[0].async_refresh()
+    assert not crds[0].last_update_success
+    # The expired response is evicted even though the request failed
+    assert "account" not in shared._responses
+
+
+async def test_shared_request_backoff(hass, caplog):
+    """Test requests are skipped for a growing time after failures."""
+    shared = update_coordinator.async_get_shared_requests(hass)
+    crds, _ = get_shared_crds(hass, 1)
+    crd = crds[0]
+    now = hass.loop.time()
+    crd.update_method = AsyncMock(side_effect=update_coordinator.UpdateFailed)
+
+    with patch.object(hass.loop, "time", return_value=now):
+        await crd.async_refresh()
+        await crd.async_refresh()
+    assert crd.update_method.call_count == 1
+    assert shared.stats["account"].backoff == 1
+
+    backoff = update_coordinator.SHARED_REQUEST_BACKOFF_MIN
+    with patch.object(hass.loop, "time", return_value=now + backoff):
+        await crd.async_refresh()
+        await crd.async_refresh()
+    assert crd.update_method.call_count == 2
+
+    with patch.object(hass.loop, "time", return_value=now + 2 * backoff):
+        await crd.async_refresh()
+    assert crd.update_method.call_count == 2
+    assert shared.stats["account"].backoff == 3
+
+    crd.update_method = AsyncMock(return_value=5)
+    with patch.object(hass.loop, "time", return_value=now + 3 * backoff):
+        await crd.async_refresh()
+    assert crd.data == 5
+    assert crd.last_update_success
@@ -2,6 +2,7 @@
 # pylint: disable=protected-access
 from collections import OrderedDict
 import copy
+import json
 import os
 from unittest import mock
 from unittest.mock import AsyncMock, Mock, patch
@@ -612,6 +613,82 @@ async def test_async_hass_config_yaml_merge(merge_log_err, hass):
     assert len(conf["light"]) == 1
 
 
+def test_load_yaml_config_snapshot(tmp_path, monkeypatch):
+    """Test an unchanged configuration is loaded from its snapshot."""
+    config_path = str(tmp_path / config_util.YAML_CONFIG_FILE)
+    (tmp_path / "sensors").mkdir()
+    (tmp_path / "sensors" / "one.yaml").write_text("- platform: one\n")
+    (tmp_path / SECRET_YAML).write_text("password: hunter2\n")
+    with open(config_path, "w") as fp:
+        fp.write(
+            "sensor: !include_dir_merge_list sensors\n"
+            "http:\n  api_password: !secret password\n"
+            "  server_host: !env_var SERVER_HOST 0.0.0.0\n"
+        )
+    snapshot = None
+
+    def load():
+        nonlocal snapshot
+        with patch(
+            "homeassistant.config.load_yaml_config_file",
+            wraps=config_util.load_yaml_config_file,
+        ) as mock_load:
+            config, new_snapshot = config_util.load_yaml_config_file_snapshot(
+                config_path, snapshot
+            )
+        if new_snapshot is not None:
+            snapshot = json.loads(json.dumps(new_snapshot))
+        return config, mock_load.called
+
+    config, parsed = load()
+    assert parsed
+    assert snapshot is not None
+    assert config["sensor"] == [{"platform": "one"}]
+
+    config, parsed = load()
+    assert not parsed
+    assert config["http"] == {"api_password": "hunter2", "server_host": "0.0.0.0"}
+    assert config["sensor"].__config_file__ == config_path
+    assert config["sensor"].__line__ == 0
+
+    (tmp_path / "sensors" / "two.yaml").write_text("- platform: two\n")
+    config, parsed = load()
+    assert parsed
+    assert config["sensor"] == [{"platform": "one"}, {"platform": "two"}]
+    assert not load()[1]
+
+    monkeypatch.setenv("SERVER_HOST", "127.0.0.1")
+    config, parsed = load()
+    assert parsed
+    config, parsed = load()
+    assert not parsed
+    assert config["http"]["server_host"] == "127.0.0.1"
+
+    # Secrets and environment variables are not stored in the snapshot
+    assert "hunter2" not in json.dumps(snapshot)
+    assert "127.0.0.1" not in json.dumps(snapshot)
+
+    with open(config_path, "a") as fp:
+        fp.write("frontend:\n")
+    config, parsed = load()
+    assert parsed
+    assert config["frontend"] == {}
+
+
+async def test_async_hass_config_yaml_snapshot(hass, hass_storage, tmp_path):
+    """Test the configuration snapshot is stored."""
+    hass.config.config_dir = str(tmp_path)
+    (tmp_path / config_util.YAML_CONFIG_FILE).write_text("frontend:\n")
+
+    assert await config_util.async_hass_config_yaml(hass) == {"frontend": {}}
+    snapshot = hass_storage[config_util.CONFIG_SNAPSHOT_STORAGE_KEY]
+    assert snapshot["version"] == config_util.CONFIG_SNAPSHOT_VERSION
+
+    with patch("homeassistant.config.load_yaml_config_file") as mock_load:
+        assert await config_util.async_hass_config_yaml(hass) == {"frontend": {}}
+    assert not mock_load.called
+
+
 # pylint: disable=redefined-outer-name
 @pytest.fixture
 def merge_log_err(hass):
@@ -0,0 +1,33 @@
+"""Test Home Assistant file utility functions."""
+import os
+from unittest.mock import patch
+
+import pytest
+
+from homeassistant.util.file import WriteError, write_file_atomic
+
+
+def test_write_file_atomic(tmp_path):
+    """Test writing text and bytes."""
+    path = str(tmp_path / "test.txt")
+
+    write_file_atomic(path, "héllo")
+    with open(path, encoding="utf-8") as fdesc:
+        assert fdesc.read() == "héllo"
+    assert os.stat(path).st_mode & 0o777 == 0o644
+
+    write_file_atomic(path, b"\x00\x01", private=True)
+    with open(path, "rb") as fdesc:
+        assert fdesc.read() == b"\x00\x01"
+    assert os.stat(path).st_mode & 0o77 == 0
+
+
+def test_write_file_atomic_error(tmp_path):
+    """Test the temporary file is removed if the file can't be replaced."""
+    path = str(tmp_path / "test.txt")
+
+    with patch("homeassistant.util.file.os.replace", side_effect=OSError):
+        with pytest.raises(WriteError):
+            write_file_atomic(path, "hello")
+
+    assert os.listdir(tmp_path) == []